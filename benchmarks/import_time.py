@@ -0,0 +1,86 @@
+"""
+Import time benchmark of turfpy submodules with a regression budget per submodule.
+
+Every submodule is imported in a fresh interpreter, the best of ``--repeat`` runs is
+compared with its budget and the modules it must not pull in at import time are
+checked. The script exits with a non zero status when a budget is exceeded.
+
+Run with ``python benchmarks/import_time.py [--repeat 5] [--scale 1.0]``.
+"""
+
+import argparse
+import subprocess
+import sys
+
+# budget in milliseconds and heavy dependencies which have to be loaded lazily
+BUDGETS = {
+    "turfpy._compact": (20, ["pygeos", "geopandas", "rtree"]),
+    "turfpy.helper": (50, ["numpy", "shapely", "scipy"]),
+    "turfpy.meta": (50, ["numpy", "shapely", "scipy"]),
+    "turfpy.measurement": (80, ["numpy", "shapely", "scipy", "multiprocessing.managers"]),
+    "turfpy.random": (250, ["shapely", "scipy"]),
+    "turfpy.feature_conversion": (50, ["numpy", "shapely", "scipy"]),
+    "turfpy.transformation": (400, ["scipy", "geopandas", "multiprocessing.managers"]),
+    "turfpy.misc": (400, ["scipy", "geopandas", "multiprocessing.managers"]),
+    "turfpy.boolean": (400, ["scipy", "geopandas", "multiprocessing.managers"]),
+    "turfpy.io": (50, ["numpy", "shapely", "scipy"]),
+    "turfpy.pipeline": (50, ["numpy", "shapely", "scipy", "concurrent.futures"]),
+    "turfpy.store": (250, ["shapely", "scipy"]),
+    "turfpy.instrumentation": (50, ["numpy", "shapely", "scipy"]),
+    "turfpy.parallel": (250, ["shapely", "scipy", "concurrent.futures.process"]),
+    "turfpy.cache": (50, ["numpy", "shapely", "scipy"]),
+    "turfpy.index": (250, ["shapely", "scipy", "geopandas"]),
+    "turfpy.grids": (250, ["shapely", "scipy", "geopandas"]),
+    "turfpy.aggregation": (250, ["shapely", "scipy", "geopandas"]),
+    "turfpy.clusters": (250, ["shapely", "scipy", "geopandas"]),
+}
+
+SNIPPET = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {forbidden!r} if m in sys.modules]
+print(elapsed * 1000, ",".join(loaded))
+"""
+
+
+def measure(module: str, forbidden: list, repeat: int):
+    best = float("inf")
+    loaded = ""
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", SNIPPET.format(module=module, forbidden=forbidden)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split(" ")
+        best = min(best, float(output[0]))
+        loaded = output[1].strip()
+    return best, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="budget multiplier")
+    args = parser.parse_args()
+
+    failed = False
+    for module, (budget, forbidden) in BUDGETS.items():
+        elapsed, loaded = measure(module, forbidden, args.repeat)
+        status = "ok"
+        if elapsed > budget * args.scale:
+            status = "OVER BUDGET"
+        if loaded:
+            status = f"loads {loaded}"
+        failed = failed or status != "ok"
+        print(
+            f"{module:<28}{elapsed:>9.1f} ms / {budget * args.scale:>6.0f} ms  {status}"
+        )
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Benchmark of the segment intersection engine used by ``turfpy.misc.line_intersect``
+on two lines of 100k vertices each.
+
+Run with ``python benchmarks/line_intersect.py``.
+"""
+
+import time
+
+import numpy as np
+from geojson import Feature, LineString
+
+from turfpy.misc import line_intersect, segment_array, segment_intersections
+
+
+def make_lines(n_vertices: int = 100_000):
+    x = np.linspace(0, 100, n_vertices)
+    line_1 = np.column_stack([x, np.sin(x)])
+    line_2 = np.column_stack([x, np.cos(x * 1.1)])
+    return (
+        Feature(geometry=LineString(line_1.tolist())),
+        Feature(geometry=LineString(line_2.tolist())),
+    )
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:<30}{time.perf_counter() - start:>10.3f} s")
+    return result
+
+
+if __name__ == "__main__":
+    f1, f2 = make_lines()
+    s1 = timed("segment_array x2", lambda: (segment_array(f1), segment_array(f2)))[0]
+    s2 = segment_array(f2)
+    points, pairs, _ = timed("segment_intersections", segment_intersections, s1, s2)
+    fc = timed("line_intersect", line_intersect, f1, f2)
+    print(f"{len(points)} unique points, {len(pairs)} segment pairs")
+    assert len(fc["features"]) == len(points)
@@ -0,0 +1,707 @@
+"""
+Benchmark suite of the public functions of turfpy with a regression check against a
+stored baseline.
+
+Every case builds deterministic synthetic data of about 1e2, 1e4 and 1e6 vertices,
+after one untimed warm-up run, which pays for lazy imports and first-call costs,
+the best time of ``--repeat`` runs and the peak memory traced by ``tracemalloc``
+during one run are recorded. Functions doing pure Python work per call or per vertex
+declare a smaller maximum number of vertices to keep the suite practical.
+
+Results are compared with ``benchmarks/baseline.json`` and the script exits with a
+non zero status when a case is slower or allocates more than the baseline beyond
+the given thresholds. Time differences below ``MIN_SECONDS`` are ignored, as
+millisecond cases vary by several times between runs. Baselines depend on the machine, record one before comparing
+with ``--save-baseline``.
+
+Run with ``python benchmarks/suite.py [--scales 100 10000] [--filter measurement]
+[--repeat 3] [--time-threshold 0.5] [--memory-threshold 0.2] [--save-baseline]``.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, NamedTuple
+
+import numpy as np
+from geojson import Feature, FeatureCollection, LineString, Point, Polygon
+
+from turfpy import (
+    aggregation,
+    boolean,
+    clusters,
+    grids,
+    io,
+    measurement,
+    meta,
+    misc,
+    random,
+    transformation,
+)
+from turfpy.index import STRTree
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SCALES = [100, 10_000, 1_000_000]
+
+# differences below these floors are noise whatever the thresholds
+MIN_SECONDS = 0.05
+MIN_BYTES = 64 * 1024
+
+
+class Case(NamedTuple):
+    name: str
+    # returns the function to benchmark, called without arguments, for a number of
+    # vertices
+    setup: Callable[[int], Callable]
+    max_vertices: int
+
+
+# ---------- Data -----------#
+
+
+@lru_cache(maxsize=None)
+def line(n: int) -> Feature:
+    x = np.linspace(-50, 50, max(n, 2))
+    return Feature(geometry=LineString(np.column_stack([x, 10 * np.sin(x)]).tolist()))
+
+
+@lru_cache(maxsize=None)
+def polygon(n: int, offset: float = 0) -> Feature:
+    angles = np.linspace(0, 2 * np.pi, max(n, 4))
+    radius = 5 + np.sin(7 * angles)
+    ring = np.column_stack([offset + radius * np.cos(angles), radius * np.sin(angles)])
+    ring[-1] = ring[0]
+    return Feature(geometry=Polygon([ring.tolist()]))
+
+
+@lru_cache(maxsize=None)
+def polygons(n: int) -> FeatureCollection:
+    # 20 vertices, 21 positions, per polygon
+    return random.random_polygons(
+        max(n // 21, 1), num_vertices=20, bbox=[-170, -80, 170, 80], seed=0
+    )
+
+
+@lru_cache(maxsize=None)
+def points(n: int) -> FeatureCollection:
+    return random.random_points(n, bbox=[-10, -10, 10, 10], seed=0)
+
+
+@lru_cache(maxsize=None)
+def positions(n: int) -> List[list]:
+    return [f["geometry"]["coordinates"] for f in points(n)["features"]]
+
+
+@lru_cache(maxsize=None)
+def boxes(n: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    corners = rng.uniform([-180, -90], [179, 89], (n, 2))
+    return np.column_stack([corners, corners + rng.uniform(0, 1, (n, 2))])
+
+
+@lru_cache(maxsize=None)
+def tree(n: int) -> STRTree:
+    return STRTree(boxes(n))
+
+
+# bbox of the grids, covered by polygon(n)
+BBOX = [-5, -5, 5, 5]
+
+
+def cell_side(n: int, vertices: int) -> float:
+    # side in degrees of the cells of a grid of about n vertices in a 10 degrees bbox
+    return 10 / max(n // vertices, 1) ** 0.5
+
+
+@lru_cache(maxsize=None)
+def positions_array(n: int) -> np.ndarray:
+    return random.random_points(n, bbox=BBOX, seed=0, as_array=True)
+
+
+@lru_cache(maxsize=None)
+def pairs(n: int) -> List[tuple]:
+    features = points(n)["features"]
+    return list(zip(features[0::2], features[1::2]))
+
+
+def each_pair(func, n: int, *args):
+    def run():
+        for start, end in pairs(n):
+            func(start, end, *args)
+
+    return run
+
+
+def each_point(func, n: int, *args):
+    def run():
+        for point in points(n)["features"]:
+            func(point, *args)
+
+    return run
+
+
+def noop(*args):
+    return True
+
+
+def dbscan_distance(n: int) -> float:
+    # radius in km with about 5 of the n points of points(n) around every point
+    return (5 * 2220**2 / (np.pi * n)) ** 0.5
+
+
+def naive_dbscan(fc: FeatureCollection, max_distance: float, min_points: int = 3):
+    # baseline comparing every pair of points with measurement.distance
+    features = fc["features"]
+    neighbours = [
+        [
+            j
+            for j, other in enumerate(features)
+            if measurement.distance(feature, other) <= max_distance
+        ]
+        for feature in features
+    ]
+    clusters = [-1] * len(features)
+    cluster = 0
+    for i, found in enumerate(neighbours):
+        if clusters[i] >= 0 or len(found) < min_points:
+            continue
+        clusters[i] = cluster
+        stack = list(found)
+        while stack:
+            j = stack.pop()
+            if clusters[j] < 0:
+                clusters[j] = cluster
+                if len(neighbours[j]) >= min_points:
+                    stack.extend(neighbours[j])
+        cluster += 1
+    return clusters
+
+
+# ---------- Cases -----------#
+
+SMALL = 10_000
+LARGE = 1_000_000
+
+CASES = [
+    # measurement
+    Case("measurement.bearing", lambda n: each_pair(measurement.bearing, n), SMALL),
+    Case("measurement.distance", lambda n: each_pair(measurement.distance, n), SMALL),
+    # n vertices, routes of 100 points
+    Case(
+        "measurement.great_circles",
+        lambda n: partial(
+            measurement.great_circles,
+            positions_array(max(n // 100, 1)),
+            positions_array(max(n // 100, 1))[::-1] + [170, 0],
+            as_array=True,
+        ),
+        LARGE,
+    ),
+    Case("measurement.area", lambda n: partial(measurement.area, polygons(n)), LARGE),
+    Case("measurement.bbox", lambda n: partial(measurement.bbox, polygons(n)), LARGE),
+    Case(
+        "measurement.bbox_polygon",
+        lambda n: each_point(lambda p: measurement.bbox_polygon(measurement.bbox(p)), n),
+        SMALL,
+    ),
+    Case("measurement.center", lambda n: partial(measurement.center, polygons(n)), LARGE),
+    Case(
+        "measurement.envelope",
+        lambda n: partial(measurement.envelope, polygons(n)),
+        LARGE,
+    ),
+    Case("measurement.length", lambda n: partial(measurement.length, line(n)), SMALL),
+    Case(
+        "measurement.destination",
+        lambda n: each_point(measurement.destination, n, 10, 45),
+        SMALL,
+    ),
+    Case(
+        "measurement.centroid",
+        lambda n: partial(measurement.centroid, polygons(n)),
+        LARGE,
+    ),
+    Case("measurement.along", lambda n: partial(measurement.along, line(n), 1000), LARGE),
+    Case("measurement.midpoint", lambda n: each_pair(measurement.midpoint, n), SMALL),
+    Case(
+        "measurement.nearest_point",
+        lambda n: partial(measurement.nearest_point, Point((0, 0)), points(n)),
+        SMALL,
+    ),
+    Case(
+        "measurement.point_on_feature",
+        lambda n: partial(measurement.point_on_feature, polygon(n)),
+        LARGE,
+    ),
+    Case(
+        "measurement.boolean_point_in_polygon",
+        lambda n: each_point(measurement.boolean_point_in_polygon, 100, polygon(n)),
+        SMALL,
+    ),
+    Case(
+        "measurement.explode", lambda n: partial(measurement.explode, polygons(n)), SMALL
+    ),
+    Case(
+        "measurement.polygon_tangents",
+        lambda n: partial(measurement.polygon_tangents, Point((20, 20)), polygon(n)),
+        LARGE,
+    ),
+    Case(
+        "measurement.point_to_line_distance",
+        lambda n: partial(
+            measurement.point_to_line_distance, Feature(geometry=Point((0, 20))), line(n)
+        ),
+        SMALL,
+    ),
+    Case(
+        "measurement.rhumb_bearing",
+        lambda n: each_pair(measurement.rhumb_bearing, n),
+        SMALL,
+    ),
+    Case(
+        "measurement.rhumb_destination",
+        lambda n: each_point(measurement.rhumb_destination, n, 10, 45),
+        SMALL,
+    ),
+    Case(
+        "measurement.rhumb_distance",
+        lambda n: each_pair(measurement.rhumb_distance, n),
+        SMALL,
+    ),
+    Case(
+        "measurement.square",
+        lambda n: each_point(lambda p: measurement.square(measurement.bbox(p)), n),
+        SMALL,
+    ),
+    Case(
+        "measurement.points_within_polygon",
+        lambda n: partial(
+            measurement.points_within_polygon,
+            points(n),
+            polygon(100),
+            points_per_chunk=1000,
+        ),
+        SMALL,
+    ),
+    # meta
+    Case("meta.coord_each", lambda n: partial(meta.coord_each, polygons(n), noop), LARGE),
+    Case("meta.geom_each", lambda n: partial(meta.geom_each, polygons(n), noop), LARGE),
+    Case("meta.geom_reduce", lambda n: partial(meta.geom_reduce, polygons(n), 0), LARGE),
+    Case(
+        "meta.segment_each",
+        lambda n: partial(meta.segment_each, polygons(n), noop),
+        SMALL,
+    ),
+    Case(
+        "meta.segment_reduce",
+        lambda n: partial(meta.segment_reduce, polygons(n), lambda total, s: total, 0),
+        SMALL,
+    ),
+    Case(
+        "meta.flatten_each",
+        lambda n: partial(meta.flatten_each, polygons(n), noop),
+        LARGE,
+    ),
+    Case(
+        "meta.feature_each",
+        lambda n: partial(meta.feature_each, polygons(n), noop),
+        LARGE,
+    ),
+    # transformation
+    Case(
+        "transformation.circle",
+        lambda n: partial(transformation.circle, Feature(geometry=Point((0, 0))), 10, n),
+        SMALL,
+    ),
+    Case(
+        "transformation.bbox_clip",
+        lambda n: partial(transformation.bbox_clip, polygon(n), [-3, -3, 3, 3]),
+        LARGE,
+    ),
+    Case(
+        "transformation.bbox_clip_many",
+        lambda n: partial(transformation.bbox_clip_many, polygons(n), [-90, -45, 90, 45]),
+        SMALL,
+    ),
+    Case(
+        "transformation.intersect",
+        lambda n: partial(
+            transformation.intersect, [polygon(n // 2), polygon(n // 2, 3)]
+        ),
+        SMALL,
+    ),
+    Case(
+        "transformation.bezier_spline",
+        lambda n: partial(transformation.bezier_spline, line(n), n),
+        SMALL,
+    ),
+    Case(
+        "transformation.union",
+        lambda n: partial(transformation.union, polygons(n)),
+        SMALL,
+    ),
+    Case(
+        "transformation.concave",
+        lambda n: partial(transformation.concave, points(n)),
+        SMALL,
+    ),
+    Case(
+        "transformation.convex",
+        lambda n: partial(transformation.convex, points(n)),
+        SMALL,
+    ),
+    Case(
+        "transformation.dissolve",
+        lambda n: partial(transformation.dissolve, polygons(n)),
+        SMALL,
+    ),
+    Case(
+        "transformation.difference",
+        lambda n: partial(transformation.difference, polygon(n // 2), polygon(n // 2, 3)),
+        LARGE,
+    ),
+    Case(
+        "transformation.overlay",
+        lambda n: partial(transformation.overlay, polygons(n), polygons(n // 10)),
+        SMALL,
+    ),
+    Case(
+        "transformation.transform_rotate",
+        lambda n: partial(transformation.transform_rotate, polygons(n), 10),
+        SMALL,
+    ),
+    Case(
+        "transformation.transform_translate",
+        lambda n: partial(transformation.transform_translate, polygons(n), 100, 35),
+        SMALL,
+    ),
+    Case(
+        "transformation.transform_scale",
+        lambda n: partial(transformation.transform_scale, polygons(n), 2),
+        SMALL,
+    ),
+    Case(
+        "transformation.tesselate",
+        lambda n: partial(transformation.tesselate, polygon(n)),
+        SMALL,
+    ),
+    Case(
+        "transformation.line_offset",
+        lambda n: partial(transformation.line_offset, line(n), 2),
+        SMALL,
+    ),
+    Case(
+        "transformation.voronoi",
+        lambda n: partial(transformation.voronoi, positions(n)),
+        SMALL,
+    ),
+    Case(
+        "transformation.simplify",
+        lambda n: partial(transformation.simplify, polygon(n), 0.01, high_quality=True),
+        LARGE,
+    ),
+    Case(
+        "transformation.truncate",
+        lambda n: partial(transformation.truncate, polygons(n), 4),
+        LARGE,
+    ),
+    Case(
+        "transformation.simplify_visvalingam",
+        lambda n: partial(transformation.simplify, line(n), 0.01, method="visvalingam"),
+        LARGE,
+    ),
+    # io
+    Case("io.quantize", lambda n: partial(io.quantize, polygons(n)), LARGE),
+    Case(
+        "io.dequantize", lambda n: partial(io.dequantize, io.quantize(polygons(n))), LARGE
+    ),
+    Case(
+        "io.write_features",
+        lambda n: partial(io.write_features, polygons(n)["features"], os.devnull, 6),
+        LARGE,
+    ),
+    Case(
+        "io.write_columns",
+        lambda n: partial(io.write_columns, positions_array(n), os.devnull, precision=6),
+        LARGE,
+    ),
+    # misc
+    Case(
+        "misc.line_intersect",
+        lambda n: partial(misc.line_intersect, line(n // 2), polygon(n // 2)),
+        LARGE,
+    ),
+    Case("misc.segment_array", lambda n: partial(misc.segment_array, line(n)), LARGE),
+    Case(
+        "misc.segment_intersections",
+        lambda n: partial(
+            misc.segment_intersections,
+            misc.segment_array(line(n // 2)),
+            misc.segment_array(polygon(n // 2)),
+        ),
+        LARGE,
+    ),
+    Case("misc.line_segment", lambda n: partial(misc.line_segment, line(n)), SMALL),
+    Case(
+        "misc.nearest_point_on_line",
+        lambda n: partial(misc.nearest_point_on_line, line(n), Point((0, 20))),
+        SMALL,
+    ),
+    Case(
+        "misc.line_slice",
+        lambda n: partial(misc.line_slice, Point((-40, 0)), Point((40, 0)), line(n)),
+        SMALL,
+    ),
+    Case(
+        "misc.line_arc",
+        lambda n: partial(
+            misc.line_arc, Feature(geometry=Point((0, 0))), 10, 10, 90, {"steps": n}
+        ),
+        SMALL,
+    ),
+    Case(
+        "misc.sector",
+        lambda n: partial(
+            misc.sector, Feature(geometry=Point((0, 0))), 10, 10, 90, {"steps": n}
+        ),
+        SMALL,
+    ),
+    # boolean
+    Case(
+        "boolean.prepared_geometry",
+        lambda n: partial(boolean.prepared_geometry, polygon(n)),
+        LARGE,
+    ),
+    Case(
+        "boolean.boolean_disjoint",
+        lambda n: partial(boolean.boolean_disjoint, line(n // 2), polygon(n // 2)),
+        LARGE,
+    ),
+    Case(
+        "boolean.boolean_intersects",
+        lambda n: partial(boolean.boolean_intersects, line(n // 2), polygon(n // 2)),
+        LARGE,
+    ),
+    Case(
+        "boolean.intersects_join",
+        lambda n: partial(boolean.intersects_join, polygons(n // 2), points(n // 2)),
+        SMALL,
+    ),
+    # random
+    Case(
+        "random.random_position",
+        lambda n: each_point(lambda p: random.random_position(), n),
+        SMALL,
+    ),
+    # index: n boxes, 1000 queries
+    Case("index.STRTree", lambda n: partial(STRTree, boxes(n)), LARGE),
+    Case(
+        "index.query_many",
+        lambda n: partial(tree(n).query_many, boxes(1000) + [0, 0, 2, 2]),
+        LARGE,
+    ),
+    Case("index.nearest", lambda n: partial(tree(n).nearest, boxes(1000), 3), LARGE),
+    # clusters: about 5 points within the DBSCAN distance of every point
+    Case(
+        "clusters.clusters_dbscan",
+        lambda n: partial(clusters.clusters_dbscan, points(n), dbscan_distance(n)),
+        LARGE,
+    ),
+    Case(
+        "clusters.naive_dbscan",
+        lambda n: partial(naive_dbscan, points(n), dbscan_distance(n)),
+        1_000,
+    ),
+    Case(
+        "clusters.clusters_kmeans",
+        lambda n: partial(clusters.clusters_kmeans, points(n)),
+        SMALL,
+    ),
+    # grids: n vertices in a 10 degrees bbox
+    Case(
+        "grids.point_grid",
+        lambda n: partial(grids.point_grid, BBOX, cell_side(n, 1), "deg", as_array=True),
+        LARGE,
+    ),
+    Case(
+        "grids.square_grid",
+        lambda n: partial(grids.square_grid, BBOX, cell_side(n, 5), "deg", as_array=True),
+        LARGE,
+    ),
+    Case(
+        "grids.hex_grid",
+        lambda n: partial(grids.hex_grid, BBOX, cell_side(n, 7), "deg", as_array=True),
+        LARGE,
+    ),
+    Case(
+        "grids.triangle_grid",
+        lambda n: partial(
+            grids.triangle_grid, BBOX, cell_side(n, 8), "deg", as_array=True
+        ),
+        LARGE,
+    ),
+    # aggregation: n points into cells of 0.1 degree
+    Case(
+        "aggregation.GridAggregator",
+        lambda n: lambda: aggregation.GridAggregator("hex", BBOX, 0.1, "deg").add(
+            positions_array(n)
+        ),
+        LARGE,
+    ),
+    Case(
+        "aggregation.PolygonAggregator",
+        lambda n: lambda: aggregation.PolygonAggregator(
+            grids.hex_grid(BBOX, 0.1, "deg")
+        ).add(positions_array(n)),
+        LARGE,
+    ),
+    Case(
+        "grids.iter_grid",
+        lambda n: lambda: list(
+            grids.iter_grid(
+                "square", BBOX, cell_side(n, 5), "deg", mask=polygon(100), as_array=True
+            )
+        ),
+        LARGE,
+    ),
+    Case(
+        "random.random_points", lambda n: partial(random.random_points, n, seed=0), SMALL
+    ),
+    Case(
+        "random.iter_random_points",
+        lambda n: lambda: list(random.iter_random_points(n, seed=0, as_array=True)),
+        LARGE,
+    ),
+    Case(
+        "random.random_points_in_polygon",
+        lambda n: partial(random.random_points_in_polygon, polygon(100), n, seed=0),
+        SMALL,
+    ),
+    Case(
+        "random.random_line_strings",
+        lambda n: partial(random.random_line_strings, n // 10, 10, seed=0),
+        SMALL,
+    ),
+    Case(
+        "random.random_polygons",
+        lambda n: partial(random.random_polygons, n // 11, 10, seed=0),
+        SMALL,
+    ),
+]
+
+
+# ---------- Runner -----------#
+
+
+def run_case(case: Case, n: int, repeat: int) -> Dict[str, float]:
+    func = case.setup(n)
+    # warm-up, not timed
+    func()
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def compare(result: dict, baseline: dict, time_threshold: float, memory_threshold: float):
+    """Returns the list of regressions of result compared to its baseline."""
+    regressions = []
+    seconds, base_seconds = result["seconds"], baseline["seconds"]
+    if (
+        seconds > base_seconds * (1 + time_threshold)
+        and seconds - base_seconds > MIN_SECONDS
+    ):
+        regressions.append(f"time x{seconds / base_seconds:.2f}")
+
+    peak, base_peak = result["peak_bytes"], baseline["peak_bytes"]
+    if peak > base_peak * (1 + memory_threshold) and peak - base_peak > MIN_BYTES:
+        regressions.append(f"memory x{peak / max(base_peak, 1):.2f}")
+    return regressions
+
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {"machine": {}, "results": {}}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+    parser.add_argument("--filter", default="*", help="glob pattern of case names")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--time-threshold", type=float, default=0.5)
+    parser.add_argument("--memory-threshold", type=float, default=0.2)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store results as the baseline"
+    )
+    args = parser.parse_args()
+
+    pattern = args.filter if any(c in args.filter for c in "*?[") else f"*{args.filter}*"
+    baseline = load_baseline(args.baseline)
+    results = {}
+    failed = False
+
+    for case in CASES:
+        if not fnmatch.fnmatch(case.name, pattern):
+            continue
+        for n in args.scales:
+            key = f"{case.name}[{n}]"
+            if n > case.max_vertices:
+                continue
+
+            result = run_case(case, n, args.repeat)
+            results[key] = result
+
+            status = ""
+            if not args.save_baseline and key in baseline["results"]:
+                regressions = compare(
+                    result,
+                    baseline["results"][key],
+                    args.time_threshold,
+                    args.memory_threshold,
+                )
+                status = ", ".join(regressions) or "ok"
+                failed = failed or bool(regressions)
+            print(
+                f"{key:<52}{result['seconds'] * 1000:>11.2f} ms"
+                f"{result['peak_bytes'] / 2**20:>10.2f} MiB  {status}",
+                flush=True,
+            )
+
+    if args.save_baseline:
+        baseline["machine"] = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        }
+        baseline["results"].update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
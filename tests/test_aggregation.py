@@ -0,0 +1,184 @@
+"""
+Test module for aggregation.
+"""
+
+import pickle
+
+import numpy as np
+import pytest
+import shapely
+from geojson import Feature, FeatureCollection, MultiPolygon, Point, Polygon
+
+from turfpy.aggregation import (
+    GridAggregator,
+    PolygonAggregator,
+    aggregate_grid,
+    collect,
+    count,
+)
+from turfpy.grids import hex_grid, square_grid, triangle_grid
+from turfpy.random import random_points
+
+bbox = [-95, 30, -85, 40]
+
+polygons = FeatureCollection(
+    [
+        Feature(
+            geometry=Polygon([[(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]]),
+            properties={"id": 1},
+        ),
+        Feature(
+            geometry=Polygon([[(5, 5), (15, 5), (15, 15), (5, 15), (5, 5)]]),
+            properties={"id": 2},
+        ),
+        Feature(
+            geometry=MultiPolygon(
+                [
+                    [[(20, 20), (21, 20), (21, 21), (20, 20)]],
+                    [[(30, 30), (31, 30), (31, 31), (30, 30)]],
+                ]
+            ),
+            properties={"id": 3},
+        ),
+        Feature(
+            geometry=Polygon([[(40, 40), (41, 40), (41, 41), (40, 41), (40, 40)]]),
+            properties={"id": 4},
+        ),
+    ]
+)
+
+points = FeatureCollection(
+    [
+        Feature(geometry=Point(position), properties={"population": population})
+        for position, population in [
+            ((1, 1), 100),
+            ((6, 6), 200),
+            ((10, 10), None),
+            ((30.9, 30.1), 400),
+            ((50, 50), 500),
+            ((12, 12), 600),
+        ]
+    ]
+)
+
+
+def test_collect():
+    fc = collect(polygons, points, "population", "values")
+    assert [f["properties"] for f in fc["features"]] == [
+        {"id": 1, "values": [100, 200, None]},
+        {"id": 2, "values": [200, None, 600]},
+        {"id": 3, "values": [400]},
+        {"id": 4, "values": []},
+    ]
+    # the input polygons are not modified
+    assert "values" not in polygons["features"][0]["properties"]
+
+
+def test_count():
+    fc = count(polygons, points)
+    assert [f["properties"]["count"] for f in fc["features"]] == [3, 3, 1, 0]
+
+
+def test_polygon_aggregator_reducers():
+    reducers = {
+        "n": "count",
+        "total": ("population", "sum"),
+        "mean": ("population", "mean"),
+        "min": ("population", "min"),
+        "max": ("population", "max"),
+    }
+    fc = PolygonAggregator(polygons, reducers).add(points).result(keep_empty=False)
+    # missing values are ignored by numeric reducers
+    assert [f["properties"] for f in fc["features"]] == [
+        {"id": 1, "n": 3, "total": 300.0, "mean": 150.0, "min": 100.0, "max": 200.0},
+        {"id": 2, "n": 3, "total": 800.0, "mean": 400.0, "min": 200.0, "max": 600.0},
+        {"id": 3, "n": 1, "total": 400.0, "mean": 400.0, "min": 400.0, "max": 400.0},
+    ]
+
+
+def test_polygon_aggregator_null_geometry():
+    features = [Feature(geometry=None, properties={"id": 0})] + polygons["features"]
+    fc = count(FeatureCollection(features), points)
+    assert [f["properties"]["count"] for f in fc["features"]] == [0, 3, 3, 1, 0]
+    assert fc["features"][0]["geometry"] is None
+
+    fc = count(FeatureCollection(features[:1]), points)
+    assert [f["properties"]["count"] for f in fc["features"]] == [0]
+
+
+def test_polygon_aggregator_matches_shapely():
+    cells = hex_grid(bbox, 20, units="mi")
+    coords = random_points(20000, bbox=[-96, 29, -84, 41], seed=0, as_array=True)
+    aggregator = PolygonAggregator(cells).add(coords)
+
+    geoms = shapely.from_geojson([str(f["geometry"]) for f in cells["features"]])
+    _, found = shapely.STRtree(geoms).query(
+        shapely.points(coords), predicate="intersects"
+    )
+    assert np.array_equal(
+        aggregator.values()["count"], np.bincount(found, minlength=len(geoms))
+    )
+
+
+@pytest.mark.parametrize(
+    "grid, function",
+    [("square", square_grid), ("hex", hex_grid), ("triangle", triangle_grid)],
+)
+def test_grid_aggregator_matches_cells(grid, function):
+    coords = random_points(5000, bbox=[-96, 29, -84, 41], seed=1, as_array=True)
+    values = {"value": np.arange(5000) % 7}
+    reducers = {"count": "count", "total": ("value", "sum")}
+    result = GridAggregator(grid, bbox, 50, units="mi", reducers=reducers).add(
+        coords, values
+    )
+
+    cells = function(bbox, 50, units="mi")
+    expected = PolygonAggregator(cells, reducers).add(coords, values)
+    assert np.array_equal(result.values()["count"], expected.values()["count"])
+    assert np.array_equal(result.values()["total"], expected.values()["total"])
+
+    fc = result.result()
+    assert len(fc["features"]) == len(cells["features"])
+    assert fc["features"][0]["geometry"] == cells["features"][0]["geometry"]
+
+
+def test_aggregate_grid():
+    # 2 x 2 squares, the points outside the grid are ignored
+    fc = aggregate_grid(points, "square", [0, 0, 21, 21], 10, units="deg")
+    assert [f["properties"]["count"] for f in fc["features"]] == [3, 1]
+    fc = aggregate_grid(points, "square", [0, 0, 21, 21], 10, "deg", keep_empty=True)
+    assert [f["properties"]["count"] for f in fc["features"]] == [3, 0, 0, 1]
+
+
+def test_streaming_merge():
+    coords = random_points(10000, bbox=bbox, seed=2, as_array=True)
+    names = np.array([f"p{i}" for i in range(10000)], dtype=object)
+    reducers = {"max": ("value", "max"), "names": ("name", "list")}
+    values = {"value": np.arange(10000.0), "name": names}
+
+    whole = GridAggregator("hex", bbox, 50, units="mi", reducers=reducers)
+    whole.add(coords, values)
+
+    parts = []
+    for start in range(0, 10000, 3000):
+        part = GridAggregator("hex", bbox, 50, units="mi", reducers=reducers)
+        chunk = {name: column[start : start + 3000] for name, column in values.items()}
+        parts.append(part.add(coords[start : start + 3000], chunk))
+    # partial results can be sent between processes
+    merged = pickle.loads(pickle.dumps(parts[0]))
+    for part in parts[1:]:
+        merged.merge(part)
+
+    assert np.array_equal(merged.values()["max"], whole.values()["max"], equal_nan=True)
+    assert list(merged.values()["names"]) == list(whole.values()["names"])
+
+
+def test_aggregation_errors():
+    with pytest.raises(Exception, match="reducer should be one of"):
+        PolygonAggregator(polygons, {"x": ("population", "median")})
+    with pytest.raises(Exception, match="needs a property"):
+        PolygonAggregator(polygons, {"x": "sum"})
+    with pytest.raises(Exception, match="values are missing"):
+        PolygonAggregator(polygons, {"x": ("population", "sum")}).add(np.zeros((1, 2)))
+    with pytest.raises(Exception, match="same cells"):
+        GridAggregator("square", bbox, 50).merge(GridAggregator("square", bbox, 100))
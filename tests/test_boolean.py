@@ -7,7 +7,23 @@ import json
 import os
 import unittest
 
-from turfpy.boolean import boolean_disjoint, boolean_intersects
+from geojson import (
+    Feature,
+    FeatureCollection,
+    LineString,
+    MultiLineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+)
+
+from turfpy.boolean import (
+    boolean_disjoint,
+    boolean_intersects,
+    intersects_join,
+    prepared_geometry,
+)
 
 
 def load_json_file_sync(filepath):
@@ -75,3 +91,83 @@ class TestTurfBooleanIntersects(unittest.TestCase):
             feature2 = geojson["features"][1]
             result = boolean_intersects(feature1, feature2)
             self.assertFalse(result, False)
+
+
+class TestTurfBooleanPrepared(unittest.TestCase):
+    def setUp(self):
+        self.polygon = Feature(
+            geometry=Polygon([[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]])
+        )
+
+    def test_all_parts_are_checked(self):
+        points = Feature(geometry=MultiPoint([[50, 50], [1, 1]]))
+        self.assertFalse(boolean_disjoint(points, self.polygon))
+        self.assertTrue(boolean_intersects(points, self.polygon))
+
+    def test_multi_part_geometries(self):
+        polygons = Feature(
+            geometry=MultiPolygon(
+                [
+                    [[(10, 10), (11, 10), (11, 11), (10, 10)]],
+                    self.polygon["geometry"]["coordinates"],
+                ]
+            )
+        )
+        self.assertTrue(boolean_intersects(polygons, Feature(geometry=Point((1, 1)))))
+        lines = Feature(
+            geometry=MultiLineString([[(10, 10), (11, 11)], [(0, 0), (2, 2)]])
+        )
+        line = Feature(geometry=LineString([(0, 2), (2, 0)]))
+        self.assertTrue(boolean_intersects(lines, line))
+        self.assertFalse(boolean_disjoint(lines, line))
+
+    def test_zero_length_segment(self):
+        line = Feature(geometry=LineString([(1, 1), (1, 1)]))
+        self.assertTrue(boolean_intersects(line, Feature(geometry=Point((1, 1)))))
+        self.assertFalse(boolean_intersects(line, Feature(geometry=Point((1, 5)))))
+        self.assertTrue(boolean_disjoint(line, Feature(geometry=Point((1, 5)))))
+
+    def test_prepared_geometry(self):
+        polygon = prepared_geometry(self.polygon)
+        for x, expected in [(1, True), (2, True), (3, False), (-1, False)]:
+            point = Feature(geometry=Point((x, x)))
+            self.assertEqual(boolean_intersects(polygon, point), expected)
+            self.assertEqual(boolean_disjoint(polygon, point), not expected)
+
+
+class TestIntersectsJoin(unittest.TestCase):
+    def setUp(self):
+        self.points = FeatureCollection(
+            [Feature(geometry=Point((x, x))) for x in range(5)]
+        )
+        self.polygons = FeatureCollection(
+            [
+                Feature(geometry=Polygon([[(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)]])),
+                Feature(geometry=Polygon([[(1, 1), (1, 4), (4, 4), (4, 1), (1, 1)]])),
+            ]
+        )
+
+    def test_intersects(self):
+        left_idx, right_idx = intersects_join(self.points, self.polygons)
+        self.assertEqual(left_idx.tolist(), [0, 1, 1, 2, 2, 3, 4])
+        self.assertEqual(right_idx.tolist(), [0, 0, 1, 0, 1, 1, 1])
+        for i, j in zip(left_idx, right_idx):
+            self.assertTrue(
+                boolean_intersects(
+                    self.points["features"][i], self.polygons["features"][j]
+                )
+            )
+
+    def test_predicate_chunked(self):
+        expected = intersects_join(self.points, self.polygons, predicate="within")
+        self.assertEqual(expected[0].tolist(), [1, 2, 3])
+        self.assertEqual(expected[1].tolist(), [0, 1, 1])
+        left_idx, right_idx = intersects_join(
+            iter(self.points["features"]), self.polygons, "within", chunk_size=2
+        )
+        self.assertEqual(left_idx.tolist(), expected[0].tolist())
+        self.assertEqual(right_idx.tolist(), expected[1].tolist())
+
+    def test_invalid_predicate(self):
+        with self.assertRaises(Exception):
+            intersects_join(self.points, self.polygons, predicate="disjoint")
@@ -0,0 +1,86 @@
+"""
+Test module for the geometry cache.
+"""
+
+import copy
+
+from geojson import Feature, FeatureCollection, Point, Polygon
+
+from turfpy import cache
+from turfpy.measurement import area, bbox, centroid
+from turfpy.transformation import transform_rotate, transform_scale
+
+
+def square(size):
+    return Feature(
+        geometry=Polygon([[[0, 0], [0, size], [size, size], [size, 0], [0, 0]]])
+    )
+
+
+def test_cached():
+    polygon = square(1)
+    expected = area(polygon)
+    assert cache.stats() == {}
+
+    with cache.cached():
+        assert area(polygon) == expected
+        assert area(polygon) == expected
+        assert area(square(1)) == expected
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+        # results are copies of the cached values
+        result = bbox(polygon)
+        result.append(0)
+        assert bbox(polygon) == [0, 0, 1, 1]
+
+        # replaced coordinates change the fingerprint
+        polygon["geometry"]["coordinates"] = [[[0, 0], [0, 2], [2, 2], [2, 0], [0, 0]]]
+        assert bbox(polygon) == [0, 0, 2, 2]
+
+    assert not cache.is_enabled()
+
+
+def test_cache_eviction():
+    with cache.cached(max_entries=2, max_vertices=12):
+        polygons = [square(i + 1) for i in range(3)]
+        for polygon in polygons:
+            area(polygon)
+        stats = cache.stats()
+        assert stats["entries"] == 2
+        assert stats["vertices"] == 10
+        assert stats["evictions"] == 1
+
+        area(polygons[0])
+        assert cache.stats()["misses"] == 4
+
+        # arguments with more vertices than the budget are not cached
+        big = FeatureCollection([square(1), square(2), square(3)])
+        area(big)
+        assert cache.stats()["entries"] == 2
+
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["misses"] == 0
+
+
+def test_cache_invalidation():
+    polygon = square(1)
+    collection = FeatureCollection([polygon, Feature(geometry=Point([5, 5]))])
+
+    with cache.cached():
+        center = centroid(polygon)["geometry"]["coordinates"]
+        centroid(collection)
+        assert cache.invalidate(collection) == 2
+
+        centroid(polygon)
+        transform_rotate(polygon, 90, mutate=True)
+        assert cache.stats()["entries"] == 0
+        assert centroid(polygon)["geometry"]["coordinates"] != center
+
+        scaled = transform_scale(collection, 2, origin=[0, 0], mutate=True)
+        assert scaled is collection
+        bbox(collection)
+        transform_scale(collection, 2, origin=[0, 0], mutate=True)
+        assert bbox(collection) == bbox(copy.deepcopy(collection))
+        assert cache.stats()["invalidations"] >= 2
@@ -0,0 +1,107 @@
+"""
+Test module for clusters.
+"""
+
+import numpy as np
+import pytest
+from geojson import Feature, FeatureCollection, Point
+
+from turfpy.clusters import clusters_dbscan, clusters_kmeans
+from turfpy.measurement import distance
+from turfpy.random import random_points
+
+
+def _points(positions):
+    return FeatureCollection(
+        [
+            Feature(geometry=Point(p), properties={"id": i})
+            for i, p in enumerate(positions)
+        ]
+    )
+
+
+def test_clusters_dbscan():
+    # two groups about 11 km apart, an edge point and a lone point
+    fc = _points(
+        [
+            (0, 0),
+            (0.01, 0),
+            (0, 0.01),
+            (0.1, 0),
+            (0.11, 0),
+            (0.1, 0.01),
+            (0.02, 0),
+            (5, 5),
+        ]
+    )
+    result = clusters_dbscan(fc, 1.6, min_points=3)
+    properties = [f["properties"] for f in result["features"]]
+    assert [p.get("cluster") for p in properties] == [0, 0, 0, 1, 1, 1, 0, None]
+    assert [p["dbscan"] for p in properties] == ["core"] * 6 + ["edge", "noise"]
+    assert properties[0]["id"] == 0
+    # the input is not modified
+    assert "dbscan" not in fc["features"][0]["properties"]
+
+    result = clusters_dbscan(fc, 20, min_points=3, mutate=True)
+    assert result is fc
+    assert [f["properties"]["cluster"] for f in fc["features"][:7]] == [0] * 7
+
+
+def test_clusters_dbscan_matches_pairwise_distance():
+    fc = random_points(200, bbox=[0, 30, 5, 35], seed=0)
+    result = clusters_dbscan(fc, 30, min_points=4)
+
+    features = fc["features"]
+    neighbours = [
+        {j for j, other in enumerate(features) if distance(feature, other) <= 30}
+        for feature in features
+    ]
+    core = {i for i, found in enumerate(neighbours) if len(found) >= 4}
+    properties = [f["properties"] for f in result["features"]]
+    for i, found in enumerate(neighbours):
+        if i in core:
+            assert properties[i]["dbscan"] == "core"
+            # core neighbours are in the same cluster
+            assert {properties[j]["cluster"] for j in found & core} == {
+                properties[i]["cluster"]
+            }
+        elif found & core:
+            assert properties[i]["dbscan"] == "edge"
+            assert properties[i]["cluster"] in {
+                properties[j]["cluster"] for j in found & core
+            }
+        else:
+            assert properties[i] == {"dbscan": "noise"}
+
+
+def test_clusters_kmeans():
+    rng = np.random.default_rng(0)
+    centers = [(0, 0), (10, 10), (-10, 20)]
+    positions = np.concatenate([rng.normal(c, 0.5, (50, 2)) for c in centers])
+    # the first points are the initial centroids
+    positions = np.concatenate([positions[[0, 50, 100]], positions])
+    result = clusters_kmeans(_points(positions.tolist()), 3)
+
+    clusters = np.array([f["properties"]["cluster"] for f in result["features"]])
+    assert list(clusters[3:]) == [0] * 50 + [1] * 50 + [2] * 50
+    for cluster, center in enumerate(centers):
+        centroid = result["features"][3 + 50 * cluster]["properties"]["centroid"]
+        assert np.allclose(centroid, center, atol=0.3)
+
+    # default number of clusters, at most one per point
+    result = clusters_kmeans(_points(positions.tolist()))
+    assert len({f["properties"]["cluster"] for f in result["features"]}) == 9
+    result = clusters_kmeans(_points([(0, 0), (1, 1)]), 5)
+    assert [f["properties"]["cluster"] for f in result["features"]] == [0, 1]
+
+
+def test_clusters_errors():
+    fc = _points([(0, 0)])
+    with pytest.raises(Exception, match="invalid max distance"):
+        clusters_dbscan(fc, -1)
+    with pytest.raises(Exception, match="min points"):
+        clusters_dbscan(fc, 1, min_points=0)
+    with pytest.raises(Exception, match="number of clusters"):
+        clusters_kmeans(fc, 0)
+    with pytest.raises(Exception, match="FeatureCollection"):
+        clusters_kmeans(Feature(geometry=Point((0, 0))))
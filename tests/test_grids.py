@@ -0,0 +1,134 @@
+"""
+Test module for grids.
+"""
+
+import numpy as np
+import pytest
+from geojson import Feature, Polygon
+from shapely.geometry import shape
+
+from turfpy.grids import hex_grid, iter_grid, point_grid, square_grid, triangle_grid
+from turfpy.helper import length_to_degrees
+
+bbox = [-95, 30, -85, 40]
+
+mask = Feature(
+    geometry=Polygon([[(-95, 30), (-85, 30), (-95, 40), (-95, 30)]]),
+)
+
+
+def test_point_grid():
+    fc = point_grid(bbox, 50, units="mi", properties={"name": "grid"})
+    coords = np.array([f["geometry"]["coordinates"] for f in fc["features"]])
+    assert len(coords) == 168
+    assert fc["features"][0]["properties"] == {"name": "grid"}
+    assert (coords.min(axis=0) >= bbox[:2]).all()
+    assert (coords.max(axis=0) <= bbox[2:]).all()
+    # the grid is centered in the bbox
+    center = (coords.min(axis=0) + coords.max(axis=0)) / 2
+    assert np.allclose(center, [-90, 35])
+
+
+def test_square_grid():
+    coords = square_grid(bbox, 50, units="mi", as_array=True)
+    side = length_to_degrees(50, "mi")
+    assert coords.shape == (169, 5, 2)
+    assert np.allclose(coords[:, 2] - coords[:, 0], side)
+    assert (coords[..., 0] >= bbox[0]).all() and (coords[..., 0] <= bbox[2]).all()
+    assert (coords[..., 1] >= bbox[1]).all() and (coords[..., 1] <= bbox[3]).all()
+    # squares are ordered by column then row and do not overlap
+    assert np.allclose(coords[1, 0], coords[0, 1])
+    area = sum(shape(f["geometry"]).area for f in square_grid(bbox, 50, "mi")["features"])
+    assert area == pytest.approx(169 * side**2)
+
+
+def test_hex_grid():
+    hexagons = hex_grid(bbox, 50, units="mi", as_array=True)
+    assert hexagons.shape == (46, 7, 2)
+    assert np.allclose(hexagons[:, 0], hexagons[:, -1])
+    assert (hexagons[..., 0] >= bbox[0]).all() and (hexagons[..., 0] <= bbox[2]).all()
+    assert (hexagons[..., 1] >= bbox[1]).all() and (hexagons[..., 1] <= bbox[3]).all()
+
+    triangles = hex_grid(bbox, 50, units="mi", triangles=True, as_array=True)
+    assert triangles.shape == (46 * 6, 4, 2)
+    areas = [shape(f["geometry"]).area for f in hex_grid(bbox, 50, "mi")["features"]]
+    triangle_areas = [
+        shape(f["geometry"]).area
+        for f in hex_grid(bbox, 50, "mi", triangles=True)["features"]
+    ]
+    assert sum(triangle_areas) == pytest.approx(sum(areas))
+
+
+def test_triangle_grid():
+    triangles = triangle_grid(bbox, 50, units="mi", as_array=True)
+    assert triangles.shape == (336, 4, 2)
+    assert np.allclose(triangles[:, 0], triangles[:, -1])
+    assert np.allclose(triangles[..., 0].min(), bbox[0])
+    assert np.allclose(triangles[..., 1].min(), bbox[1])
+    # the two triangles of a cell cover it
+    first, second = (
+        shape(f["geometry"]) for f in triangle_grid(bbox, 50, "mi")["features"][:2]
+    )
+    assert first.area == pytest.approx(second.area)
+    assert first.union(second).area == pytest.approx(
+        first.envelope.union(second.envelope).area
+    )
+
+
+def test_grid_mask():
+    poly = shape(mask["geometry"])
+    points = point_grid(bbox, 50, units="mi", mask=mask, as_array=True)
+    assert 0 < len(points) < 168
+    assert all(poly.contains(shape({"type": "Point", "coordinates": p})) for p in points)
+
+    for grid, function in (
+        ("square", square_grid),
+        ("hex", hex_grid),
+        ("triangle", triangle_grid),
+    ):
+        cells = function(bbox, 50, units="mi", as_array=True)
+        masked = function(bbox, 50, units="mi", mask=mask, as_array=True)
+        expected = [
+            c for c in cells if poly.intersection(shape(_polygon(c))).area > 1e-12
+        ]
+        assert np.allclose(masked, np.array(expected)), grid
+
+
+def test_iter_grid():
+    for grid, function in (
+        ("point", point_grid),
+        ("square", square_grid),
+        ("hex", hex_grid),
+        ("triangle", triangle_grid),
+    ):
+        chunks = list(
+            iter_grid(grid, bbox, 50, units="mi", mask=mask, chunk_size=37, as_array=True)
+        )
+        assert len(chunks) > 1
+        assert np.array_equal(
+            np.concatenate(chunks),
+            function(bbox, 50, units="mi", mask=mask, as_array=True),
+        )
+
+    chunks = list(iter_grid("square", bbox, 100, chunk_size=50))
+    # chunks of whole columns of 11 squares
+    assert [len(chunk["features"]) for chunk in chunks] == [44, 44, 33]
+
+
+def test_grid_errors():
+    with pytest.raises(Exception, match="unit is invalid"):
+        square_grid(bbox, 50, units="parsec")
+    with pytest.raises(Exception, match="cell_side"):
+        square_grid(bbox, 0)
+    with pytest.raises(Exception, match="positive width"):
+        square_grid([0, 0, 0, 1], 50)
+    with pytest.raises(Exception, match="grid should be one of"):
+        next(iter_grid("circle", bbox, 50))
+    with pytest.raises(Exception, match="mask"):
+        square_grid(
+            bbox, 50, mask=Feature(geometry={"type": "Point", "coordinates": [0, 0]})
+        )
+
+
+def _polygon(ring):
+    return {"type": "Polygon", "coordinates": [ring.tolist()]}
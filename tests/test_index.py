@@ -0,0 +1,86 @@
+"""
+Test module for index.
+"""
+
+import pickle
+
+import numpy as np
+
+from turfpy.index import STRTree, open_index
+
+
+def brute_force_query(bounds, box):
+    return np.flatnonzero(
+        (bounds[:, 0] <= box[2])
+        & (bounds[:, 2] >= box[0])
+        & (bounds[:, 1] <= box[3])
+        & (bounds[:, 3] >= box[1])
+    )
+
+
+def make_bounds(n):
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(-50, 50, (n, 2))
+    bounds = np.column_stack([xy, xy + rng.uniform(0, 2, (n, 2))])
+    bounds[7] = np.nan
+    return bounds
+
+
+def test_query():
+    bounds = make_bounds(5000)
+    tree = STRTree(bounds, node_capacity=8)
+    assert len(tree) == 4999
+    assert np.array_equal(tree.total_bounds[:2], np.nanmin(bounds, axis=0)[:2])
+
+    queries = np.array([[0, 0, 5, 5], [-50, -50, -45, -40], [100, 100, 101, 101]])
+    query_idx, item_idx = tree.query_many(queries)
+    for i, box in enumerate(queries):
+        expected = brute_force_query(bounds, box)
+        assert np.array_equal(item_idx[query_idx == i], expected)
+        assert np.array_equal(tree.query(box), expected)
+
+    # positions
+    point = bounds[0, [0, 1, 0, 1]]
+    assert np.array_equal(tree.query(point[:2]), brute_force_query(bounds, point))
+
+
+def test_nearest():
+    bounds = make_bounds(2000)
+    tree = STRTree(bounds)
+    points = np.array([[0, 0], [60, 60], [-20, 30]])
+
+    query_idx, item_idx, distance = tree.nearest(points, k=3)
+    for i, (x, y) in enumerate(points):
+        dx = np.maximum(0, np.maximum(bounds[:, 0] - x, x - bounds[:, 2]))
+        dy = np.maximum(0, np.maximum(bounds[:, 1] - y, y - bounds[:, 3]))
+        expected = np.hypot(dx, dy)
+        expected[7] = np.inf
+        assert np.allclose(distance[query_idx == i], np.sort(expected)[:3])
+        assert np.allclose(expected[item_idx[query_idx == i]], distance[query_idx == i])
+
+    query_idx, _, distance = tree.nearest(points, k=5, max_distance=1)
+    assert (distance <= 1).all()
+    assert 1 not in query_idx
+
+
+def test_empty_tree():
+    tree = STRTree(np.empty((0, 4)))
+    assert len(tree) == 0
+    assert len(tree.query([0, 0, 1, 1])) == 0
+    assert len(tree.nearest([[0, 0]])[0]) == 0
+
+
+def test_pickle_and_save(tmp_path):
+    bounds = make_bounds(1000)
+    tree = STRTree(bounds)
+    box = [0, 0, 10, 10]
+
+    assert np.array_equal(pickle.loads(pickle.dumps(tree)).query(box), tree.query(box))
+
+    saved = tree.save(tmp_path / "index")
+    assert isinstance(saved.boxes, np.memmap)
+    assert np.array_equal(saved.query(box), tree.query(box))
+    # only the path is pickled
+    assert len(pickle.dumps(saved)) < 200
+    assert np.array_equal(pickle.loads(pickle.dumps(saved)).query(box), tree.query(box))
+    assert np.array_equal(open_index(tmp_path / "index").query(box), tree.query(box))
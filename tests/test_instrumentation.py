@@ -0,0 +1,80 @@
+"""
+Test module for instrumentation.
+"""
+
+import os
+import subprocess
+import sys
+
+from geojson import Feature, FeatureCollection, Polygon
+
+from turfpy import instrumentation, measurement, meta
+from turfpy.io import read_seq
+
+polygon = Feature(geometry=Polygon([[[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]]]))
+
+
+def test_instrumented():
+    original = measurement.bbox
+
+    with instrumentation.instrumented():
+        assert measurement.bbox is not original
+        measurement.bbox(polygon)
+        measurement.bbox(FeatureCollection([polygon, polygon]))
+
+    assert measurement.bbox is original
+    assert not instrumentation.is_enabled()
+
+    stats = instrumentation.snapshot()
+    assert stats["turfpy.measurement.bbox"]["calls"] == 2
+    assert stats["turfpy.measurement.bbox"]["vertices"] == 15
+    # called through the namespace of turfpy.measurement
+    assert stats["turfpy.meta.coord_each"]["calls"] == 2
+    assert stats["turfpy.meta.coord_each"]["seconds"] > 0
+
+    measurement.bbox(polygon)
+    assert instrumentation.snapshot()["turfpy.measurement.bbox"]["calls"] == 2
+
+    instrumentation.reset()
+    assert instrumentation.snapshot() == {}
+
+
+def test_instrumented_generator(tmp_path):
+    path = tmp_path / "points.geojsons"
+    path.write_text('{"type": "Feature", "geometry": null, "properties": {}}\n' * 3)
+
+    with instrumentation.instrumented():
+        from turfpy import io
+
+        with open(path, encoding="utf-8") as f:
+            assert len(list(io.read_seq(f))) == 3
+        # imported before instrumentation was enabled
+        with open(path, encoding="utf-8") as f:
+            list(read_seq(f))
+
+    assert instrumentation.snapshot()["turfpy.io.read_seq"]["calls"] == 1
+
+
+def test_to_prometheus():
+    with instrumentation.instrumented():
+        meta.coord_each(polygon, lambda *args: True)
+
+    text = instrumentation.to_prometheus()
+    assert "# TYPE turfpy_calls_total counter" in text
+    assert 'turfpy_calls_total{function="turfpy.meta.coord_each"} 1' in text
+    assert 'turfpy_vertices_total{function="turfpy.meta.coord_each"} 5' in text
+
+
+def test_environment_variable():
+    code = "import turfpy.instrumentation as i; print(i.is_enabled())"
+    env = dict(os.environ, TURFPY_INSTRUMENTATION="1")
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    assert output.stdout.strip() == "True"
+
+    env["TURFPY_INSTRUMENTATION"] = "0"
+    output = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    assert output.stdout.strip() == "False"
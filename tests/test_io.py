@@ -0,0 +1,211 @@
+"""
+Test module for io.
+"""
+
+import io
+import json
+import socket
+import threading
+
+import numpy as np
+import pytest
+from geojson import Feature, FeatureCollection, LineString, Point, Polygon
+
+from turfpy.io import (
+    dequantize,
+    payload_sizes,
+    quantize,
+    read_features,
+    read_seq,
+    write_columns,
+    write_features,
+    write_seq,
+)
+
+
+def make_collection():
+    return FeatureCollection(
+        [
+            Feature(geometry=Point((1, 1)), properties={"name": "a", "value": 1}),
+            Feature(
+                geometry=LineString([(10, 10), (20, 20)]),
+                properties={"name": "b", "value": 2},
+                id=7,
+            ),
+            Feature(
+                geometry=Polygon([[(0, 0), (0, 5), (5, 5), (5, 0), (0, 0)]]),
+                properties={"name": "c", "value": 12345678901234},
+            ),
+            Feature(geometry=None, properties={"name": "d"}),
+        ],
+        properties={"source": "test"},
+    )
+
+
+def test_read_features(tmp_path):
+    fc = make_collection()
+    path = tmp_path / "fc.geojson"
+    path.write_text(json.dumps(fc, indent=2))
+
+    for buffer_size in [1, 7, 1 << 16]:
+        features = list(read_features(path, buffer_size=buffer_size))
+        assert features == fc["features"]
+        assert features[1]["id"] == 7
+
+
+def test_read_features_projection_and_bbox():
+    fc = make_collection()
+    source = io.StringIO(json.dumps(fc))
+
+    features = list(
+        read_features(source, properties=["name"], bbox=[0, 0, 6, 6], buffer_size=5)
+    )
+
+    assert [f["properties"] for f in features] == [{"name": "a"}, {"name": "c"}]
+    assert features[1]["geometry"] == fc["features"][2]["geometry"]
+
+
+def test_read_features_empty():
+    assert (
+        list(read_features(io.StringIO('{"type": "FeatureCollection", "features": []}')))
+        == []
+    )
+
+
+def test_read_write_seq(tmp_path):
+    fc = make_collection()
+    path = tmp_path / "fc.geojsons"
+
+    assert write_seq(fc["features"], path, record_separator=True) == 4
+    assert path.read_text().startswith("\x1e{")
+    assert list(read_seq(path)) == fc["features"]
+
+    source = io.StringIO("\n".join(json.dumps(f) for f in fc["features"]) + "\n\n")
+    assert list(read_seq(source)) == fc["features"]
+
+
+def test_quantize():
+    fc = make_collection()
+    fc["features"][1]["geometry"]["coordinates"] = [[10.1234567, 10.5, 3], [20.25, 20]]
+    quantized = quantize(fc, 3)
+    assert quantized["transform"] == {"scale": [0.001, 0.001], "translate": [0, 0]}
+    # positions but the first of every line are differences with the previous one
+    assert quantized["features"][1]["geometry"]["coordinates"] == [
+        [10123, 10500],
+        [10127, 9500],
+    ]
+    assert quantized["features"][2]["geometry"]["coordinates"][0][:2] == [
+        [0, 0],
+        [0, 5000],
+    ]
+    assert quantized["features"][3]["geometry"] is None
+    assert "transform" not in fc
+
+    decoded = dequantize(quantized)
+    assert decoded["features"][1]["geometry"]["coordinates"] == [
+        [10.123, 10.5],
+        [20.25, 20],
+    ]
+    assert decoded["features"][2] == fc["features"][2]
+    assert decoded["properties"] == {"source": "test"}
+
+
+def test_payload_sizes():
+    line = Feature(
+        geometry=LineString([[i / 7, i / 3] for i in range(-500, 500)]),
+        properties={"name": "a"},
+    )
+    sizes = payload_sizes(line, 3)
+    assert sizes["original"] > sizes["truncated"] > sizes["quantized"]
+    assert sizes["quantized"] == len(json.dumps(quantize(line, 3), separators=(",", ":")))
+
+
+def test_write_features(tmp_path):
+    fc = make_collection()
+    path = tmp_path / "fc.geojson"
+
+    # generators of features are written in chunks
+    assert write_features(iter(fc["features"]), path, chunk_size=3, buffer_size=1) == 4
+    assert list(read_features(path)) == fc["features"]
+
+    target = io.StringIO()
+    assert write_features([], target) == 0
+    assert json.loads(target.getvalue()) == {"type": "FeatureCollection", "features": []}
+
+
+def test_write_features_precision():
+    fc = make_collection()
+    fc["features"][1]["geometry"]["coordinates"] = [[1 / 3, 2 / 3], [1, 2]]
+    fc["features"][0]["properties"]["value"] = np.float64(0.5)
+
+    target = io.BytesIO()
+    write_features(fc["features"], target, precision=3)
+    features = json.loads(target.getvalue())["features"]
+    assert features[1]["geometry"]["coordinates"] == [[0.333, 0.667], [1, 2]]
+    assert features[0]["properties"]["value"] == 0.5
+    # the features are not modified
+    assert fc["features"][1]["geometry"]["coordinates"][0][0] == 1 / 3
+
+    target = io.StringIO()
+    write_seq(fc["features"][1:2], target, precision=1)
+    assert json.loads(target.getvalue())["geometry"]["coordinates"] == [
+        [0.3, 0.7],
+        [1, 2],
+    ]
+
+
+def test_write_features_socket():
+    sender, receiver = socket.socketpair()
+    received = []
+
+    def receive():
+        received.append(b"".join(iter(lambda: receiver.recv(1 << 16), b"")))
+
+    thread = threading.Thread(target=receive)
+    thread.start()
+    with sender:
+        write_features(make_collection()["features"], sender)
+    thread.join()
+    receiver.close()
+    assert json.loads(received[0])["features"] == make_collection()["features"]
+
+
+def test_write_columns():
+    target = io.StringIO()
+    coordinates = np.array([[1 / 3, 1.0], [2.0, 2 / 3], [3.0, 3.0]])
+    properties = {"id": np.arange(3), "name": np.array(["a", "b", None], dtype=object)}
+    count = write_columns(
+        coordinates, target, properties=properties, precision=2, chunk_size=2
+    )
+    assert count == 3
+    assert json.loads(target.getvalue())["features"] == [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [0.33, 1.0]},
+            "properties": {"id": 0, "name": "a"},
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [2.0, 0.67]},
+            "properties": {"id": 1, "name": "b"},
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [3.0, 3.0]},
+            "properties": {"id": 2, "name": None},
+        },
+    ]
+
+    target = io.StringIO()
+    rings = np.array([[[0, 0], [1, 0], [1, 1], [0, 0]]] * 2)
+    write_columns(rings, target, "Polygon")
+    features = json.loads(target.getvalue())["features"]
+    assert features[1]["geometry"] == {
+        "type": "Polygon",
+        "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+    }
+
+    with pytest.raises(Exception, match="should have 3 dimensions"):
+        write_columns(coordinates, target, "LineString")
+    with pytest.raises(Exception, match="one value per row"):
+        write_columns(coordinates, target, properties={"id": [1]})
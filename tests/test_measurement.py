@@ -1,3 +1,6 @@
+import geopandas as gpd
+import numpy as np
+import pytest
 from geojson import (
     Feature,
     FeatureCollection,
@@ -9,15 +12,23 @@ from geojson import (
     Point,
     Polygon,
 )
+from shapely.geometry import shape
 
 from turfpy.measurement import (
     along,
+    area,
     bbox,
     bbox_polygon,
+    bearing,
     boolean_point_in_polygon,
     center,
+    centroid,
     destination,
+    distance,
     envelope,
+    explode,
+    great_circle,
+    great_circles,
     length,
     midpoint,
     nearest_point,
@@ -240,6 +251,43 @@ def test_length():
     assert round(lens, 4) == 2738.9664
 
 
+def test_geometry_array_measurements():
+    geometries = [
+        Polygon(
+            [[(0, 0), (0, 5), (5, 5), (5, 0), (0, 0)], [(1, 1), (2, 1), (2, 2), (1, 1)]]
+        ),
+        MultiPolygon(
+            [
+                ([(10, 10), (10, 11), (11, 11), (10, 10)],),
+                ([(0, 0), (1, 0), (0, 1), (0, 0)],),
+            ]
+        ),
+        LineString([(115, -32), (131, -22), (143, -25), (150, -34)]),
+        MultiLineString([[(0, 0), (1, 1)], [(5, 5), (6, 7), (8, 8)]]),
+        Point((1.5, 2.5)),
+        MultiPoint([(0, 0), (1, 1)]),
+    ]
+    series = gpd.GeoSeries([shape(g) for g in geometries] + [None], index=range(10, 17))
+    frame = gpd.GeoDataFrame({"value": range(7)}, geometry=series, index=series.index)
+
+    for data in [series, frame, np.asarray(series.values)]:
+        areas = np.asarray(area(data))
+        lengths = np.asarray(length(data, units="mi"))
+        centroids = np.asarray(centroid(data))
+
+        for i, geometry in enumerate(geometries):
+            assert np.isclose(areas[i], area(geometry))
+            assert np.isclose(lengths[i], length(geometry, units="mi"))
+            assert np.allclose(
+                centroids[i].coords[0], centroid(geometry)["geometry"]["coordinates"]
+            )
+        assert np.isnan(areas[-1]) and np.isnan(lengths[-1]) and centroids[-1] is None
+
+    assert list(area(series).index) == list(series.index)
+    assert isinstance(centroid(frame), gpd.GeoSeries)
+    assert isinstance(area(np.asarray(series.values)), np.ndarray)
+
+
 def test_destination():
     origin = Feature(geometry=Point((-75.343, 39.984)))
     distance = 50
@@ -352,6 +400,11 @@ def test_points_within_polygon():
                 "properties": {},
                 "type": "Feature",
             },
+            {
+                "geometry": {"coordinates": [-46.663, -23.554], "type": "Point"},
+                "properties": {},
+                "type": "Feature",
+            },
             {
                 "geometry": {"coordinates": [-46.643, -23.557], "type": "Point"},
                 "properties": {},
@@ -380,3 +433,84 @@ def test_points_within_polygon():
         ],
         "type": "FeatureCollection",
     }
+
+
+def test_explode_feature_collection():
+    fc = FeatureCollection(
+        [
+            Feature(geometry=LineString([(0, 0), (1, 1)])),
+            Feature(geometry=LineString([(2, 2), (3, 3), (4, 4)])),
+        ]
+    )
+    result = explode(fc)
+    assert [f["geometry"]["coordinates"] for f in result["features"]] == [
+        [0, 0],
+        [1, 1],
+        [2, 2],
+        [3, 3],
+        [4, 4],
+    ]
+
+
+def test_great_circle():
+    start = Feature(geometry=Point((-122, 48)))
+    end = Feature(geometry=Point((-77, 39)))
+    route = great_circle(start, end, npoints=5, properties={"name": "route"})
+    assert route["geometry"]["type"] == "LineString"
+    assert route["properties"] == {"name": "route"}
+    # every point is on the route at its fraction of the distance
+    total, initial = distance(start, end), bearing(start, end)
+    for i, position in enumerate(route["geometry"]["coordinates"]):
+        expected = destination(start, total * i / 4, initial)["geometry"]["coordinates"]
+        assert np.allclose(position, expected, atol=1e-6)
+
+    # split at the antimeridian
+    route = great_circle([139.77, 35.68], [-118.41, 33.94], npoints=100)
+    first, second = route["geometry"]["coordinates"]
+    assert route["geometry"]["type"] == "MultiLineString"
+    assert len(first) + len(second) == 102
+    assert first[-1][0] == 180 and second[0][0] == -180
+    assert first[-1][1] == second[0][1]
+    # split with few points too, wherever the segment crossing the antimeridian is
+    for npoints in (2, 7, 10):
+        route = great_circle([139.77, 35.68], [-118.41, 33.94], npoints=npoints)
+        first, second = route["geometry"]["coordinates"]
+        assert len(first) + len(second) == npoints + 2
+        assert first[-1] == [180, second[0][1]] and second[0][0] == -180
+        assert max(abs(p[0]) for p in first + second) <= 180
+    # not split when crossing the prime meridian
+    route = great_circle([-5, 0], [5, 0], npoints=2)
+    assert route["geometry"]["type"] == "LineString"
+
+    with pytest.raises(Exception, match="antipodal"):
+        great_circle([0, 0], [180, 0])
+
+
+def test_great_circles():
+    starts = [[-122, 48], [139.77, 35.68], [5, 5]]
+    ends = [[-77, 39], [-118.41, 33.94], [5, 5]]
+    coordinates, offsets, routes = great_circles(starts, ends, 50, as_array=True)
+    assert coordinates.shape == (152, 2)
+    assert offsets.tolist() == [0, 50, 71, 102, 152]
+    assert routes.tolist() == [0, 1, 1, 2]
+    # identical points give a route staying on them
+    assert np.allclose(coordinates[102:], [5, 5])
+
+    fc = great_circles(
+        FeatureCollection([Feature(geometry=Point(p)) for p in starts]),
+        ends,
+        50,
+        properties={"id": np.arange(3)},
+    )
+    assert [f["geometry"]["type"] for f in fc["features"]] == [
+        "LineString",
+        "MultiLineString",
+        "LineString",
+    ]
+    assert [f["properties"] for f in fc["features"]] == [{"id": 0}, {"id": 1}, {"id": 2}]
+    assert (
+        fc["features"][0]["geometry"] == great_circle(starts[0], ends[0], 50)["geometry"]
+    )
+
+    with pytest.raises(Exception, match="same number"):
+        great_circles(starts, ends[:2])
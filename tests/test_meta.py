@@ -0,0 +1,47 @@
+"""
+Test module for meta.
+"""
+
+from geojson import Feature, FeatureCollection, LineString, MultiPolygon, Point
+
+from turfpy.meta import coord_each, geom_each
+
+
+def test_coord_each_indices():
+    fc = FeatureCollection(
+        [
+            Feature(geometry=Point((0, 0))),
+            Feature(geometry=LineString([(0, 0), (1, 1), (2, 2)])),
+            Feature(
+                geometry=MultiPolygon(
+                    [
+                        ([(0, 0), (0, 1), (1, 1), (0, 0)],),
+                        ([(5, 5), (5, 6), (6, 6), (5, 5)],),
+                    ]
+                )
+            ),
+        ]
+    )
+    indices = []
+
+    def _callback(coord, coord_index, feature_index, multi_feature_index, geometry_index):
+        indices.append((coord_index, feature_index, multi_feature_index))
+
+    coord_each(fc, _callback)
+
+    assert [i[0] for i in indices] == list(range(12))
+    assert [i[1] for i in indices] == [0, 1, 1, 1] + [2] * 8
+    assert [i[2] for i in indices] == [0, 0, 0, 0] + [0] * 4 + [1] * 4
+
+
+def test_geom_each_feature_index():
+    fc = FeatureCollection([Feature(geometry=Point((i, i))) for i in range(4)])
+    indices = []
+
+    def _callback(geometry, feature_index, properties, bbox, feature_id):
+        indices.append(feature_index)
+        return True
+
+    geom_each(fc, _callback)
+
+    assert indices == [0, 1, 2, 3]
@@ -1,7 +1,14 @@
-from geojson import Feature, LineString, Point
+from geojson import Feature, LineString, Point, Polygon
 from pytest import approx
 
-from turfpy.misc import line_intersect, line_segment, line_slice, nearest_point_on_line
+from turfpy.misc import (
+    line_intersect,
+    line_segment,
+    line_slice,
+    nearest_point_on_line,
+    segment_array,
+    segment_intersections,
+)
 
 
 def test_line_intersect():
@@ -15,6 +22,50 @@ def test_line_intersect():
     assert li["features"][0]["geometry"]["coordinates"] == [127.434783, -15.782609]
 
 
+def test_line_intersect_multiple_segments():
+    poly = Feature(
+        geometry=Polygon(
+            [
+                [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]],
+                [[2, 2], [2, 4], [4, 4], [4, 2], [2, 2]],
+            ]
+        )
+    )
+    line = Feature(geometry=LineString([[-1, 3], [11, 3], [5, -5]]))
+
+    li = line_intersect(poly, line)
+
+    assert sorted(f["geometry"]["coordinates"] for f in li["features"]) == [
+        [0.0, 3.0],
+        [2.0, 3.0],
+        [4.0, 3.0],
+        [8.75, 0.0],
+        [10.0, 1.666667],
+        [10.0, 3.0],
+    ]
+
+
+def test_segment_intersections():
+    s1 = segment_array(LineString([[0, 0], [4, 4], [8, 0]]))
+    s2 = segment_array(LineString([[0, 2], [8, 2]]))
+
+    assert s1.shape == (2, 2, 2)
+    assert s1[0].tolist() == [[4, 4], [0, 0]]
+
+    points, pairs, point_index = segment_intersections(s1, s2)
+
+    assert points.tolist() == [[2, 2], [6, 2]]
+    assert pairs.tolist() == [[0, 0], [1, 0]]
+    assert point_index.tolist() == [0, 1]
+
+    points, pairs, point_index = segment_intersections(
+        s1, segment_array(LineString([[0, 0], [4, 4]]))
+    )
+    assert len(points) == 1
+    assert pairs.tolist() == [[0, 0], [1, 0]]
+    assert point_index.tolist() == [-1, 0]
+
+
 def test_line_segment():
     poly = {
         "type": "Feature",
@@ -0,0 +1,118 @@
+"""
+Test module for the shared executor.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import shapely
+from geojson import Feature, FeatureCollection, Point, Polygon
+
+from turfpy import parallel
+from turfpy.boolean import intersects_join
+from turfpy.measurement import points_within_polygon
+from turfpy.transformation import overlay
+
+
+def _total(start, stop, values, weights, factor):
+    return float((values[start:stop] * weights[start:stop]).sum()) * factor
+
+
+def test_map_chunks():
+    values = np.arange(1000.0)
+    weights = np.full(1000, 2.0)
+    expected = float(values.sum()) * 2 * 3
+
+    parallel.configure(n_jobs=2)
+    try:
+        executor = parallel.get_executor()
+        results = parallel.map_chunks(_total, 1000, [values, weights], (3,), n_jobs=4)
+        assert len(results) == 4
+        assert sum(results) == expected
+        # the executor is reused by every call
+        parallel.map_chunks(_total, 1000, [values, weights], (3,))
+        assert parallel.get_executor() is executor
+
+        parallel.configure(kind="thread")
+        assert isinstance(parallel.get_executor(), ThreadPoolExecutor)
+        assert sum(parallel.map_chunks(_total, 1000, [values, weights], (3,))) == expected
+    finally:
+        parallel.configure()
+        parallel.shutdown()
+
+    assert parallel.map_chunks(_total, 1000, [values, weights], (3,), n_jobs=1) == [
+        expected
+    ]
+
+
+def test_pack_geometries():
+    geoms = np.array([shapely.Point(1, 2), None, shapely.box(0, 0, 1, 1)], dtype=object)
+    buffer, offsets = parallel.pack_geometries(geoms)
+    assert buffer.dtype == np.uint8
+    assert len(offsets) == 4
+
+    unpacked = parallel.unpack_geometries(buffer, offsets)
+    assert unpacked[0].equals(geoms[0])
+    assert unpacked[1] is None
+    assert unpacked[2].equals(geoms[2])
+    assert len(parallel.unpack_geometries(buffer, offsets, 1, 3)) == 2
+
+
+def test_executor_argument():
+    square = Polygon([[(0, 0), (0, 10), (10, 10), (10, 0), (0, 0)]])
+    points = FeatureCollection(
+        [Feature(geometry=Point((x, x)), properties={"x": x}) for x in range(-5, 15)]
+    )
+    zones = FeatureCollection([Feature(geometry=square, properties={"zone": 1})])
+    parcels = FeatureCollection(
+        [
+            Feature(
+                geometry=Polygon([[(x, 0), (x, 2), (x + 2, 2), (x + 2, 0), (x, 0)]]),
+                properties={"parcel": x},
+            )
+            for x in range(-4, 14, 3)
+        ]
+    )
+
+    expected_points = points_within_polygon(points, zones, n_jobs=1)
+    assert [f["properties"]["x"] for f in expected_points["features"]] == list(range(11))
+    expected_overlay = overlay(parcels, zones)
+    expected_join = intersects_join(points, parcels)
+
+    with ThreadPoolExecutor(2) as executor:
+        assert points_within_polygon(points, zones, executor=executor) == expected_points
+        assert overlay(parcels, zones, executor=executor) == expected_overlay
+        left_idx, right_idx = intersects_join(points, parcels, executor=executor)
+
+    assert np.array_equal(left_idx, expected_join[0])
+    assert np.array_equal(right_idx, expected_join[1])
+
+    # process workers of the shared executor
+    assert points_within_polygon(points, zones, points_per_chunk=5) == expected_points
+    with pytest.warns(DeprecationWarning, match="chunk_size"):
+        assert points_within_polygon(points, zones, chunk_size=1) == expected_points
+    left_idx, right_idx = intersects_join(points, parcels, n_jobs=3, chunk_size=7)
+    assert np.array_equal(left_idx, expected_join[0])
+    assert np.array_equal(right_idx, expected_join[1])
+
+
+def test_points_within_polygon_several_polygons():
+    squares = FeatureCollection(
+        [
+            Feature(
+                geometry=Polygon([[(x, 0), (x, 1), (x + 1, 1), (x + 1, 0), (x, 0)]]),
+                properties={"zone": x},
+            )
+            for x in range(0, 30, 3)
+        ]
+    )
+    points = FeatureCollection(
+        [Feature(geometry=Point((x + 0.5, 0.5)), properties={"x": x}) for x in range(30)]
+    )
+
+    expected = points_within_polygon(points, squares, n_jobs=1)
+    assert [f["properties"]["x"] for f in expected["features"]] == list(range(0, 30, 3))
+    assert points_within_polygon(points, squares, points_per_chunk=4) == expected
+    with ThreadPoolExecutor(2) as executor:
+        assert points_within_polygon(points, squares, executor=executor) == expected
@@ -0,0 +1,120 @@
+"""
+Test module for pipeline.
+"""
+
+import io
+from functools import partial
+
+import numpy as np
+import pytest
+from geojson import Feature, Polygon
+
+from turfpy.io import read_seq, write_seq
+from turfpy.measurement import area
+from turfpy.pipeline import Pipeline, as_property
+from turfpy.transformation import bbox_clip, transform_rotate
+
+
+def make_features(count):
+    return [
+        Feature(
+            geometry=Polygon([[(i, 0), (i, 1), (i + 1, 1), (i + 1, 0), (i, 0)]]),
+            properties={"index": i},
+        )
+        for i in range(count)
+    ]
+
+
+def expected(features):
+    results = []
+    for feature in features:
+        feature = bbox_clip(feature, [0, 0, 20, 10])
+        if feature is not None:
+            feature = transform_rotate(feature, 90)
+            feature["properties"]["area"] = area(feature)
+            results.append(feature)
+    return results
+
+
+OPERATIONS = (
+    partial(bbox_clip, bbox=[0, 0, 20, 10]),
+    partial(transform_rotate, angle=90),
+    as_property(area, "area"),
+)
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_pipeline_map(n_jobs):
+    features = make_features(30)
+
+    with Pipeline(*OPERATIONS, n_jobs=n_jobs, chunk_size=4, max_pending=2) as pipeline:
+        results = list(pipeline.map(iter(features)))
+        assert results == expected(features)
+        assert [f["properties"]["index"] for f in results] == list(range(20))
+
+        # the pool is reused by the following calls
+        executor = pipeline.executor
+        assert list(pipeline.map(features[:3])) == expected(features[:3])
+        assert pipeline.executor is executor
+
+        stats = pipeline.stats
+        assert stats["features_in"] == 33
+        assert stats["features_out"] == 23
+        assert stats["chunks"] == 9
+
+    assert pipeline.executor is None
+    assert "area" not in features[0]["properties"]
+
+
+def test_pipeline_run():
+    features = make_features(25)
+    source = io.StringIO()
+    write_seq(features, source, record_separator=True)
+    source.seek(0)
+    target = io.StringIO()
+
+    with Pipeline(*OPERATIONS, n_jobs=2, chunk_size=3) as pipeline:
+        stats = pipeline.run(source, target)
+
+    target.seek(0)
+    assert list(read_seq(target)) == expected(features)
+    assert stats["features_in"] == 25
+    assert stats["features_out"] == 20
+
+
+def test_pipeline_interleaved():
+    features = make_features(6)
+    first = Pipeline(as_property(lambda f: "A", "name"), n_jobs=1, chunk_size=2)
+    second = Pipeline(as_property(lambda f: "B", "name"), n_jobs=1, chunk_size=2)
+
+    names = [
+        (a["properties"]["name"], b["properties"]["name"])
+        for a, b in zip(first.map(features), second.map(features))
+    ]
+    assert names == [("A", "B")] * 6
+
+
+def _numpy_properties(feature):
+    result = dict(feature)
+    result["properties"] = {"value": np.float64(1.5), "values": np.arange(2)}
+    return result
+
+
+def test_pipeline_run_numpy_values():
+    features = make_features(3)
+    source = io.StringIO()
+    write_seq(features, source)
+    source.seek(0)
+    target = io.StringIO()
+
+    with Pipeline(_numpy_properties, n_jobs=1) as pipeline:
+        pipeline.run(source, target)
+
+    expected = io.StringIO()
+    write_seq(map(_numpy_properties, features), expected)
+    assert target.getvalue() == expected.getvalue()
+    assert (
+        target.getvalue()
+        .splitlines()[0]
+        .endswith('"properties":{"value":1.5,"values":[0,1]}}')
+    )
@@ -2,10 +2,21 @@
 Test module for randoms.
 """
 
-from geojson import Feature, Point
+import numpy as np
+import pytest
+from geojson import Feature, Point, Polygon
+from shapely.geometry import shape
 
-from turfpy.measurement import bbox, boolean_point_in_polygon
-from turfpy.random import random_points, random_position
+from turfpy.measurement import bbox, bbox_polygon, boolean_point_in_polygon
+from turfpy.random import (
+    iter_random_points,
+    random_line_strings,
+    random_points,
+    random_points_in_polygon,
+    random_polygons,
+    random_position,
+    spawn_seeds,
+)
 
 
 def test_random_position():
@@ -54,3 +65,98 @@ def test_random_points():
     assert len(pos["features"]) == 3
     for point in pos["features"]:
         assert boolean_point_in_polygon(point=point, polygon=data)
+
+
+def test_random_points_seed():
+    bbox = [11.953125, 18.979025953255267, 52.03125, 46.558860303117164]
+    coords = random_points(count=1000, bbox=bbox, seed=42, as_array=True)
+    assert coords.shape == (1000, 2)
+    assert (coords >= bbox[:2]).all() and (coords <= bbox[2:]).all()
+    assert np.array_equal(coords, random_points(1000, bbox, seed=42, as_array=True))
+
+    fc = random_points(count=3, bbox=bbox, seed=42)
+    assert fc == random_points(count=3, bbox=bbox, seed=42)
+    assert fc["features"][0]["geometry"]["coordinates"] == [
+        round(c, 6) for c in coords[0].tolist()
+    ]
+
+
+def test_iter_random_points():
+    chunks = list(iter_random_points(count=10, seed=7, chunk_size=4, as_array=True))
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert np.array_equal(
+        np.concatenate(chunks), random_points(count=10, seed=7, as_array=True)
+    )
+    chunks = list(iter_random_points(count=5, seed=7, chunk_size=4))
+    assert [len(c["features"]) for c in chunks] == [4, 1]
+
+
+def test_spawn_seeds():
+    seeds = spawn_seeds(42, 2)
+    first = random_points(count=5, seed=seeds[0], as_array=True)
+    assert np.array_equal(
+        first, random_points(5, seed=spawn_seeds(42, 2)[0], as_array=True)
+    )
+    assert not np.array_equal(first, random_points(5, seed=seeds[1], as_array=True))
+
+
+def test_random_points_in_polygon():
+    polygon = Feature(
+        geometry=Polygon(
+            [[(0, 0), (10, 0), (0, 10), (0, 0)], [(1, 1), (1, 3), (3, 1), (1, 1)]]
+        )
+    )
+    for method in ["rejection", "triangulation"]:
+        fc = random_points_in_polygon(polygon, count=200, seed=1, method=method)
+        assert len(fc["features"]) == 200
+        for point in fc["features"]:
+            assert boolean_point_in_polygon(point=point, polygon=polygon)
+        assert fc == random_points_in_polygon(polygon, 200, seed=1, method=method)
+
+    thin = Feature(geometry=Polygon([[(0, 0), (10, 10), (10, 10.01), (0, 0)]]))
+    coords = random_points_in_polygon(thin, count=100, seed=1, as_array=True)
+    assert coords.shape == (100, 2)
+    for coord in coords.tolist():
+        assert boolean_point_in_polygon(point=coord, polygon=thin)
+
+
+def test_random_line_strings():
+    bbox = [0, 0, 10, 10]
+    fc = random_line_strings(count=5, num_vertices=4, max_length=1, bbox=bbox, seed=3)
+    assert len(fc["features"]) == 5
+    for line in fc["features"]:
+        assert line["geometry"]["type"] == "LineString"
+        assert len(line["geometry"]["coordinates"]) == 4
+        assert boolean_point_in_polygon(
+            point=line["geometry"]["coordinates"][0], polygon=bbox_polygon(bbox)
+        )
+
+    coords = random_line_strings(100, 6, max_length=1, seed=3, as_array=True)
+    assert coords.shape == (100, 6, 2)
+    steps = np.linalg.norm(np.diff(coords, axis=1), axis=2)
+    assert (steps <= 1).all()
+
+
+def test_random_polygons():
+    bbox = [0, 0, 10, 10]
+    fc = random_polygons(count=50, num_vertices=6, max_radial_length=1, bbox=bbox, seed=3)
+    assert len(fc["features"]) == 50
+    for polygon in fc["features"]:
+        ring = polygon["geometry"]["coordinates"][0]
+        assert len(ring) == 7
+        assert ring[0] == ring[-1]
+        geom = shape(polygon["geometry"])
+        assert geom.is_valid
+        assert shape(bbox_polygon(bbox)["geometry"]).contains(geom)
+
+    coords = random_polygons(100, 5, seed=3, as_array=True)
+    assert coords.shape == (100, 6, 2)
+
+    # the bbox is exactly filled, or too small for the polygons
+    fc = random_polygons(20, 5, max_radial_length=1, bbox=[0, 0, 2, 2], seed=3)
+    for polygon in fc["features"]:
+        assert shape(bbox_polygon([0, 0, 2, 2])["geometry"]).covers(
+            shape(polygon["geometry"])
+        )
+    with pytest.raises(Exception, match="max_radial_length"):
+        random_polygons(5, max_radial_length=1, bbox=[0, 0, 1.5, 10])
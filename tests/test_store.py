@@ -0,0 +1,112 @@
+"""
+Test module for store.
+"""
+
+import pickle
+
+import numpy as np
+from geojson import Feature, FeatureCollection
+
+from turfpy.io import read_seq, write_seq
+from turfpy.measurement import area, bbox, centroid, length
+from turfpy.random import random_line_strings, random_polygons
+from turfpy.store import open_store, write_store
+
+
+def make_features():
+    features = list(random_polygons(10, bbox=[-10, -10, 10, 10], seed=1)["features"])
+    features += list(random_line_strings(5, seed=2)["features"])
+    features += [
+        Feature(geometry={"type": "Point", "coordinates": [1.5, 2.5]}, id=3),
+        Feature(
+            geometry={"type": "MultiPoint", "coordinates": [[0, 0], [1, 1]]},
+            properties={"name": "b"},
+        ),
+        Feature(
+            geometry={
+                "type": "MultiLineString",
+                "coordinates": [[[0, 0], [1, 1]], [[5, 5], [6, 7], [8, 8]]],
+            }
+        ),
+        Feature(
+            geometry={
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [
+                        [[0, 0], [0, 5], [5, 5], [5, 0], [0, 0]],
+                        [[1, 1], [2, 1], [2, 2], [1, 1]],
+                    ],
+                    [[[10, 10], [10, 11], [11, 11], [10, 10]]],
+                ],
+            },
+            properties={"name": "a", "values": [1, 2]},
+            id="x",
+        ),
+        Feature(geometry=None, properties={"name": None}),
+    ]
+    return features
+
+
+def test_write_store(tmp_path):
+    features = make_features()
+    store = write_store(FeatureCollection(features), tmp_path / "store", chunk_size=3)
+
+    assert len(store) == len(features)
+    assert isinstance(store.coords, np.memmap)
+    assert list(store) == features
+    assert store[-1] == features[-1]
+
+    store = pickle.loads(pickle.dumps(store))
+    assert store[3] == features[3]
+
+    source = tmp_path / "features.geojsons"
+    write_seq(features, source)
+    assert list(write_store(read_seq(source), tmp_path / "seq")) == features
+
+
+def test_store_measurements(tmp_path):
+    features = make_features()
+    write_store(features, tmp_path)
+    store = open_store(tmp_path)
+
+    for chunk_size in [1, 4, 100]:
+        areas = store.area(chunk_size)
+        lengths = store.length("m", chunk_size)
+        centroids = store.centroid(chunk_size)
+        boxes = store.bbox(chunk_size)
+
+        for i, feature in enumerate(features[:-1]):
+            assert np.isclose(areas[i], area(feature))
+            assert np.isclose(lengths[i], length(feature, "m"))
+            assert np.allclose(centroids[i], centroid(feature)["geometry"]["coordinates"])
+            assert np.allclose(boxes[i], bbox(feature))
+
+        assert areas[-1] == 0 and lengths[-1] == 0
+        assert np.isnan(centroids[-1]).all() and np.isnan(boxes[-1]).all()
+
+
+def test_empty_store(tmp_path):
+    store = write_store([], tmp_path)
+
+    assert len(store) == 0
+    assert store.area().shape == (0,)
+    assert store.bbox().shape == (0, 4)
+
+
+def test_store_query(tmp_path):
+    features = make_features()
+    store = write_store(features, tmp_path / "store")
+    box = [0, 0, 2, 2]
+
+    expected = [
+        i
+        for i, f in enumerate(features)
+        if f["geometry"]
+        and (lambda b: b[0] <= 2 and b[2] >= 0 and b[1] <= 2 and b[3] >= 0)(bbox(f))
+    ]
+    assert store.query(box).tolist() == expected
+
+    store.write_index(node_capacity=4)
+    store = open_store(tmp_path / "store")
+    assert isinstance(store.index.boxes, np.memmap)
+    assert store.query(box).tolist() == expected
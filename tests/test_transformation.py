@@ -2,17 +2,28 @@
 Test module for transformations.
 """
 
+import copy
+import math
+
+import geopandas as gpd
+import numpy as np
+import pytest
+import shapely
 from geojson import (
     Feature,
     FeatureCollection,
     LineString,
     MultiLineString,
+    MultiPoint,
+    MultiPolygon,
     Point,
     Polygon,
 )
+from shapely.geometry import shape
 
 from turfpy.transformation import (
     bbox_clip,
+    bbox_clip_many,
     bezier_spline,
     circle,
     concave,
@@ -21,10 +32,13 @@ from turfpy.transformation import (
     dissolve,
     intersect,
     line_offset,
+    overlay,
+    simplify,
     tesselate,
     transform_rotate,
     transform_scale,
     transform_translate,
+    truncate,
     union,
     voronoi,
 )
@@ -66,10 +80,56 @@ def test_bbox_clip():
     assert clip.type == "Polygon"
     assert len(clip.coordinates[0]) == 6
     assert clip.coordinates == [
-        [[10.0, 6.0], [10.0, 7.777778], [3.0, 7.0], [2.0, 2.0], [8.0, 4.0], [10.0, 6.0]]
+        [[2.0, 2.0], [8.0, 4.0], [10.0, 6.0], [10.0, 7.777778], [3.0, 7.0], [2.0, 2.0]]
     ]
 
 
+def test_bbox_clip_holes():
+    f = Feature(
+        geometry=Polygon(
+            [
+                [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)],
+                [(2, 2), (2, 4), (4, 4), (4, 2), (2, 2)],
+            ]
+        )
+    )
+    clip = bbox_clip(f, [1, 1, 9, 9])["geometry"]
+    exterior, hole = (shapely.LinearRing(ring) for ring in clip["coordinates"])
+    # right-hand rule, exterior counter-clockwise and holes clockwise
+    assert exterior.is_ccw
+    assert not hole.is_ccw
+    assert sorted(map(tuple, clip["coordinates"][1])) == sorted(
+        [(2, 2), (2, 4), (4, 4), (4, 2), (2, 2)]
+    )
+
+    multi = Feature(
+        geometry=MultiPolygon(
+            [
+                f["geometry"]["coordinates"],
+                [[(20, 0), (20, 5), (25, 5), (25, 0), (20, 0)]],
+            ]
+        )
+    )
+    clip = bbox_clip(multi, [1, 1, 22, 9])["geometry"]
+    rings = [shapely.LinearRing(ring) for part in clip["coordinates"] for ring in part]
+    assert [ring.is_ccw for ring in rings] == [True, False, True]
+
+
+def test_bbox_clip_many():
+    f1 = Feature(
+        geometry=Polygon([[[2, 2], [8, 4], [12, 8], [3, 7], [2, 2]]]),
+        properties={"name": "poly"},
+    )
+    f2 = Feature(geometry=LineString([[-5, 5], [15, 5]]), properties={"name": "line"})
+    f3 = Feature(geometry=Point([50, 50]), properties={"name": "outside"})
+    fc = bbox_clip_many(FeatureCollection([f1, f2, f3]), [0, 0, 10, 10])
+    assert len(fc["features"]) == 2
+    assert fc["features"][0]["properties"] == {"name": "poly"}
+    assert fc["features"][0]["geometry"] == bbox_clip(f1, [0, 0, 10, 10])["geometry"]
+    assert fc["features"][1]["properties"] == {"name": "line"}
+    assert fc["features"][1]["geometry"]["coordinates"] == [[0.0, 5.0], [10.0, 5.0]]
+
+
 def test_intersection():
     f = Feature(
         geometry={
@@ -308,6 +368,47 @@ def test_difference():
     ]
 
 
+def test_overlay():
+    zones = FeatureCollection(
+        [
+            Feature(
+                geometry=Polygon([[[0, 0], [0, 2], [2, 2], [2, 0], [0, 0]]]),
+                properties={"zone": "A"},
+            ),
+            Feature(
+                geometry=Polygon([[[10, 10], [10, 12], [12, 12], [12, 10], [10, 10]]]),
+                properties={"zone": "B"},
+            ),
+        ]
+    )
+    parcels = FeatureCollection(
+        [
+            Feature(
+                geometry=Polygon([[[1, 1], [1, 3], [3, 3], [3, 1], [1, 1]]]),
+                properties={"parcel": 1},
+            ),
+            Feature(
+                geometry=Polygon([[[5, 5], [5, 6], [6, 6], [6, 5], [5, 5]]]),
+                properties={"parcel": 2},
+            ),
+        ]
+    )
+
+    inter = overlay(zones, parcels, how="intersection")
+    assert len(inter["features"]) == 1
+    assert inter["features"][0]["properties"] == {"zone": "A", "parcel": 1}
+    expected = intersect([zones["features"][0], parcels["features"][0]])
+    assert shape(inter["features"][0]["geometry"]).equals(shape(expected["geometry"]))
+
+    diff = overlay(zones, parcels, how="difference")
+    assert len(diff["features"]) == 2
+    expected = difference(zones["features"][0], parcels["features"][0])
+    assert shape(diff["features"][0]["geometry"]).equals(shape(expected["geometry"]))
+    assert diff["features"][1]["properties"] == {"zone": "B"}
+
+    assert overlay(zones, parcels, how="difference", n_jobs=2) == diff
+
+
 def test_transform_rotate():
     f = Feature(geometry=Polygon([[[0, 29], [3.5, 29], [2.5, 32], [0, 29]]]))
     pivot = [0, 25]
@@ -324,6 +425,32 @@ def test_transform_rotate():
     ]
 
 
+def test_transform_rotate_geometry_array():
+    features = [
+        Feature(geometry=Polygon([[[0, 29], [3.5, 29], [2.5, 32], [0, 29]]])),
+        Feature(geometry=LineString([(115, -32), (131, -22), (143, -25)])),
+        Feature(geometry=Point((1.5, 2.5))),
+    ]
+    series = gpd.GeoSeries([shape(f["geometry"]) for f in features], crs=4326)
+    frame = gpd.GeoDataFrame({"value": range(3)}, geometry=series)
+
+    for pivot in [None, [0, 25]]:
+        expected = [
+            shapely.get_coordinates(shape(transform_rotate(f, 10, pivot)["geometry"]))
+            for f in features
+        ]
+        rotated = transform_rotate(series, 10, pivot)
+        assert isinstance(rotated, gpd.GeoSeries) and rotated.crs == series.crs
+        for geometry, coords in zip(
+            transform_rotate(frame, 10, pivot).geometry, expected
+        ):
+            assert np.allclose(shapely.get_coordinates(geometry), coords, atol=1e-6)
+
+    geometries = np.asarray(series.values).copy()
+    assert transform_rotate(geometries, 10, mutate=True) is geometries
+    assert not geometries[0].equals(series.iloc[0])
+
+
 def test_transform_translate():
 
     f = Feature(geometry=Polygon([[[0, 29], [3.5, 29], [2.5, 32], [0, 29]]]))
@@ -355,6 +482,20 @@ def test_transform_scale():
     ]
 
 
+def test_transform_scale_feature_collection():
+    fc = FeatureCollection(
+        [
+            Feature(geometry=Point((1, 1))),
+            Feature(geometry=LineString([(0, 0), (1, 1)])),
+        ]
+    )
+
+    result = transform_scale(fc, 2, origin=[0, 0])
+
+    assert result["features"][1]["geometry"]["coordinates"][0] == [0, 0]
+    assert result["features"][1]["geometry"]["coordinates"][1] != [1, 1]
+
+
 def test_tesselate():
     f = Feature(
         geometry={
@@ -404,6 +545,23 @@ def test_tesselate():
     }
 
 
+def test_tesselate_large_polygon():
+    # more than 80 vertices switches earcut to z-order hashing
+    ring = [
+        [round(10 * math.cos(a), 6), round(10 * math.sin(a), 6)]
+        for a in (2 * math.pi * i / 100 for i in range(100))
+    ]
+    f = Feature(geometry=Polygon([ring + [ring[0]]]))
+
+    result = tesselate(f)
+
+    assert len(result["features"]) == 98
+    assert math.isclose(
+        sum(shape(t["geometry"]).area for t in result["features"]),
+        shape(f["geometry"]).area,
+    )
+
+
 def test_line_offset_multilinestring():
     ls = Feature(
         geometry=MultiLineString(
@@ -1579,3 +1737,132 @@ def test_voronoi():
     }
     result2 = voronoi(points)
     assert result2["type"] == "Feature"
+
+
+def _douglas_peucker(positions, sq_tolerance):
+    # recursive reference implementation of simplify-js
+    def sq_distance(p, a, b):
+        x, y = a
+        dx, dy = b[0] - x, b[1] - y
+        if dx or dy:
+            t = ((p[0] - x) * dx + (p[1] - y) * dy) / (dx * dx + dy * dy)
+            if t > 1:
+                x, y = b
+            elif t > 0:
+                x, y = x + dx * t, y + dy * t
+        return (p[0] - x) ** 2 + (p[1] - y) ** 2
+
+    def step(first, last, kept):
+        farthest, index = sq_tolerance, None
+        for i in range(first + 1, last):
+            distance = sq_distance(positions[i], positions[first], positions[last])
+            if distance > farthest:
+                farthest, index = distance, i
+        if index is not None:
+            step(first, index, kept)
+            kept.append(positions[index])
+            step(index, last, kept)
+
+    kept = [positions[0]]
+    step(0, len(positions) - 1, kept)
+    return kept + [positions[-1]]
+
+
+def test_simplify():
+    f = Feature(
+        geometry=LineString(
+            [[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7.05], [6, 8]]
+        )
+    )
+    expected = [[0, 0], [2, -0.1], [3, 5], [6, 8]]
+    assert simplify(f, 0.5)["geometry"]["coordinates"] == expected
+    assert simplify(f, 0.5, method="visvalingam")["geometry"]["coordinates"] == expected
+    # the input is not modified
+    assert len(f["geometry"]["coordinates"]) == 7
+
+    walk = np.cumsum(np.random.default_rng(0).normal(size=(3000, 2)), axis=0).tolist()
+    result = simplify(LineString(walk), 2, high_quality=True)
+    assert result["coordinates"] == _douglas_peucker(LineString(walk)["coordinates"], 4)
+
+
+def test_simplify_polygons():
+    ring = [[0, 0], [1, 0.01], [2, 0], [2, 1], [2.01, 2], [1, 2], [0, 2], [0, 0]]
+    assert simplify(Polygon([ring]), 0.1)["coordinates"] == [
+        [[0, 0], [2, 0], [2.01, 2], [0, 2], [0, 0]]
+    ]
+    # rings stay closed with 3 distinct vertices whatever the tolerance
+    for method in ["douglas-peucker", "visvalingam"]:
+        result = simplify(Polygon([ring]), 100, method=method)
+        assert result["coordinates"] == [[[0, 0], [2.01, 2], [0, 2], [0, 0]]]
+
+    fc = FeatureCollection(
+        [
+            Feature(geometry=MultiPolygon([[ring], [ring[::-1]]]), properties={"a": 1}),
+            Feature(geometry=Point((1, 1))),
+        ]
+    )
+    result = simplify(fc, 0.1, method="visvalingam", mutate=True)
+    assert result is fc
+    assert [len(r) for p in fc["features"][0]["geometry"]["coordinates"] for r in p] == [
+        5,
+        5,
+    ]
+    assert fc["features"][1]["geometry"]["coordinates"] == [1, 1]
+
+
+def test_simplify_errors():
+    with pytest.raises(Exception, match="invalid tolerance"):
+        simplify(LineString([(0, 0), (1, 1)]), -1)
+    with pytest.raises(Exception, match="method should be one of"):
+        simplify(LineString([(0, 0), (1, 1)]), 1, method="radial")
+    with pytest.raises(Exception, match="invalid polygon"):
+        simplify(Polygon([[(0, 0), (1, 1), (0, 0)]]), 1)
+
+
+@pytest.mark.parametrize("func", [simplify, truncate])
+def test_copies_do_not_share_coordinates(func):
+    fc = FeatureCollection(
+        [
+            Feature(geometry=Point([1.5, 2.5])),
+            Feature(geometry=MultiPoint([[1.5, 2.5], [3.5, 4.5]])),
+            Feature(geometry=LineString([[0, 0], [1, 0.01], [2, 0]])),
+            Feature(geometry=Polygon([[(0, 0), (0, 1), (1, 1), (1, 0), (0, 0)]])),
+        ]
+    )
+    expected = copy.deepcopy(fc)
+    result = func(fc)
+
+    # mutating the result leaves the input unchanged
+    for feature in result["features"]:
+        coordinates = feature["geometry"]["coordinates"]
+        while isinstance(coordinates[0], list):
+            coordinates = coordinates[0]
+        coordinates[0] = 100
+    assert fc == expected
+
+
+def test_truncate():
+    f = Feature(geometry=Point([70.46923055566859, 58.11088890802906, 1508]))
+    assert truncate(f, 3)["geometry"]["coordinates"] == [70.469, 58.111]
+    assert truncate(f, 3, 3)["geometry"]["coordinates"] == [70.469, 58.111, 1508]
+    # the input is not modified
+    assert f["geometry"]["coordinates"] == [70.469231, 58.110889, 1508]
+
+    fc = FeatureCollection(
+        [
+            Feature(geometry=LineString([[1.123456, 2.654321, 3], [4.5, 5.55]])),
+            Feature(geometry=Polygon([[(0, 0), (0.333333, 0), (0.333333, 1.5), (0, 0)]])),
+            Feature(geometry=None),
+        ]
+    )
+    result = truncate(fc, 1, mutate=True)
+    assert result is fc
+    assert fc["features"][0]["geometry"]["coordinates"] == [[1.1, 2.7], [4.5, 5.6]]
+    assert fc["features"][1]["geometry"]["coordinates"] == [
+        [[0, 0], [0.3, 0], [0.3, 1.5], [0, 0]]
+    ]
+
+    with pytest.raises(Exception, match="precision"):
+        truncate(f, -1)
+    with pytest.raises(Exception, match="coordinates"):
+        truncate(f, 3, 1)
@@ -1,4 +1,11 @@
 """A Python library for performing geospatial data analysis which reimplements turf.js
 """
 
+import os
+
 from .__version__ import __version__  # noqa F401
+
+if os.environ.get("TURFPY_INSTRUMENTATION", "0") not in ("", "0"):
+    from turfpy import instrumentation
+
+    instrumentation.enable()
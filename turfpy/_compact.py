@@ -1,34 +1,31 @@
 """
 This module is used to check if set variables which
 can be used to check whether a dependency is installed
-or not.
+or not. Dependencies are looked up without being imported,
+so that importing turfpy stays cheap.
 """
 
-HAS_PYGEOS = None
+import sys
+from importlib.util import find_spec
 
-HAS_GEOPANDAS = None
+HAS_PYGEOS = find_spec("pygeos") is not None
 
-HAS_RTREE = None
+HAS_GEOPANDAS = find_spec("geopandas") is not None
 
-try:
-    import pygeos  # noqa
+HAS_RTREE = find_spec("rtree") is not None
 
-    HAS_PYGEOS = True
-except ImportError:
-    HAS_PYGEOS = False
 
+def is_geometry_array(obj) -> bool:
+    """
+    Checks if obj is a GeoSeries, a GeoDataFrame or an array of shapely geometries.
+    Modules are looked up in ``sys.modules`` as such objects cannot exist without
+    their module being imported.
+    """
+    geopandas = sys.modules.get("geopandas")
+    if geopandas is not None and isinstance(
+        obj, (geopandas.GeoSeries, geopandas.GeoDataFrame)
+    ):
+        return True
 
-try:
-    import geopandas  # noqa
-
-    HAS_GEOPANDAS = True
-except ImportError:
-    HAS_GEOPANDAS = False
-
-
-try:
-    import rtree  # noqa
-
-    HAS_RTREE = True
-except ImportError:
-    HAS_RTREE = False
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray) and obj.dtype == object
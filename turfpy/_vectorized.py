@@ -0,0 +1,345 @@
+"""
+This module implements vectorized versions of measurements and transformations
+working on arrays of coordinates and offsets instead of GeoJSON objects.
+
+Geometries are described by a ragged layout: every geometry is made of parts, each
+part made of rings, a ring being a run of coordinates. A Polygon has one part, a
+MultiLineString has one ring per part and a Point, a MultiPoint or a LineString has
+a single ring. It is the layout of :func:`shapely.to_ragged_array` with three levels
+of offsets, used for shapely arrays, GeoSeries and :mod:`turfpy.store`. Shapely is
+only imported by the functions converting shapely geometries.
+"""
+
+from typing import Any, Iterator, Optional, Tuple
+
+import numpy as np
+
+from turfpy.helper import radians_to_length
+from turfpy.meta import RADIUS
+
+# arrays describing a block of geometries, see layout
+Block = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def layout(
+    coords: np.ndarray,
+    ring_offsets: np.ndarray,
+    part_offsets: np.ndarray,
+    geom_offsets: np.ndarray,
+    types: np.ndarray,
+) -> Block:
+    """
+    Maps each ring to its geometry, offsets may be slices of larger offset arrays,
+    coords should then be the matching slice of coordinates.
+
+    :return: coords, ring offsets relative to coords, ring lengths, index of the
+        geometry of each ring, whether each ring is the first of its part and types.
+    """
+    geoms = np.asarray(geom_offsets)
+    parts = np.asarray(part_offsets[geoms[0] : geoms[-1] + 1])
+    rings = np.asarray(ring_offsets[parts[0] : parts[-1] + 1])
+
+    part_geom = np.repeat(np.arange(len(geoms) - 1), np.diff(geoms))
+    ring_part = np.repeat(np.arange(len(parts) - 1), np.diff(parts))
+
+    exterior = np.zeros(len(rings) - 1, dtype=bool)
+    exterior[parts[:-1][np.diff(parts) > 0] - parts[0]] = True
+
+    return (
+        coords,
+        rings - rings[0],
+        np.diff(rings),
+        part_geom[ring_part],
+        exterior,
+        np.asarray(types),
+    )
+
+
+def from_shapely(geoms: np.ndarray) -> Iterator[Tuple[np.ndarray, Block]]:
+    """
+    Converts an array of shapely geometries to blocks of the ragged layout, one by
+    family of geometry types since :func:`shapely.to_ragged_array` only accepts
+    geometries of the same family. Missing geometries are skipped.
+
+    :return: An iterator of indices in ``geoms`` and the block of these geometries.
+    """
+    import shapely
+
+    types = shapely.get_type_id(geoms)
+    if np.isin(types, [7]).any():
+        raise Exception("GeometryCollection is not supported")
+
+    # points and rings are single runs of coordinates
+    (index,) = np.nonzero(np.isin(types, [0, 2, 4]))
+    if len(index):
+        coords, coord_geom = shapely.get_coordinates(geoms[index], return_index=True)
+        counts = np.bincount(coord_geom, minlength=len(index))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        single = np.arange(len(index) + 1)
+        block_types = np.where(types[index] == 2, 1, types[index])
+        yield index, layout(coords, offsets, single, single, block_types)
+
+    for family in ([1, 5], [3, 6]):
+        (index,) = np.nonzero(np.isin(types, family))
+        if not len(index):
+            continue
+        geom_type, coords, offsets = shapely.to_ragged_array(
+            geoms[index], include_z=False
+        )
+        single = np.arange(len(index) + 1)
+        if geom_type == shapely.GeometryType.LINESTRING:
+            rings, parts, geom_offsets = offsets[0], single, single
+        elif geom_type == shapely.GeometryType.MULTILINESTRING:
+            rings, parts, geom_offsets = (
+                offsets[0],
+                np.arange(len(offsets[0])),
+                offsets[1],
+            )
+        elif geom_type == shapely.GeometryType.POLYGON:
+            rings, parts, geom_offsets = offsets[0], offsets[1], single
+        else:
+            rings, parts, geom_offsets = offsets
+        yield index, layout(coords, rings, parts, geom_offsets, types[index])
+
+
+def bbox(coords, rings, ring_lengths, ring_geom, exterior, types) -> np.ndarray:
+    """
+    :return: west, south, east, north of every geometry, NaN if it has no coordinates.
+    """
+    counts = np.bincount(ring_geom, ring_lengths, minlength=len(types))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+    result = np.full((len(types), 4), np.nan)
+    filled = counts > 0
+    if filled.any():
+        result[filled, :2] = np.minimum.reduceat(coords, starts[filled], axis=0)
+        result[filled, 2:] = np.maximum.reduceat(coords, starts[filled], axis=0)
+    return result
+
+
+def area(coords, rings, ring_lengths, ring_geom, exterior, types) -> np.ndarray:
+    """
+    :return: Area of every geometry in square meters, see
+        :func:`turfpy.measurement.area`.
+    """
+    # spherical excess of each ring, see turfpy.meta.ring_area
+    ring, local = _coord_index(rings, ring_lengths)
+    n = ring_lengths[ring]
+    lower = rings[ring] + local
+    middle = rings[ring] + (local + 1) % n
+    upper = rings[ring] + (local + 2) % n
+    terms = np.radians(coords[upper, 0] - coords[lower, 0]) * np.sin(
+        np.radians(coords[middle, 1])
+    )
+
+    ring_area = np.abs(np.bincount(ring, terms, minlength=len(ring_lengths)))
+    ring_area = ring_area * RADIUS * RADIUS / 2
+    ring_area[ring_lengths <= 2] = 0
+    ring_area[~exterior] *= -1
+    ring_area[~np.isin(types[ring_geom], [3, 6])] = 0
+    return np.bincount(ring_geom, ring_area, minlength=len(types))
+
+
+def length(coords, rings, ring_lengths, ring_geom, exterior, types) -> np.ndarray:
+    """
+    :return: Length of every geometry in radians, see
+        :func:`turfpy.measurement.length`.
+    """
+    # haversine distance of each segment, see turfpy.measurement.distance
+    ring, local = _coord_index(rings, ring_lengths)
+    segment = local < ring_lengths[ring] - 1
+    ring = ring[segment]
+    start = np.radians(coords[:-1][segment[:-1]])
+    end = np.radians(coords[1:][segment[:-1]])
+
+    a = np.sin((end[:, 1] - start[:, 1]) / 2) ** 2 + np.sin(
+        (end[:, 0] - start[:, 0]) / 2
+    ) ** 2 * np.cos(start[:, 1]) * np.cos(end[:, 1])
+    distances = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    distances[np.isin(types[ring_geom[ring]], [0, 4])] = 0
+    return np.bincount(ring_geom[ring], distances, minlength=len(types))
+
+
+def centroid(coords, rings, ring_lengths, ring_geom, exterior, types) -> np.ndarray:
+    """
+    :return: Mean of the vertices of every geometry, see
+        :func:`turfpy.measurement.centroid`, NaN if it has no coordinates.
+    """
+    ring, _ = _coord_index(rings, ring_lengths)
+    return mean_coordinates(coords, ring_geom[ring], len(types))
+
+
+def mean_coordinates(coords: np.ndarray, index: np.ndarray, count: int) -> np.ndarray:
+    """
+    :param coords: Coordinates of shape (N, 2).
+    :param index: Index of the geometry of each coordinate.
+    :param count: Number of geometries.
+    :return: Mean of the coordinates of every geometry, NaN if it has none.
+    """
+    counts = np.bincount(index, minlength=count)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.stack(
+            [
+                np.bincount(index, coords[:, 0], minlength=count) / counts,
+                np.bincount(index, coords[:, 1], minlength=count) / counts,
+            ],
+            axis=1,
+        )
+
+
+def ranks(counts: np.ndarray) -> np.ndarray:
+    """
+    :param counts: Number of items of every group.
+    :return: Rank of every item in its group, 0 to count - 1 for every count,
+        concatenated.
+    """
+    return np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts)
+
+
+def rotate(coords: np.ndarray, pivots: np.ndarray, angle: float) -> np.ndarray:
+    """
+    Rotates coordinates along rhumb lines, see
+    :func:`turfpy.transformation.transform_rotate`.
+
+    :param coords: Coordinates of shape (N, 2) in degrees.
+    :param pivots: Pivot of every coordinate, of shape (N, 2).
+    :param angle: Angle of the rotation in degrees.
+    :return: The rotated coordinates of shape (N, 2).
+    """
+    lon1, lat1 = np.radians(pivots[:, 0]), np.radians(pivots[:, 1])
+    lon2, lat2 = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # rhumb bearing and distance from the pivot, see turfpy.measurement
+        delta_lambda = (lon2 - lon1 + np.pi) % (2 * np.pi) - np.pi
+        delta_phi = lat2 - lat1
+        delta_psi = np.log(np.tan(lat2 / 2 + np.pi / 4) / np.tan(lat1 / 2 + np.pi / 4))
+        bearing = np.arctan2(delta_lambda, delta_psi)
+        q = np.where(np.abs(delta_psi) > 10e-12, delta_phi / delta_psi, np.cos(lat1))
+        delta = np.sqrt(delta_phi**2 + q**2 * delta_lambda**2)
+
+        # rhumb destination along the rotated bearing
+        theta = bearing + np.radians(angle)
+        delta_phi = delta * np.cos(theta)
+        lat3 = lat1 + delta_phi
+        lat3 = np.where(lat3 > np.pi / 2, np.pi - lat3, lat3)
+        lat3 = np.where(lat3 < -np.pi / 2, -np.pi - lat3, lat3)
+        delta_psi = np.log(np.tan(lat3 / 2 + np.pi / 4) / np.tan(lat1 / 2 + np.pi / 4))
+        q = np.where(np.abs(delta_psi) > 10e-12, delta_phi / delta_psi, np.cos(lat1))
+        lon3 = lon1 + delta * np.sin(theta) / q
+
+    return np.stack(
+        [(np.degrees(lon3) + 540) % 360 - 180, np.degrees(lat3)],
+        axis=1,
+    )
+
+
+def array_area(data: Any) -> Any:
+    """
+    :param data: A GeoSeries, GeoDataFrame or array of shapely geometries.
+    :return: Area of every geometry, see :func:`turfpy.measurement.area`.
+    """
+    return _wrap_values(data, _apply(_geometries(data), area))
+
+
+def array_length(data: Any, units: str = "km") -> Any:
+    """
+    :param data: A GeoSeries, GeoDataFrame or array of shapely geometries.
+    :param units: Units of the returned lengths.
+    :return: Length of every geometry, see :func:`turfpy.measurement.length`.
+    """
+    lengths = radians_to_length(_apply(_geometries(data), length), units)
+    return _wrap_values(data, lengths)
+
+
+def array_centroid(data: Any) -> Any:
+    """
+    :param data: A GeoSeries, GeoDataFrame or array of shapely geometries.
+    :return: Centroid of every geometry as Points, see
+        :func:`turfpy.measurement.centroid`, missing if it has no coordinates.
+    """
+    import shapely
+
+    geoms = _geometries(data)
+    coords, index = shapely.get_coordinates(geoms, return_index=True)
+    means = mean_coordinates(coords, index, len(geoms))
+    points = shapely.points(means)
+    points[np.isnan(means[:, 0])] = None
+    return _wrap_geometries(data, points, None)
+
+
+def array_rotate(
+    data: Any, angle: float, pivot: Optional[list] = None, mutate: bool = False
+) -> Any:
+    """
+    :param data: A GeoSeries, GeoDataFrame or array of shapely geometries.
+    :param angle: Angle of rotation, see :func:`turfpy.transformation.transform_rotate`.
+    :param pivot: Point around which geometries are rotated, default to the centroid
+        of every geometry.
+    :param mutate: If True the geometries of data are replaced.
+    :return: The rotated geometries in the same container as data.
+    """
+    import shapely
+
+    geoms = _geometries(data)
+    coords, index = shapely.get_coordinates(geoms, include_z=True, return_index=True)
+    if pivot is None:
+        pivots = mean_coordinates(coords, index, len(geoms))[index]
+    else:
+        pivots = np.broadcast_to(np.asarray(pivot[:2], dtype=float), (len(coords), 2))
+
+    coords[:, :2] = rotate(coords[:, :2], pivots, angle)
+    rotated = shapely.set_coordinates(geoms.copy(), coords)
+    return _wrap_geometries(data, rotated, mutate)
+
+
+def _geometries(data) -> np.ndarray:
+    if isinstance(data, np.ndarray):
+        return data
+    # the active geometry column of a GeoDataFrame, a GeoSeries is its own geometry
+    return np.asarray(data.geometry.values)
+
+
+def _apply(geoms: np.ndarray, kernel) -> np.ndarray:
+    result = np.full(len(geoms), np.nan)
+    for index, block in from_shapely(geoms):
+        result[index] = kernel(*block)
+    return result
+
+
+def _wrap_values(data, values: np.ndarray):
+    if isinstance(data, np.ndarray):
+        return values
+
+    from pandas import Series
+
+    return Series(values, index=data.index)
+
+
+def _wrap_geometries(data, geoms: np.ndarray, mutate: Optional[bool]):
+    """
+    With mutate None geometries are returned as a GeoSeries for pandas inputs,
+    otherwise in a container of the same type as data.
+    """
+    if isinstance(data, np.ndarray):
+        if mutate:
+            data[:] = geoms
+            return data
+        return geoms
+
+    from geopandas import GeoDataFrame, GeoSeries
+
+    series = GeoSeries(geoms, index=data.index, crs=data.crs, name=data.geometry.name)
+    if mutate is None or (isinstance(data, GeoSeries) and not mutate):
+        return series
+
+    result = data if mutate else data.copy()
+    if isinstance(result, GeoDataFrame):
+        result[result.geometry.name] = series
+    else:
+        result[:] = geoms
+    return result
+
+
+def _coord_index(rings, ring_lengths):
+    ring = np.repeat(np.arange(len(ring_lengths)), ring_lengths)
+    return ring, np.arange(rings[-1]) - rings[ring]
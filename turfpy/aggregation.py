@@ -0,0 +1,477 @@
+"""
+This module implements some of the methods that allows to
+aggregate points into grids and polygons.
+This is mainly inspired by turf.js.
+link: http://turfjs.org/
+
+Points are assigned to the cells of a regular grid of :mod:`turfpy.grids` by
+integer arithmetic on their coordinates, or to arbitrary polygons through a hash of
+bins of their bounding boxes followed by a vectorized point-in-polygon test.
+Properties are then reduced per cell with NumPy. Points can be added in chunks and
+the partial results of several aggregators, for instance computed in parallel
+workers, merged with :meth:`GridAggregator.merge`.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+from geojson import Feature, FeatureCollection
+
+from turfpy._vectorized import ranks
+
+# out property: "count" or (in property, reducer)
+Reducers = Dict[str, Union[str, Tuple[str, str]]]
+
+_REDUCERS = ("count", "sum", "mean", "min", "max", "list")
+
+# maximum number of bins per axis of the index of a PolygonAggregator
+_MAX_BINS = 2048
+
+
+class _Aggregator(ABC):
+    def __init__(self, size: int, reducers: Optional[Reducers]):
+        self.size = size
+        self.reducers: Dict[str, Tuple[Optional[str], str]] = {}
+        for out_property, spec in (reducers or {"count": "count"}).items():
+            in_property, reducer = (None, spec) if isinstance(spec, str) else spec
+            if reducer not in _REDUCERS:
+                raise Exception(f"reducer should be one of {', '.join(_REDUCERS)}")
+            if reducer != "count" and in_property is None:
+                raise Exception(f"{reducer} reducer needs a property")
+            self.reducers[out_property] = (in_property, reducer)
+
+        # number of points of every cell, and partial values of every reducer
+        self.counts = np.zeros(size, dtype=np.int64)
+        self.state: Dict[str, dict] = {}
+        for out_property, (_, reducer) in self.reducers.items():
+            if reducer == "list":
+                self.state[out_property] = {"lists": {}}
+            elif reducer != "count":
+                self.state[out_property] = {
+                    "count": np.zeros(size, dtype=np.int64),
+                    "sum": np.zeros(size),
+                    "min": np.full(size, np.inf),
+                    "max": np.full(size, -np.inf),
+                }
+
+    @abstractmethod
+    def _bins(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        # cell and point of every pair of a point in a cell
+        ...
+
+    def add(self, points, values: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Adds points to the aggregation.
+
+        :param points: A FeatureCollection of points, whose properties are reduced,
+            or an array of shape (N, 2) of coordinates.
+        :param values: With an array of coordinates, arrays of the values of the
+            properties reduced, keyed by property.
+        :return: The aggregator.
+        """
+        names = {name for name, _ in self.reducers.values() if name is not None}
+        coords, columns = _points(points, values, names)
+        cells, index = self._bins(coords[:, 0], coords[:, 1])
+        self.counts += np.bincount(cells, minlength=self.size)
+        for out_property, (in_property, reducer) in self.reducers.items():
+            if reducer == "count":
+                continue
+            state = self.state[out_property]
+            column = columns.get(str(in_property))
+            if column is None:
+                raise Exception(f"{in_property} values are missing")
+            if reducer == "list":
+                items = np.empty(len(column), dtype=object)
+                items[:] = list(column)
+                _extend(state["lists"], cells, items[index])
+                continue
+            v = _numbers(column)[index]
+            # missing values are ignored
+            valid = ~np.isnan(v)
+            c, v = cells[valid], v[valid]
+            state["count"] += np.bincount(c, minlength=self.size)
+            state["sum"] += np.bincount(c, weights=v, minlength=self.size)
+            np.minimum.at(state["min"], c, v)
+            np.maximum.at(state["max"], c, v)
+        return self
+
+    def merge(self, other: "_Aggregator"):
+        """
+        Merges the points added to another aggregator of the same cells and
+        reducers, like the partial aggregation of a chunk of points.
+
+        :param other: An aggregator.
+        :return: The aggregator.
+        """
+        if other.size != self.size or other.reducers != self.reducers:
+            raise Exception("aggregators should have the same cells and reducers")
+        self.counts += other.counts
+        for out_property, state in self.state.items():
+            other_state = other.state[out_property]
+            if "lists" in state:
+                for cell, items in other_state["lists"].items():
+                    state["lists"].setdefault(cell, []).extend(items)
+                continue
+            state["count"] += other_state["count"]
+            state["sum"] += other_state["sum"]
+            np.minimum(state["min"], other_state["min"], out=state["min"])
+            np.maximum(state["max"], other_state["max"], out=state["max"])
+        return self
+
+    def values(self) -> Dict[str, np.ndarray]:
+        """
+        :return: An array of the reduced values of every cell keyed by out property,
+            NaN for the mean, min and max of empty cells, an object array of lists
+            for the list reducer.
+        """
+        result = {}
+        for out_property, (_, reducer) in self.reducers.items():
+            if reducer == "count":
+                result[out_property] = self.counts.copy()
+                continue
+            state = self.state[out_property]
+            if reducer == "list":
+                lists = np.empty(self.size, dtype=object)
+                lists[:] = [state["lists"].get(cell, []) for cell in range(self.size)]
+                result[out_property] = lists
+            elif reducer == "sum":
+                result[out_property] = state["sum"].copy()
+            else:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    value = (
+                        state["sum"] / state["count"]
+                        if reducer == "mean"
+                        else state[reducer].copy()
+                    )
+                value[state["count"] == 0] = np.nan
+                result[out_property] = value
+        return result
+
+    def _features(self, cells, keep_empty: bool) -> FeatureCollection:
+        values = self.values()
+        features = []
+        for i, feature in enumerate(cells):
+            if not keep_empty and not self.counts[i]:
+                continue
+            properties = dict(feature.get("properties") or {})
+            for out_property, column in values.items():
+                value = column[i]
+                if isinstance(value, list):
+                    properties[out_property] = list(value)
+                elif isinstance(value, (np.integer, int)):
+                    properties[out_property] = int(value)
+                else:
+                    properties[out_property] = None if np.isnan(value) else float(value)
+            features.append(Feature(geometry=feature["geometry"], properties=properties))
+        return FeatureCollection(features)
+
+
+class GridAggregator(_Aggregator):
+    """
+    Aggregates points into the cells of a grid of :mod:`turfpy.grids`, each point
+    is assigned to its cell by integer arithmetic on its coordinates. Cells are in
+    the order of the grid function, the cells of a point grid are the areas
+    nearest to every point.
+
+    :param grid: 'point', 'square', 'hex' or 'triangle'.
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Size of the cells, see the grid functions.
+    :param units: Unit of ``cell_side``.
+    :param reducers: Reduced values keyed by out property, either 'count', the
+        number of points, or a tuple of a property of the points and one of
+        'sum', 'mean', 'min', 'max' or 'list', default to ``{"count": "count"}``.
+        Missing values are ignored by the numeric reducers.
+    :param triangles: If True the hexagons of a 'hex' grid are split in triangles.
+
+    Example:
+
+    >>> from turfpy.aggregation import GridAggregator
+    >>> aggregator = GridAggregator(
+    ...     "hex", [-95, 30, -85, 40], 50, units="mi",
+    ...     reducers={"count": "count", "total": ("value", "sum")},
+    ... )
+    >>> for chunk in chunks:
+    ...     aggregator.add(chunk)
+    >>> aggregator.result(keep_empty=False)
+    """
+
+    def __init__(
+        self,
+        grid: str,
+        bbox: list,
+        cell_side: float,
+        units: str = "km",
+        reducers: Optional[Reducers] = None,
+        triangles: bool = False,
+    ):
+        from turfpy.grids import _layout
+
+        self.grid = (grid, list(bbox), cell_side, units, triangles)
+        self.layout = _layout(grid, bbox, cell_side, units, triangles)
+        super().__init__(self.layout.size, reducers)
+
+    def __getstate__(self):
+        # the layout holds closures, it is rebuilt from the grid
+        state = self.__dict__.copy()
+        del state["layout"]
+        return state
+
+    def __setstate__(self, state):
+        from turfpy.grids import _layout
+
+        self.__dict__.update(state)
+        self.layout = _layout(*self.grid)
+
+    def _bins(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        cells = self.layout.bins(x, y)
+        index = np.flatnonzero(cells >= 0)
+        return cells[index], index
+
+    def result(self, keep_empty: bool = True) -> FeatureCollection:
+        """
+        :param keep_empty: If False the cells without points are left out.
+        :return: A FeatureCollection of the cells with their reduced values as
+            properties, None for the mean, min and max of empty cells.
+        """
+        from turfpy.grids import _to_features
+
+        cells = _to_features(self.layout.cells(0, self.layout.columns), None)
+        return self._features(cells["features"], keep_empty)
+
+
+class PolygonAggregator(_Aggregator):
+    """
+    Aggregates points into polygons, points on the boundary of a polygon are in the
+    polygon and a point in several overlapping polygons is aggregated into each.
+
+    The polygons are indexed by a hash of bins: the bounding box of all the polygons
+    is divided in bins about the median size of the polygons, and the ranges of bins
+    covered by every polygon are computed once. Points are hashed to their bin by
+    integer arithmetic and sorted by bin, so the candidate points of all the
+    polygons are found with a binary search before a vectorized point-in-polygon
+    test.
+
+    :param polygons: A FeatureCollection of Polygons or MultiPolygons.
+    :param reducers: Reduced values keyed by out property, see
+        :class:`GridAggregator`.
+
+    Example:
+
+    >>> from turfpy.aggregation import PolygonAggregator
+    >>> aggregator = PolygonAggregator(zones, reducers={"names": ("name", "list")})
+    >>> aggregator.add(points)
+    >>> aggregator.result()
+    """
+
+    def __init__(self, polygons: FeatureCollection, reducers: Optional[Reducers] = None):
+        import shapely
+        from shapely.geometry import shape
+
+        self.polygons = polygons
+        self.geoms = np.array(
+            [
+                shape(f["geometry"]) if f["geometry"] else None
+                for f in polygons["features"]
+            ],
+            dtype=object,
+        )
+        shapely.prepare(self.geoms)
+        super().__init__(len(self.geoms), reducers)
+
+        bounds = shapely.bounds(self.geoms).reshape(-1, 4)
+        indexed = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        bounds = bounds[indexed]
+        if not len(bounds):
+            self.bins = None
+            return
+
+        origin = bounds[:, :2].min(axis=0)
+        extent = bounds[:, 2:].max(axis=0) - origin
+        # bins about the size of the polygons, at most _MAX_BINS per axis
+        size = np.median(bounds[:, 2:] - bounds[:, :2], axis=0)
+        size = np.maximum(size, extent / _MAX_BINS)
+        size[size == 0] = 1
+        shape_ = np.floor(extent / size).astype(np.int64) + 1
+        first = self._bin(bounds[:, :2], origin, size, shape_)
+        last = self._bin(bounds[:, 2:], origin, size, shape_)
+
+        # a range of bin keys for every row of bins covered by every polygon
+        rows = last[:, 1] - first[:, 1] + 1
+        polygon = np.repeat(indexed, rows)
+        row = np.repeat(first[:, 1], rows) + ranks(rows)
+        self.bins = (
+            origin,
+            size,
+            shape_,
+            polygon,
+            row * shape_[0] + np.repeat(first[:, 0], rows),
+            row * shape_[0] + np.repeat(last[:, 0], rows),
+        )
+
+    @staticmethod
+    def _bin(coords, origin, size, shape_) -> np.ndarray:
+        return np.clip(np.floor((coords - origin) / size), 0, shape_ - 1).astype(np.int64)
+
+    def _bins(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        import shapely
+
+        if self.bins is None:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        origin, size, shape_, polygon, first_key, last_key = self.bins
+
+        coords = np.column_stack([x, y])
+        inside = ((coords >= origin) & (coords <= origin + shape_ * size)).all(axis=1)
+        index = np.flatnonzero(inside)
+        bins = self._bin(coords[index], origin, size, shape_)
+        keys = bins[:, 1] * shape_[0] + bins[:, 0]
+        order = np.argsort(keys, kind="stable")
+        keys, index = keys[order], index[order]
+
+        # the points of every range of bins are contiguous in the sorted points
+        start = np.searchsorted(keys, first_key, side="left")
+        counts = np.searchsorted(keys, last_key, side="right") - start
+        cells = np.repeat(polygon, counts)
+        points = index[np.repeat(start, counts) + ranks(counts)]
+
+        found = shapely.intersects_xy(self.geoms[cells], x[points], y[points])
+        cells, points = cells[found], points[found]
+        order = np.lexsort((points, cells))
+        return cells[order], points[order]
+
+    def result(self, keep_empty: bool = True) -> FeatureCollection:
+        """
+        :param keep_empty: If False the polygons without points are left out.
+        :return: A FeatureCollection of the polygons with their properties and their
+            reduced values, None for the mean, min and max of empty polygons.
+        """
+        return self._features(self.polygons["features"], keep_empty)
+
+
+def collect(
+    polygons: FeatureCollection,
+    points: FeatureCollection,
+    in_property: str,
+    out_property: str,
+) -> FeatureCollection:
+    """
+    Collects the values of a property of the points within every polygon into a
+    list property of the polygon.
+
+    :param polygons: A FeatureCollection of Polygons or MultiPolygons.
+    :param points: A FeatureCollection of points.
+    :param in_property: Property of the points to collect.
+    :param out_property: Property of the polygons receiving the lists.
+    :return: A FeatureCollection of the polygons with the lists of values.
+
+    Example:
+
+    >>> from turfpy.aggregation import collect
+    >>> from geojson import Feature, FeatureCollection, Point, Polygon
+    >>> polygons = FeatureCollection([
+    ...     Feature(geometry=Polygon([[(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]]))
+    ... ])
+    >>> points = FeatureCollection([
+    ...     Feature(geometry=Point((5, 5)), properties={"population": 200}),
+    ...     Feature(geometry=Point((1, 3)), properties={"population": 600}),
+    ... ])
+    >>> collect(polygons, points, "population", "values")
+    """
+    aggregator = PolygonAggregator(polygons, {out_property: (in_property, "list")})
+    return aggregator.add(points).result()
+
+
+def count(
+    polygons: FeatureCollection,
+    points: FeatureCollection,
+    out_property: str = "count",
+) -> FeatureCollection:
+    """
+    Counts the points within every polygon.
+
+    :param polygons: A FeatureCollection of Polygons or MultiPolygons.
+    :param points: A FeatureCollection of points or an array of shape (N, 2) of
+        coordinates.
+    :param out_property: Property of the polygons receiving the counts.
+    :return: A FeatureCollection of the polygons with the counts.
+
+    Example:
+
+    >>> from turfpy.aggregation import count
+    >>> count(polygons, points)
+    """
+    return PolygonAggregator(polygons, {out_property: "count"}).add(points).result()
+
+
+def aggregate_grid(
+    points,
+    grid: str,
+    bbox: list,
+    cell_side: float,
+    units: str = "km",
+    reducers: Optional[Reducers] = None,
+    values: Optional[Dict[str, np.ndarray]] = None,
+    triangles: bool = False,
+    keep_empty: bool = False,
+) -> FeatureCollection:
+    """
+    Aggregates points into the cells of a grid, see :class:`GridAggregator`.
+
+    :param points: A FeatureCollection of points or an array of shape (N, 2) of
+        coordinates.
+    :param grid: 'point', 'square', 'hex' or 'triangle'.
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Size of the cells, see the grid functions.
+    :param units: Unit of ``cell_side``.
+    :param reducers: Reduced values keyed by out property, default to a count.
+    :param values: With an array of coordinates, arrays of the values of the
+        properties reduced, keyed by property.
+    :param triangles: If True the hexagons of a 'hex' grid are split in triangles.
+    :param keep_empty: If True the cells without points are returned too.
+    :return: A FeatureCollection of the cells with their reduced values.
+
+    Example:
+
+    >>> from turfpy.aggregation import aggregate_grid
+    >>> from turfpy.random import random_points
+    >>> points = random_points(1000, bbox=[-95, 30, -85, 40], seed=0)
+    >>> aggregate_grid(points, "hex", [-95, 30, -85, 40], 50, units="mi")
+    """
+    aggregator = GridAggregator(grid, bbox, cell_side, units, reducers, triangles)
+    return aggregator.add(points, values).result(keep_empty)
+
+
+def _points(
+    points, values: Optional[Dict[str, np.ndarray]], names: set
+) -> Tuple[np.ndarray, dict]:
+    if isinstance(points, dict):
+        features = points["features"]
+        coords = np.array(
+            [f["geometry"]["coordinates"][:2] for f in features], dtype=float
+        ).reshape(-1, 2)
+        properties = [f.get("properties") or {} for f in features]
+        return coords, {name: [p.get(name) for p in properties] for name in names}
+
+    coords = np.asarray(points, dtype=float).reshape(-1, 2)
+    values = values or {}
+    for name, column in values.items():
+        if len(column) != len(coords):
+            raise Exception(f"{name} values should have one value per point")
+    return coords, values
+
+
+def _numbers(column) -> np.ndarray:
+    if isinstance(column, np.ndarray) and column.dtype.kind in "biuf":
+        return column.astype(float, copy=False)
+    return np.array([np.nan if v is None else v for v in column], dtype=float)
+
+
+def _extend(lists: dict, cells: np.ndarray, items: np.ndarray):
+    # append the items of every cell in the order of the points
+    if not len(cells):
+        return
+    order = np.argsort(cells, kind="stable")
+    cells, items = cells[order], items[order]
+    starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+    for start, stop in zip(starts, list(starts[1:]) + [len(cells)]):
+        lists.setdefault(int(cells[start]), []).extend(items[start:stop].tolist())
@@ -5,275 +5,291 @@ This is mainly inspired by turf.js.
 link: http://turfjs.org/
 """
 
-from geojson import Feature, LineString, Point, Polygon
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Iterable, Optional, Tuple, Union
 
-from turfpy.feature_conversion import polygon_to_line
-from turfpy.measurement import boolean_point_in_polygon
-from turfpy.meta import flatten_each
-from turfpy.misc import line_intersect
+import numpy as np
+import shapely
+from geojson import Feature, FeatureCollection
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
+from shapely.strtree import BinaryPredicate
 
+from turfpy.helper import get_geom
+from turfpy.parallel import map_chunks, pack_geometries, unpack_geometries
 
-def __is_point_on_line(line_string: LineString, point: Point) -> bool:
-    """
-    Determine if point is on a line
 
-    :param line_string: GeoJSON LineString
-    :type line_string: LineString
-    :param point: GeoJSON Point
-    :type point: Point
-    :returns: True if the point is on the line
-    :rtype: bool
+def prepared_geometry(geojson: Union[Feature, FeatureCollection]) -> BaseGeometry:
     """
-    coordinates = line_string["coordinates"]
-    pt_coordinates = point["coordinates"]
-
-    for i in range(len(coordinates) - 1):
-        if __is_point_on_line_segment(coordinates[i], coordinates[i + 1], pt_coordinates):
-            return True
-    return False
+    Convert a GeoJSON Feature, Geometry or FeatureCollection to a prepared shapely
+    geometry. Passing it to :func:`boolean_disjoint` or :func:`boolean_intersects`
+    instead of the GeoJSON avoids converting and indexing the same geometry again
+    when it is tested against many others.
 
+    :param geojson: GeoJSON Feature, Geometry or FeatureCollection
+    :type geojson: Feature
+    :returns: A prepared shapely geometry.
+    :rtype: BaseGeometry
 
-def __is_line_on_line(line_string_1: LineString, line_string_2: LineString) -> bool:
-    """
-    Determine if line is on line
+    Example:
 
-    :param line_string_1: GeoJSON LineString
-    :type line_string_1: LineString
-    :param line_string_2: GeoJSON LineString
-    :type line_string_2: LineString
-    :returns: True if the line is on the other line
-    :rtype: bool
+    >>> from turfpy.boolean import boolean_intersects, prepared_geometry
+    >>> from geojson import Feature, Point, Polygon
+    >>> polygon = prepared_geometry(Feature(geometry=Polygon([[(0, 0), (0, 10),
+    ... (10, 10), (10, 0), (0, 0)]])))
+    >>> [boolean_intersects(polygon, Feature(geometry=Point((x, x)))) for x in range(20)]
     """
-    do_lines_intersect = line_intersect(line_string_1, line_string_2)
-
-    if len(do_lines_intersect["features"]) > 0:
-        return True
-    return False
+    geom = __to_shape(geojson)
+    shapely.prepare(geom)
+    return geom
 
 
-def __is_line_in_poly(polygon: Polygon, line_string: LineString) -> bool:
+def __to_shape(geojson: Union[Feature, FeatureCollection, BaseGeometry]) -> BaseGeometry:
     """
-    Determine if line is in a polygon
+    Convert a GeoJSON object to a shapely geometry
 
-
-    :param polygon: GeoJSON Polygon
-    :type polygon: Polygon
-    :param line_string: GeoJSON LineString
-    :type line_string: LineString
-    :returns: True if the line is in the polygon
-    :rtype: bool
+    :param geojson: GeoJSON Feature, Geometry, FeatureCollection or shapely geometry
+    :type geojson: Feature
+    :returns: shapely geometry
+    :rtype: BaseGeometry
     """
-    for coord in line_string["coordinates"]:
-        if boolean_point_in_polygon(coord, polygon):
-            return True
-
-    do_lines_intersect = line_intersect(line_string, polygon_to_line(polygon))
-
-    if len(do_lines_intersect["features"]) > 0:
-        return True
+    if isinstance(geojson, BaseGeometry):
+        return geojson
 
-    return False
+    if geojson["type"] == "FeatureCollection":
+        return shapely.GeometryCollection(
+            [shape(f["geometry"]) for f in geojson["features"] if f["geometry"]]
+        )
 
+    return shape(get_geom(geojson))
 
-def __is_poly_in_poly(feature1: Polygon, feature2: Polygon) -> bool:
-    """
-    Determine if a polygon is in another polygon
 
-    :param feature1: GeoJSON Polygon
-    :type feature1: Polygon
-    :param feature2: GeoJSON Polygon
-    :type feature2: Polygon
-    :returns: True if the polygon is in the other polygon
-    :rtype: bool
+def __intersects(feature_1, feature_2) -> bool:
     """
-    for coord1 in feature1["coordinates"][0]:
-        if boolean_point_in_polygon(coord1, feature2):
-            return True
-
-    for coord2 in feature2["coordinates"][0]:
-        if boolean_point_in_polygon(coord2, feature1):
-            return True
-
-    do_lines_intersect = line_intersect(
-        polygon_to_line(feature1), polygon_to_line(feature2)
-    )
-
-    if len(do_lines_intersect["features"]) > 0:
-        return True
-
-    return False
+    Determine if two geometries intersect, rejecting on bounding boxes first and
+    returning on the first intersecting pair of parts.
 
-
-def __is_point_on_line_segment(
-    line_segment_start: list, line_segment_end: list, point: list
-) -> bool:
-    """
-    Determine if point is on a line segment
-
-    :param line_segment_start: start of line segment
-    :type line_segment_start: list
-    :param line_segment_end: end of line segment
-    :type line_segment_end: list
-    :param point: point to check
-    :type point: list
-    :returns: True if point is on the line segment
+    :param feature_1: GeoJSON Feature, Geometry or shapely geometry
+    :type feature_1: Feature
+    :param feature_2: GeoJSON Feature, Geometry or shapely geometry
+    :type feature_2: Feature
+    :returns: True if the two geometries touch or overlap.
     :rtype: bool
     """
+    geom_1 = __to_shape(feature_1)
+    geom_2 = __to_shape(feature_2)
 
-    dxc = point[0] - line_segment_start[0]
-    dyc = point[1] - line_segment_start[1]
-    dxl = line_segment_end[0] - line_segment_start[0]
-    dyl = line_segment_end[1] - line_segment_start[1]
-    cross = dxc * dyl - dyc * dxl
-
-    if cross != 0:
+    if geom_1.is_empty or geom_2.is_empty:
         return False
 
-    if abs(dxl) >= abs(dyl):
-        if dxl > 0:
-            return line_segment_start[0] <= point[0] <= line_segment_end[0]
-        else:
-            return line_segment_end[0] <= point[0] <= line_segment_start[0]
-    else:
-        if dyl > 0:
-            return line_segment_start[1] <= point[1] <= line_segment_end[1]
-        else:
-            return line_segment_end[1] <= point[1] <= line_segment_start[1]
-
-
-def __compare_coords(pair1: list, pair2: list) -> bool:
-    """
-    Compare coordinates to see if they match
+    west_1, south_1, east_1, north_1 = geom_1.bounds
+    west_2, south_2, east_2, north_2 = geom_2.bounds
+    if west_1 > east_2 or west_2 > east_1 or south_1 > north_2 or south_2 > north_1:
+        return False
 
-    :param pair1: pair of coordinates
-    :type pair1: list
-    :param pair2: pair of coordinates
-    :type pair2: list
-    :returns: True if the two pairs of coordinates match
-    :rtype: bool
-    """
+    if shapely.is_prepared(geom_1):
+        return bool(shapely.intersects(geom_1, geom_2))
+
+    parts_2 = shapely.get_parts(geom_2)
+    bounds_2 = shapely.bounds(parts_2)
+
+    for part in shapely.get_parts(geom_1):
+        west, south, east, north = part.bounds
+        candidates = parts_2[
+            (bounds_2[:, 0] <= east)
+            & (bounds_2[:, 2] >= west)
+            & (bounds_2[:, 1] <= north)
+            & (bounds_2[:, 3] >= south)
+        ]
+        if len(candidates) > 1:
+            shapely.prepare(part)
+        if np.any(shapely.intersects(part, candidates)):
+            return True
 
-    return pair1[0] == pair2[0] and pair1[1] == pair2[1]
+    return False
 
 
-def __disjoint(feature_1: Feature, feature_2: Feature) -> bool:
+def boolean_disjoint(feature_1: Feature, feature_2: Feature) -> bool:
     """
-    Disjoint operation for simple Geometries (Point/LineString/Polygon)
+    Boolean-disjoint returns (TRUE) if the two geometries do not touch or overlap,
+    the negation of :func:`boolean_intersects`, multi-part and degenerate
+    geometries included.
 
-    :param feature_1: GeoJSON Feature or Geometry
+    :param feature_1: GeoJSON Feature or Geometry, or a geometry from
+        :func:`prepared_geometry`
     :type feature_1: Feature
     :param feature_2: GeoJSON Feature or Geometry
     :type feature_2: Feature
-    :param ignore_self_intersections: whether to ignore self intersections
-    :type ignore_self_intersections: bool
     :returns: True if the two geometries do not touch or overlap.
     :rtype: bool
-    """
 
-    geom1_type = feature_1["geometry"]["type"]
-    geom2_type = feature_2["geometry"]["type"]
 
-    if geom1_type == "Point":
-        if geom2_type == "Point":
-            return not __compare_coords(
-                feature_1["geometry"]["coordinates"], feature_2["geometry"]["coordinates"]
-            )
-        elif geom2_type == "LineString":
-            return not __is_point_on_line(feature_2["geometry"], feature_1["geometry"])
-        elif geom2_type == "Polygon":
-            return not boolean_point_in_polygon(
-                feature_1["geometry"], feature_2["geometry"]
-            )
+    Example:
 
-    elif geom1_type == "LineString":
-        if geom2_type == "Point":
-            return not __is_point_on_line(feature_1["geometry"], feature_2["geometry"])
-        elif geom2_type == "LineString":
-            return not __is_line_on_line(feature_1["geometry"], feature_2["geometry"])
-        elif geom2_type == "Polygon":
-            return not __is_line_in_poly(feature_2["geometry"], feature_1["geometry"])
-
-    elif geom1_type == "Polygon":
-        if geom2_type == "Point":
-            return not boolean_point_in_polygon(
-                feature_2["geometry"], feature_1["geometry"]
-            )
-        elif geom2_type == "LineString":
-            return not __is_line_in_poly(feature_1["geometry"], feature_2["geometry"])
-        elif geom2_type == "Polygon":
-            return not __is_poly_in_poly(feature_2["geometry"], feature_1["geometry"])
+    >>> from turfpy.boolean import boolean_disjoint
+    >>> from geojson import Feature, Point
+    >>> feature_1 = Feature(geometry=Point((19.0760, 72.8777)))
+    >>> feature_2 = Feature(geometry=Point((29.0760, 72.8777)))
+    >>> boolean_disjoint(feature_1, feature_2)
 
-    return False
+    """
+    return not __intersects(feature_1, feature_2)
 
 
-def boolean_disjoint(feature_1: Feature, feature_2: Feature) -> bool:
+def boolean_intersects(feature_1: Feature, feature_2: Feature) -> bool:
     """
-    Boolean-disjoint returns (TRUE) if the two geometries do not touch or overlap.
+    Boolean-intersects returns (TRUE) if the intersection of
+    the two geometries is NOT an empty set.
+
+    Geometries are compared with the exact predicates of shapely. Every part of
+    multi-part geometries is compared, where only the first part used to be, and
+    a zero-length line segment only intersects the geometries touching its
+    position, where it used to match any point with the same x.
 
-    :param feature_1: GeoJSON Feature or Geometry
+    :param feature_1: GeoJSON Feature or Geometry, or a geometry from
+        :func:`prepared_geometry`
     :type feature_1: Feature
     :param feature_2: GeoJSON Feature or Geometry
     :type feature_2: Feature
-    :returns: True if the two geometries do not touch or overlap.
+    :returns: True if the intersection of the two geometries is NOT an empty set.
     :rtype: bool
+    """
+    return __intersects(feature_1, feature_2)
 
 
-    Example:
-
-    >>> from turfpy.boolean import boolean_disjoint
-    >>> from geojson import Feature, Polygon
-    >>> boolean_disjoint()
-
+def intersects_join(
+    left: Union[FeatureCollection, Iterable[Feature]],
+    right: Union[FeatureCollection, Iterable[Feature]],
+    predicate: str = "intersects",
+    chunk_size: Optional[int] = None,
+    n_jobs: Optional[int] = 1,
+    executor: Optional[Executor] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
     """
+    Many-to-many spatial predicate join. A spatial index (``shapely.STRtree``) is
+    built on the ``right`` features and only candidate pairs are tested against the
+    predicate with shapely vectorized functions, pass the smaller collection as
+    ``right``.
+
+    :param left: FeatureCollection or iterable of GeoJSON Features
+    :type left: FeatureCollection
+    :param right: FeatureCollection or iterable of GeoJSON Features
+    :type right: FeatureCollection
+    :param predicate: Predicate which ``left`` features are tested with against
+        ``right`` features, e.g. 'intersects', 'within', 'contains', 'overlaps',
+        'crosses', 'touches', 'covers', 'covered_by' or 'contains_properly'
+    :type predicate: str
+    :param chunk_size: If provided, ``left`` features are converted and queried
+        this many at a time, which bounds peak memory for large inputs
+    :type chunk_size: int
+    :param n_jobs: Number of parts every chunk of ``left`` features is split in,
+        queried by the shared executor of :mod:`turfpy.parallel`. Default value is
+        1 which runs in the current process, None uses one part per worker
+    :type n_jobs: int
+    :param executor: A :class:`concurrent.futures.Executor` used instead of the
+        shared executor
+    :type executor: Executor
+    :returns: Two integer arrays ``(left_idx, right_idx)`` of the positions of the
+        matching features in ``left`` and ``right``, sorted by ``left_idx``
+    :rtype: Tuple[np.ndarray, np.ndarray]
 
-    bool_result = True
+    Example:
 
-    def check_disjoint(flatten1, index1, feature_collection1):
-        nonlocal bool_result
-        if not bool_result:
-            return False
+    >>> from turfpy.boolean import intersects_join
+    >>> from geojson import Feature, FeatureCollection, Point, Polygon
+    >>> assets = FeatureCollection([Feature(geometry=Point((x, x))) for x in range(5)])
+    >>> hazards = FeatureCollection([Feature(geometry=Polygon([[(0, 0), (0, 2),
+    ... (2, 2), (2, 0), (0, 0)]]))])
+    >>> left_idx, right_idx = intersects_join(assets, hazards, predicate="within")
+    """
+    if predicate not in BinaryPredicate.__members__:
+        raise Exception(f"{predicate} predicate is invalid")
 
-        def inner_check(flatten2, index2, feature_collection2):
-            nonlocal bool_result
-            if not bool_result:
-                return False
-            bool_result = __disjoint(flatten1, flatten2)
+    if chunk_size is not None and chunk_size < 1:
+        raise Exception("chunk_size must be a positive number")
 
-        flatten_each(feature_2, inner_check)
+    right_shapes = __to_shapes(__join_features(right))
+    parallel = n_jobs != 1 or executor is not None
+    if parallel:
+        right_buffers = pack_geometries(right_shapes)
+    else:
+        tree = shapely.STRtree(right_shapes)
+
+    features = iter(__join_features(left))
+    left_parts = []
+    right_parts = []
+    offset = 0
+    while True:
+        chunk = list(islice(features, chunk_size)) if chunk_size else list(features)
+        if not chunk:
+            break
+        if parallel:
+            parts = map_chunks(
+                __query_shared,
+                len(chunk),
+                [*pack_geometries(__to_shapes(chunk)), *right_buffers],
+                (predicate,),
+                n_jobs=n_jobs,
+                executor=executor,
+            )
+            left_idx = np.concatenate([p[0] for p in parts])
+            right_idx = np.concatenate([p[1] for p in parts])
+        else:
+            left_idx, right_idx = tree.query(__to_shapes(chunk), predicate=predicate)
+        left_parts.append(left_idx + offset)
+        right_parts.append(right_idx)
+        offset += len(chunk)
+        if not chunk_size:
+            break
 
-    flatten_each(feature_1, check_disjoint)
+    if not left_parts:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
 
-    return bool_result
+    left_idx = np.concatenate(left_parts)
+    right_idx = np.concatenate(right_parts)
+    order = np.lexsort((right_idx, left_idx))
+    return left_idx[order], right_idx[order]
 
 
-def boolean_intersects(feature_1: Feature, feature_2: Feature) -> bool:
+def __query_shared(
+    start, stop, left_buffer, left_offsets, right_buffer, right_offsets, predicate
+):
     """
-    Boolean-intersects returns (TRUE) if the intersection of
-    the two geometries is NOT an empty set.
+    Query the packed ``left`` geometries ``start:stop`` against a spatial index of
+    the packed ``right`` geometries
 
-    :param feature_1: GeoJSON Feature or Geometry
-    :type feature_1: Feature
-    :param feature_2: GeoJSON Feature or Geometry
-    :type feature_2: Feature
-    :returns: True if the intersection of the two geometries is NOT an empty set.
-    :rtype: bool
+    :returns: indices of the matching pairs, relative to all ``left`` geometries
     """
+    tree = shapely.STRtree(unpack_geometries(right_buffer, right_offsets))
+    left = unpack_geometries(left_buffer, left_offsets, start, stop)
+    left_idx, right_idx = tree.query(left, predicate=predicate)
+    return left_idx + start, right_idx
 
-    bool_result = False
 
-    def check_intersection(flatten1, index1, feature_collection1):
-        nonlocal bool_result
-        if bool_result:
-            return True
+def __join_features(features):
+    """
+    Return the features of a FeatureCollection, other iterables are returned as is
 
-        def inner_check(flatten2, index2, feature_collection2):
-            nonlocal bool_result
-            if bool_result:
-                return True
-            bool_result = not boolean_disjoint(flatten1["geometry"], flatten2["geometry"])
+    :param features: FeatureCollection or iterable of GeoJSON Features
+    :returns: iterable of GeoJSON Features
+    """
+    if isinstance(features, dict):
+        if "features" not in features:
+            raise Exception("Invalid FeatureCollection")
+        return features["features"]
+    return features
 
-        flatten_each(feature_2, inner_check)
 
-    flatten_each(feature_1, check_intersection)
+def __to_shapes(features) -> np.ndarray:
+    """
+    Convert GeoJSON Features to an array of shapely geometries, None for features
+    without geometry
 
-    return bool_result
+    :param features: iterable of GeoJSON Features
+    :returns: array of shapely geometries
+    """
+    geoms = [get_geom(f) for f in features]
+    shapes = np.empty(len(geoms), dtype=object)
+    shapes[:] = [shape(g) if g else None for g in geoms]
+    return shapes
@@ -0,0 +1,319 @@
+"""
+This module implements an opt-in cache of the values derived from geometries, like
+their area, bbox or centroid, for applications computing them many times for the
+same GeoJSON objects.
+
+Values are keyed by the identity of the GeoJSON arguments and checked against a
+fingerprint made of their type, the identity and length of their coordinates and
+their first and last positions, so a geometry whose coordinates are replaced is
+computed again. Transformations called
+with ``mutate=True`` invalidate the values of their input, other in-place changes
+keeping the fingerprint must be followed by :func:`invalidate`.
+
+Entries are evicted in least recently used order when the cache holds more than
+``max_entries`` values or when the arguments of its entries total more than
+``max_vertices`` vertices. Cached GeoJSON objects are kept alive by the cache
+until their entries are evicted.
+"""
+
+import copy
+import functools
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional, Set, Tuple
+
+from turfpy.helper import count_vertices
+
+_GEOJSON_TYPES = {
+    "Feature",
+    "FeatureCollection",
+    "GeometryCollection",
+    "Point",
+    "LineString",
+    "Polygon",
+    "MultiPoint",
+    "MultiLineString",
+    "MultiPolygon",
+}
+
+
+class _Entry:
+    __slots__ = ("value", "objects", "fingerprints", "vertices")
+
+    def __init__(self, value, objects, fingerprints, vertices):
+        self.value = value
+        # GeoJSON arguments, referenced so that their ids are not reused
+        self.objects = objects
+        self.fingerprints = fingerprints
+        self.vertices = vertices
+
+
+class _LRUCache:
+    def __init__(self, max_entries: int, max_vertices: int):
+        self.max_entries = max_entries
+        self.max_vertices = max_vertices
+        self.entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        # keys of the entries referencing every GeoJSON object
+        self.references: Dict[int, Set[Hashable]] = {}
+        self.vertices = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.RLock()
+
+    def get(self, key: Hashable, fingerprints: tuple) -> Tuple[bool, Any]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.fingerprints != fingerprints:
+                self.remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def put(self, key: Hashable, entry: _Entry):
+        if entry.vertices > self.max_vertices:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = entry
+            self.vertices += entry.vertices
+            for obj in entry.objects:
+                self.references.setdefault(id(obj), set()).add(key)
+            while (
+                len(self.entries) > self.max_entries or self.vertices > self.max_vertices
+            ):
+                self.remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def remove(self, key: Hashable):
+        entry = self.entries.pop(key)
+        self.vertices -= entry.vertices
+        for obj in entry.objects:
+            keys = self.references.get(id(obj))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.references[id(obj)]
+
+    def invalidate(self, geojson: dict) -> int:
+        with self.lock:
+            count = 0
+            for obj in _nested(geojson):
+                for key in list(self.references.get(id(obj), ())):
+                    self.remove(key)
+                    count += 1
+            self.invalidations += count
+            return count
+
+
+_CACHE: Optional[_LRUCache] = None
+
+
+def enable(max_entries: int = 1024, max_vertices: int = 1_000_000):
+    """
+    Enables the cache, an enabled cache is cleared and resized.
+
+    :param max_entries: Maximum number of cached values.
+    :param max_vertices: Maximum total number of vertices of the GeoJSON arguments
+        of the cached values, a call whose arguments have more vertices is never
+        cached.
+
+    Example:
+
+    >>> from turfpy import cache
+    >>> cache.enable(max_entries=10000, max_vertices=10_000_000)
+    """
+    global _CACHE
+    if max_entries < 1 or max_vertices < 0:
+        raise Exception("max_entries and max_vertices should be positive numbers")
+    _CACHE = _LRUCache(max_entries, max_vertices)
+
+
+def disable():
+    """Disables and clears the cache."""
+    global _CACHE
+    _CACHE = None
+
+
+def is_enabled() -> bool:
+    """
+    :return: True if the cache is enabled.
+    """
+    return _CACHE is not None
+
+
+def clear():
+    """Removes every cached value and resets the statistics."""
+    if _CACHE is not None:
+        enable(_CACHE.max_entries, _CACHE.max_vertices)
+
+
+@contextmanager
+def cached(max_entries: int = 1024, max_vertices: int = 1_000_000) -> Iterator[None]:
+    """
+    Context manager enabling an empty cache in its block, the previous cache is
+    restored on exit.
+
+    :param max_entries: Maximum number of cached values.
+    :param max_vertices: Maximum total number of vertices of the GeoJSON arguments
+        of the cached values.
+
+    Example:
+
+    >>> from turfpy import cache
+    >>> from turfpy.measurement import area, bbox
+    >>> with cache.cached():
+    ...     for polygon in polygons:
+    ...         area(polygon), bbox(polygon), area(polygon)
+    ...     print(cache.stats())
+    """
+    global _CACHE
+    previous = _CACHE
+    enable(max_entries, max_vertices)
+    try:
+        yield
+    finally:
+        _CACHE = previous
+
+
+def invalidate(geojson: Any) -> int:
+    """
+    Removes the cached values computed from a GeoJSON object or from the features
+    and geometries it contains, to be called after modifying it in place.
+
+    :param geojson: A GeoJSON object.
+    :return: The number of removed values.
+    """
+    if _CACHE is None or not isinstance(geojson, dict):
+        return 0
+    return _CACHE.invalidate(geojson)
+
+
+def stats() -> dict:
+    """
+    :return: The number of hits, misses, evictions and invalidations since the
+        cache was enabled or cleared, with the number of entries and vertices it
+        holds, an empty dict if the cache is disabled.
+    """
+    if _CACHE is None:
+        return {}
+    with _CACHE.lock:
+        lookups = _CACHE.hits + _CACHE.misses
+        return {
+            "hits": _CACHE.hits,
+            "misses": _CACHE.misses,
+            "hit_rate": _CACHE.hits / lookups if lookups else 0.0,
+            "evictions": _CACHE.evictions,
+            "invalidations": _CACHE.invalidations,
+            "entries": len(_CACHE.entries),
+            "vertices": _CACHE.vertices,
+            "max_entries": _CACHE.max_entries,
+            "max_vertices": _CACHE.max_vertices,
+        }
+
+
+def memoize(func: Callable) -> Callable:
+    """
+    Decorates a function so that its results are cached while the cache is
+    enabled. GeoJSON arguments are keyed by identity and fingerprint, other
+    arguments by value, calls with unhashable arguments like a GeoSeries are not
+    cached.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        cache = _CACHE
+        if cache is None:
+            return func(*args, **kwargs)
+
+        objects: list = []
+        try:
+            key = (
+                name,
+                tuple(_key(value, objects) for value in args),
+                tuple(sorted((k, _key(v, objects)) for k, v in kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        fingerprints = tuple(_fingerprint(obj) for obj in objects)
+        found, value = cache.get(key, fingerprints)
+        if found:
+            return _copy(value)
+
+        value = func(*args, **kwargs)
+        vertices = sum(count_vertices(obj) for obj in objects)
+        cache.put(key, _Entry(_copy(value), objects, fingerprints, vertices))
+        return value
+
+    return wrapper
+
+
+def _key(value: Any, objects: list) -> Hashable:
+    if isinstance(value, dict) and value.get("type") in _GEOJSON_TYPES:
+        objects.append(value)
+        return ("geojson", id(value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _key(v, objects)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_key(v, objects) for v in value)
+    # raises TypeError for unhashable values
+    hash(value)
+    return value
+
+
+def _fingerprint(geojson: dict) -> tuple:
+    geom_type = geojson.get("type")
+    if geom_type == "Feature":
+        geometry = geojson.get("geometry")
+        return (geom_type, _fingerprint(geometry) if geometry else None)
+
+    collections = {"FeatureCollection": "features", "GeometryCollection": "geometries"}
+    items = geojson.get(collections.get(str(geom_type), "coordinates"))
+    if not items:
+        return (geom_type, items)
+    # replaced lists have another id, modified ones other lengths or end positions
+    if geom_type in ("FeatureCollection", "GeometryCollection"):
+        return (
+            geom_type,
+            id(items),
+            len(items),
+            _fingerprint(items[0]),
+            _fingerprint(items[-1]),
+        )
+    return (geom_type, id(items), len(items), _position(items, 0), _position(items, -1))
+
+
+def _position(coordinates, index: int):
+    # first or last position of nested coordinates
+    while coordinates and isinstance(coordinates[0], (list, tuple)):
+        coordinates = coordinates[index]
+    return tuple(coordinates)
+
+
+def _nested(geojson: dict) -> Iterator[dict]:
+    yield geojson
+    for name in ("geometry", "features", "geometries"):
+        value = geojson.get(name)
+        if isinstance(value, dict):
+            yield from _nested(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    yield from _nested(item)
+
+
+def _copy(value: Any) -> Any:
+    # cached values must not be modified by callers
+    if isinstance(value, (int, float, str, bool, type(None))):
+        return value
+    return copy.deepcopy(value)
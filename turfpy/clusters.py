@@ -0,0 +1,263 @@
+"""
+This module implements some of the clustering methods of points.
+This is mainly inspired by turf.js.
+link: http://turfjs.org/
+
+Points are converted to unit vectors on the sphere, where the straight line distance
+between two points, the chord, grows with their great circle distance. A radius in
+any unit is thus a chord length, which lets the neighbour queries of DBSCAN and the
+nearest centroid assignments of k-means run on a scipy ``cKDTree`` instead of
+comparing every pair of points.
+"""
+
+import copy
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+from geojson import FeatureCollection
+
+from turfpy.helper import length_to_radians
+
+# maximum number of iterations of k-means, as in skmeans used by turf.js
+_MAX_ITERATIONS = 10000
+
+
+def clusters_dbscan(
+    points: FeatureCollection,
+    max_distance: float,
+    units: str = "km",
+    min_points: int = 3,
+    mutate: bool = False,
+) -> FeatureCollection:
+    """
+    Takes a set of points and partitions them into clusters according to the
+    DBSCAN data clustering algorithm, with great circle distances.
+
+    A point with at least ``min_points`` points, itself included, within
+    ``max_distance`` is a core point. Core points within ``max_distance`` of each
+    other are in the same cluster, the other points within ``max_distance`` of a
+    core point are edge points of the cluster of their nearest core point and the
+    remaining points are noise.
+
+    :param points: A FeatureCollection of points.
+    :param max_distance: Maximum distance between two points of a cluster.
+    :param units: Unit of ``max_distance``, default is km.
+    :param min_points: Minimum number of points within ``max_distance`` of a core
+        point.
+    :param mutate: allows GeoJSON input to be mutated
+        (significant performance increase if true)
+    :return: The points with a ``cluster`` property, the index of their cluster
+        numbered in the order of the points, except for noise points, and a
+        ``dbscan`` property, 'core', 'edge' or 'noise'.
+
+    Example:
+
+    >>> from turfpy.clusters import clusters_dbscan
+    >>> from turfpy.random import random_points
+    >>> points = random_points(100, bbox=[0, 30, 20, 50])
+    >>> clusters_dbscan(points, 100)
+    """
+    if max_distance < 0:
+        raise Exception("invalid max distance")
+
+    if min_points < 1:
+        raise Exception("min points should be at least 1")
+
+    xyz = _unit_vectors(points)
+    clusters, kinds = _dbscan(
+        xyz, _chord(length_to_radians(max_distance, units)), min_points
+    )
+
+    names = np.array(["noise", "edge", "core"], dtype=object)[kinds].tolist()
+    result = _with_properties(points, mutate)
+    for feature, cluster, kind in zip(result["features"], clusters.tolist(), names):
+        properties = feature["properties"]
+        if cluster < 0:
+            properties.pop("cluster", None)
+        else:
+            properties["cluster"] = cluster
+        properties["dbscan"] = kind
+    return result
+
+
+def clusters_kmeans(
+    points: FeatureCollection,
+    number_of_clusters: Optional[int] = None,
+    mutate: bool = False,
+) -> FeatureCollection:
+    """
+    Takes a set of points and partitions them into clusters using the k-means
+    clustering algorithm on the sphere, points are assigned to the nearest centroid
+    in great circle distance and centroids are the normalized mean of the unit
+    vectors of their points.
+
+    As in turf.js, the first points are the initial centroids, so that the result
+    is deterministic.
+
+    :param points: A FeatureCollection of points.
+    :param number_of_clusters: Number of clusters, default is the square root of
+        half the number of points, at most the number of points.
+    :param mutate: allows GeoJSON input to be mutated
+        (significant performance increase if true)
+    :return: The points with a ``cluster`` property, the index of their cluster,
+        and a ``centroid`` property, the coordinates of the centroid of the cluster.
+
+    Example:
+
+    >>> from turfpy.clusters import clusters_kmeans
+    >>> from turfpy.random import random_points
+    >>> points = random_points(100, bbox=[0, 30, 20, 50])
+    >>> clusters_kmeans(points, number_of_clusters=7)
+    """
+    xyz = _unit_vectors(points)
+    if number_of_clusters is None:
+        number_of_clusters = max(round(math.sqrt(len(xyz) / 2)), 1)
+    if number_of_clusters < 1:
+        raise Exception("number of clusters should be at least 1")
+    if not len(xyz):
+        return _with_properties(points, mutate)
+    number_of_clusters = min(number_of_clusters, len(xyz))
+
+    clusters, centroids = _kmeans(xyz, number_of_clusters)
+
+    lon = np.degrees(np.arctan2(centroids[:, 1], centroids[:, 0]))
+    lat = np.degrees(np.arcsin(np.clip(centroids[:, 2], -1, 1)))
+    coordinates = np.column_stack([lon, lat]).tolist()
+    result = _with_properties(points, mutate)
+    for feature, cluster in zip(result["features"], clusters.tolist()):
+        feature["properties"]["cluster"] = cluster
+        feature["properties"]["centroid"] = list(coordinates[cluster])
+    return result
+
+
+def _dbscan(
+    xyz: np.ndarray, radius: float, min_points: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    # cluster of every point, -1 for noise, and its kind, 0 noise, 1 edge, 2 core
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    from scipy.spatial import cKDTree
+
+    n = len(xyz)
+    clusters = np.full(n, -1, dtype=np.int64)
+    kinds = np.zeros(n, dtype=np.int64)
+    if not n:
+        return clusters, kinds
+
+    # every pair of points within the radius, once
+    pairs = cKDTree(xyz).query_pairs(radius, output_type="ndarray")
+    neighbours = np.bincount(pairs.ravel(), minlength=n) + 1
+    is_core = neighbours >= min_points
+    core = np.flatnonzero(is_core)
+    if not len(core):
+        return clusters, kinds
+
+    # clusters are the connected components of the core points
+    both = is_core[pairs].all(axis=1)
+    graph = coo_matrix(
+        (np.ones(int(both.sum()), dtype=bool), (pairs[both, 0], pairs[both, 1])),
+        shape=(n, n),
+    )
+    _, components = connected_components(graph, directed=False)
+    # numbered in the order of their first point
+    _, first, labels = np.unique(components[core], return_index=True, return_inverse=True)
+    clusters[core] = np.argsort(np.argsort(first))[labels]
+    kinds[core] = 2
+
+    # edge points join the cluster of their nearest core point
+    one = is_core[pairs].sum(axis=1) == 1
+    if one.any():
+        pairs = pairs[one]
+        swap = is_core[pairs[:, 0]]
+        edge = np.where(swap, pairs[:, 1], pairs[:, 0])
+        nearest = np.where(swap, pairs[:, 0], pairs[:, 1])
+        distances = ((xyz[edge] - xyz[nearest]) ** 2).sum(axis=1)
+        order = np.lexsort((nearest, distances, edge))
+        edge, nearest = edge[order], nearest[order]
+        first_pair = np.r_[True, edge[1:] != edge[:-1]]
+        edge, nearest = edge[first_pair], nearest[first_pair]
+        clusters[edge] = clusters[nearest]
+        kinds[edge] = 1
+    return clusters, kinds
+
+
+def _kmeans(xyz: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    # cluster of every point and unit vector of every centroid, with the bounds of
+    # Hamerly's algorithm only the points whose nearest centroid may have changed
+    # are queried again
+    from scipy.spatial import cKDTree
+
+    centroids = xyz[:k].copy()
+    clusters = np.zeros(len(xyz), dtype=np.int64)
+    # distance to the centroid of the cluster, and lower bound of the distance to
+    # the other centroids
+    upper = np.full(len(xyz), np.inf)
+    lower = np.zeros(len(xyz))
+    for iteration in range(_MAX_ITERATIONS):
+        stale = np.flatnonzero(upper > lower)
+        if len(stale):
+            upper[stale] = np.linalg.norm(xyz[stale] - centroids[clusters[stale]], axis=1)
+            stale = stale[upper[stale] > lower[stale]]
+        if len(stale):
+            distances, nearest = cKDTree(centroids).query(
+                xyz[stale], k=min(k, 2), workers=-1
+            )
+            if k == 1:
+                distances, nearest = distances[:, None], nearest[:, None]
+            changed = stale[nearest[:, 0] != clusters[stale]]
+            clusters[stale] = nearest[:, 0]
+            upper[stale] = distances[:, 0]
+            lower[stale] = distances[:, -1] if k > 1 else np.inf
+        else:
+            changed = stale
+        # centroids are always the mean of their points
+        if iteration and not len(changed):
+            break
+
+        sums = np.column_stack(
+            [np.bincount(clusters, weights=xyz[:, i], minlength=k) for i in range(3)]
+        )
+        norms = np.linalg.norm(sums, axis=1)
+        # empty clusters, or points cancelling out, keep their centroid
+        moved = norms > 1e-12
+        previous = centroids.copy()
+        centroids[moved] = sums[moved] / norms[moved, None]
+        shifts = np.linalg.norm(centroids - previous, axis=1)
+        if not shifts.any():
+            break
+        upper += shifts[clusters]
+        lower -= shifts.max()
+    return clusters, centroids
+
+
+def _unit_vectors(points: FeatureCollection) -> np.ndarray:
+    if not points or points.get("type") != "FeatureCollection":
+        raise Exception("points should be a FeatureCollection")
+    coords = np.array(
+        [f["geometry"]["coordinates"][:2] for f in points["features"]], dtype=float
+    ).reshape(-1, 2)
+    lon, lat = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+    return np.column_stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+
+
+def _chord(radians: float) -> float:
+    # straight line distance between two unit vectors at an angle
+    return 2 * math.sin(min(radians, math.pi) / 2)
+
+
+def _with_properties(points: FeatureCollection, mutate: bool) -> FeatureCollection:
+    # features with their own properties, sharing their geometries unless mutate
+    if mutate:
+        for feature in points["features"]:
+            if feature.get("properties") is None:
+                feature["properties"] = {}
+        return points
+    features = []
+    for feature in points["features"]:
+        result = copy.copy(feature)
+        result["properties"] = dict(feature.get("properties") or {})
+        features.append(result)
+    return FeatureCollection(features)
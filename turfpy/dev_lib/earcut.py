@@ -501,8 +501,8 @@ def __sort_linked(_list):
 # z-order of a point given coords and size of the data bounding box
 def __zorder(x, y, minx, miny, size):
     # coords are transformed into non-negative 15-bit integer range
-    x = 32767 * (x - minx) // size
-    y = 32767 * (y - miny) // size
+    x = int(32767 * (x - minx) // size)
+    y = int(32767 * (y - miny) // size)
 
     x = (x | (x << 8)) & 0x00FF00FF
     x = (x | (x << 4)) & 0x0F0F0F0F
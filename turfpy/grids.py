@@ -0,0 +1,492 @@
+"""
+This module implements some of the methods that allows to
+generate grids of points and polygons in a bounding box.
+This is mainly inspired by turf.js.
+link: http://turfjs.org/
+
+The vertices of all the cells are computed at once with NumPy, one column of cells
+after the other, so grids can be generated whole or in chunks of columns with
+:func:`iter_grid` when they hold too many cells to be held in memory at once.
+"""
+
+import math
+from typing import Callable, Iterator, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+from geojson import Feature, FeatureCollection, MultiPolygon, Point, Polygon
+
+from turfpy.helper import conversions, get_geom, length_to_degrees
+from turfpy.measurement import distance
+
+Mask = Optional[Union[Feature, Polygon, MultiPolygon]]
+
+
+class _Layout(NamedTuple):
+    columns: int
+    # maximum number of cells of a column
+    rows: int
+    size: int
+    # coordinates of the cells of a range of columns
+    cells: Callable[[int, int], np.ndarray]
+    # index of the cell of every position, -1 for positions outside the grid
+    bins: Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+_GRIDS = ("point", "square", "hex", "triangle")
+
+
+def point_grid(
+    bbox: list,
+    cell_side: float,
+    units: str = "km",
+    mask: Mask = None,
+    properties: Optional[dict] = None,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
+    """
+    Creates a grid of points in a bounding box, spaced by ``cell_side`` and
+    centered in the bounding box.
+
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Distance between the points of the grid.
+    :param units: Unit of ``cell_side``, one of the units of
+        :data:`turfpy.helper.conversions`.
+    :param mask: If provided only the points within this Polygon or MultiPolygon are
+        kept.
+    :param properties: Properties of every point.
+    :param as_array: If True an array of shape (N, 2) of coordinates is returned
+        instead of a FeatureCollection.
+    :return: A FeatureCollection of points.
+
+    Exmample:
+
+    >>> from turfpy.grids import point_grid
+    >>> point_grid([-95, 30, -85, 40], 50, units="mi")
+    """
+    return _grid("point", bbox, cell_side, units, mask, properties, False, as_array)
+
+
+def square_grid(
+    bbox: list,
+    cell_side: float,
+    units: str = "km",
+    mask: Mask = None,
+    properties: Optional[dict] = None,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
+    """
+    Creates a grid of square polygons in a bounding box, the side of the squares is
+    converted to degrees so they are squares in longitude and latitude.
+
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Side of every square.
+    :param units: Unit of ``cell_side``, one of the units of
+        :data:`turfpy.helper.conversions`.
+    :param mask: If provided only the squares intersecting this Polygon or
+        MultiPolygon are kept.
+    :param properties: Properties of every square.
+    :param as_array: If True an array of shape (N, 5, 2) of closed rings is
+        returned instead of a FeatureCollection.
+    :return: A FeatureCollection of polygons.
+
+    Exmample:
+
+    >>> from turfpy.grids import square_grid
+    >>> square_grid([-95, 30, -85, 40], 50, units="mi")
+    """
+    return _grid("square", bbox, cell_side, units, mask, properties, False, as_array)
+
+
+def hex_grid(
+    bbox: list,
+    cell_side: float,
+    units: str = "km",
+    mask: Mask = None,
+    properties: Optional[dict] = None,
+    triangles: bool = False,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
+    """
+    Creates a grid of hexagons in a bounding box, flat topped and with their
+    width and height measured at the center of the bounding box.
+
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Length of the side of the hexagons, which is their radius.
+    :param units: Unit of ``cell_side``, one of the units of
+        :data:`turfpy.helper.conversions`.
+    :param mask: If provided only the cells intersecting this Polygon or
+        MultiPolygon are kept.
+    :param properties: Properties of every cell.
+    :param triangles: If True every hexagon is split in 6 triangles.
+    :param as_array: If True an array of shape (N, 7, 2), or (N, 4, 2) for
+        triangles, of closed rings is returned instead of a FeatureCollection.
+    :return: A FeatureCollection of polygons.
+
+    Exmample:
+
+    >>> from turfpy.grids import hex_grid
+    >>> hex_grid([-95, 30, -85, 40], 50, units="mi")
+    """
+    return _grid("hex", bbox, cell_side, units, mask, properties, triangles, as_array)
+
+
+def triangle_grid(
+    bbox: list,
+    cell_side: float,
+    units: str = "km",
+    mask: Mask = None,
+    properties: Optional[dict] = None,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
+    """
+    Creates a grid of triangles covering a bounding box, every rectangular cell of
+    side ``cell_side`` is split in two triangles along alternating diagonals.
+
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Side of the rectangular cells split in triangles.
+    :param units: Unit of ``cell_side``, one of the units of
+        :data:`turfpy.helper.conversions`.
+    :param mask: If provided only the triangles intersecting this Polygon or
+        MultiPolygon are kept.
+    :param properties: Properties of every triangle.
+    :param as_array: If True an array of shape (N, 4, 2) of closed rings is
+        returned instead of a FeatureCollection.
+    :return: A FeatureCollection of polygons.
+
+    Exmample:
+
+    >>> from turfpy.grids import triangle_grid
+    >>> triangle_grid([-95, 30, -85, 40], 50, units="mi")
+    """
+    return _grid("triangle", bbox, cell_side, units, mask, properties, False, as_array)
+
+
+def iter_grid(
+    grid: str,
+    bbox: list,
+    cell_side: float,
+    units: str = "km",
+    mask: Mask = None,
+    properties: Optional[dict] = None,
+    triangles: bool = False,
+    chunk_size: int = 100_000,
+    as_array: bool = False,
+) -> Iterator[Union[FeatureCollection, np.ndarray]]:
+    """
+    Generates a grid in chunks of whole columns of cells, so that grids of tens of
+    millions of cells never have to be held in memory at once. The cells are the
+    same, and in the same order, as the ones of the corresponding grid function.
+
+    :param grid: 'point', 'square', 'hex' or 'triangle'.
+    :param bbox: Bounding box extent in west, south, east, north order.
+    :param cell_side: Size of the cells, see the corresponding grid function.
+    :param units: Unit of ``cell_side``, one of the units of
+        :data:`turfpy.helper.conversions`.
+    :param mask: If provided only the cells intersecting this Polygon or
+        MultiPolygon, or the points within it, are kept.
+    :param properties: Properties of every cell.
+    :param triangles: If True the hexagons of a 'hex' grid are split in triangles.
+    :param chunk_size: Maximum number of cells in each chunk before masking, a
+        chunk holds at least one column of cells.
+    :param as_array: If True arrays of coordinates are yielded instead of
+        FeatureCollections.
+    :return: An iterator of FeatureCollections.
+
+    Exmample:
+
+    >>> from turfpy.grids import iter_grid
+    >>> for chunk in iter_grid("hex", [-125, 24, -66, 50], 1, chunk_size=500_000):
+    ...     print(len(chunk["features"]))
+    """
+    if chunk_size < 1:
+        raise Exception("chunk_size must be a positive number")
+
+    columns, rows, _, cells, _ = _layout(grid, bbox, cell_side, units, triangles)
+    mask_geom = _mask(mask)
+    step = max(1, chunk_size // max(rows, 1))
+    for start in range(0, columns, step):
+        coords = _masked(cells(start, min(start + step, columns)), mask_geom)
+        yield coords if as_array else _to_features(coords, properties)
+
+
+def _grid(grid, bbox, cell_side, units, mask, properties, triangles, as_array):
+    columns, _, _, cells, _ = _layout(grid, bbox, cell_side, units, triangles)
+    coords = _masked(cells(0, columns), _mask(mask))
+    if as_array:
+        return coords
+    return _to_features(coords, properties)
+
+
+def _layout(
+    grid: str, bbox: list, cell_side: float, units: str, triangles: bool
+) -> _Layout:
+    if grid not in _GRIDS:
+        raise Exception(f"grid should be one of {', '.join(_GRIDS)}")
+    if len(bbox) != 4:
+        raise Exception("bbox with 4 positions are only supported")
+    if units not in conversions:
+        raise Exception(f"{units} unit is invalid")
+    if not cell_side > 0:
+        raise Exception("cell_side must be a positive number")
+
+    west, south, east, north = (float(b) for b in bbox)
+    if not (east > west and north > south):
+        raise Exception("bbox must have a positive width and height")
+    if grid == "point":
+        return _point_layout(west, south, east, north, cell_side, units)
+    if grid == "square":
+        return _square_layout(west, south, east, north, cell_side, units)
+    if grid == "hex":
+        return _hex_layout(west, south, east, north, cell_side, units, triangles)
+    return _triangle_layout(west, south, east, north, cell_side, units)
+
+
+def _cell_size(west, south, east, north, cell_side, units) -> Tuple[float, float]:
+    # degrees of longitude along the south edge and of latitude along the west edge
+    width = distance([west, south], [east, south], units)
+    height = distance([west, south], [west, north], units)
+    return cell_side / width * (east - west), cell_side / height * (north - south)
+
+
+def _point_layout(west, south, east, north, cell_side, units) -> _Layout:
+    cell_width, cell_height = _cell_size(west, south, east, north, cell_side, units)
+    columns = math.floor((east - west) / cell_width)
+    rows = math.floor((north - south) / cell_height)
+    x0 = west + ((east - west) - columns * cell_width) / 2
+    y0 = south + ((north - south) - rows * cell_height) / 2
+    y = y0 + np.arange(rows + 1) * cell_height
+
+    def cells(start: int, stop: int) -> np.ndarray:
+        x = x0 + np.arange(start, stop) * cell_width
+        return np.stack(np.meshgrid(x, y, indexing="ij"), axis=-1).reshape(-1, 2)
+
+    def bins(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        # nearest point of the grid
+        column = np.round((x - x0) / cell_width)
+        row = np.round((y - y0) / cell_height)
+        return _index(column, row, columns + 1, rows + 1)
+
+    return _Layout(columns + 1, rows + 1, (columns + 1) * (rows + 1), cells, bins)
+
+
+def _square_layout(west, south, east, north, cell_side, units) -> _Layout:
+    side = length_to_degrees(cell_side, units)
+    columns = math.floor(abs(east - west) / side)
+    rows = math.floor(abs(north - south) / side)
+    x0 = west + ((east - west) - columns * side) / 2
+    y0 = south + ((north - south) - rows * side) / 2
+    y = y0 + np.arange(rows) * side
+    ring = np.array([[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]) * side
+
+    def cells(start: int, stop: int) -> np.ndarray:
+        x = x0 + np.arange(start, stop) * side
+        corners = np.stack(np.meshgrid(x, y, indexing="ij"), axis=-1).reshape(-1, 1, 2)
+        return corners + ring
+
+    def bins(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        column = np.floor((x - x0) / side)
+        row = np.floor((y - y0) / side)
+        return _index(column, row, columns, rows)
+
+    return _Layout(columns, rows, columns * rows, cells, bins)
+
+
+def _hex_layout(west, south, east, north, cell_side, units, triangles) -> _Layout:
+    center_x = (west + east) / 2
+    center_y = (south + north) / 2
+    cell_width = (
+        cell_side
+        * 2
+        / distance([west, center_y], [east, center_y], units)
+        * (east - west)
+    )
+    cell_height = (
+        cell_side
+        * 2
+        / distance([center_x, south], [center_x, north], units)
+        * (north - south)
+    )
+    radius = cell_width / 2
+    hex_width = radius * 2
+    hex_height = math.sqrt(3) / 2 * cell_height
+    box_width = east - west
+    box_height = north - south
+    x_interval = 3 / 4 * hex_width
+
+    # the counts and offsets keep the hexagons inside the bbox
+    x_count = math.floor((box_width - hex_width) / (hex_width - radius / 2))
+    x_adjust = (
+        (x_count * x_interval - radius / 2 - box_width) / 2 - radius / 2 + x_interval / 2
+    )
+    y_count = math.floor((box_height - hex_height) / hex_height)
+    y_adjust = (box_height - y_count * hex_height) / 2
+    offset_y = y_count * hex_height - box_height > hex_height / 2
+    if offset_y:
+        y_adjust -= hex_height / 4
+
+    angles = np.arange(7) % 6 * 2 * math.pi / 6
+    ring = (
+        np.column_stack([np.cos(angles) * cell_width, np.sin(angles) * cell_height]) / 2
+    )
+    ys = np.arange(y_count + 1)
+
+    def cells(start: int, stop: int) -> np.ndarray:
+        x, y = np.meshgrid(np.arange(start, stop), ys, indexing="ij")
+        odd = x % 2 == 1
+        keep = ~((y == 0) & (odd | offset_y))
+        x, y, odd = x[keep], y[keep], odd[keep]
+        centers = np.column_stack(
+            [
+                x * x_interval + west - x_adjust,
+                y * hex_height + south + y_adjust - odd * hex_height / 2,
+            ]
+        )
+        if not triangles:
+            return centers[:, None] + ring
+        # center, two consecutive vertices and center again for each of 6 triangles
+        triangle = np.stack(
+            [np.zeros((6, 2)), ring[:6], ring[1:], np.zeros((6, 2))], axis=1
+        )
+        return (centers[:, None, None] + triangle).reshape(-1, 4, 2)
+
+    # in units of the radii the hexagons are regular, of radius 1, and the
+    # hexagon containing a position is the one of the nearest center
+    rx, ry = cell_width / 2, cell_height / 2
+    row_height = math.sqrt(3)
+
+    def bins(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        u = (x - (west - x_adjust)) / rx
+        v = (y - (south + y_adjust)) / ry
+        # the position is in a hexagon of one of two neighbouring columns
+        first = np.floor(u / 1.5)
+        candidates = []
+        for column in (first, first + 1):
+            shift = column % 2 * row_height / 2
+            row = np.round((v + shift) / row_height)
+            du = u - column * 1.5
+            dv = v - row * row_height + shift
+            candidates.append((du**2 + dv**2, column, row, du, dv))
+        second = candidates[1][0] < candidates[0][0]
+        column, row, du, dv = (
+            np.where(second, b, a) for a, b in zip(candidates[0][1:], candidates[1][1:])
+        )
+        skipped = (row == 0) & ((column % 2 == 1) | offset_y)
+        index = _index(column, row, x_count + 1, y_count + 1)
+        index[skipped] = -1
+        # cells skipped in the previous columns and in the first row of the column
+        before = column if offset_y else column // 2
+        first_row = (column % 2 == 1) | offset_y
+        index = np.where(index >= 0, index - before.astype(np.int64) - first_row, -1)
+        if triangles:
+            sector = np.floor(np.arctan2(dv, du) / (math.pi / 3)).astype(np.int64) % 6
+            index = np.where(index >= 0, index * 6 + sector, -1)
+        return index
+
+    columns = max(x_count + 1, 0)
+    size = columns * max(y_count + 1, 0)
+    size -= columns if offset_y else columns // 2
+    size = max(size, 0) * (6 if triangles else 1)
+    return _Layout(columns, (y_count + 1) * (6 if triangles else 1), size, cells, bins)
+
+
+# unit offsets of the two triangles of a cell, by parity of its column and row
+_TRIANGLES = np.array(
+    [
+        # column and row of same parity
+        [[[0, 0], [0, 1], [1, 0], [0, 0]], [[0, 1], [1, 1], [1, 0], [0, 1]]],
+        # even column and odd row
+        [[[0, 0], [1, 1], [1, 0], [0, 0]], [[0, 0], [0, 1], [1, 1], [0, 0]]],
+        # odd column and even row
+        [[[0, 0], [0, 1], [1, 1], [0, 0]], [[0, 0], [1, 1], [1, 0], [0, 0]]],
+    ],
+    dtype=float,
+)
+
+
+def _triangle_layout(west, south, east, north, cell_side, units) -> _Layout:
+    cell_width, cell_height = _cell_size(west, south, east, north, cell_side, units)
+    # cells start at the south west corner and cover the bbox
+    columns = math.floor((east - west) / cell_width) + 1
+    rows = math.floor((north - south) / cell_height) + 1
+    size = np.array([cell_width, cell_height])
+
+    def cells(start: int, stop: int) -> np.ndarray:
+        x, y = np.meshgrid(np.arange(start, stop), np.arange(rows), indexing="ij")
+        x, y = x.ravel(), y.ravel()
+        pattern = np.where(x % 2 == y % 2, 0, np.where(x % 2 == 0, 1, 2))
+        corners = np.column_stack([west + x * cell_width, south + y * cell_height])
+        coords = corners[:, None, None] + _TRIANGLES[pattern] * size
+        return coords.reshape(-1, 4, 2)
+
+    def bins(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        u = (x - west) / cell_width
+        v = (y - south) / cell_height
+        column, row = np.floor(u), np.floor(v)
+        fx, fy = u - column, v - row
+        # second triangle of the cell, by pattern of the diagonal
+        second = np.where(
+            column % 2 == row % 2,
+            fx + fy > 1,
+            np.where(column % 2 == 0, fy > fx, fy < fx),
+        )
+        index = _index(column, row, columns, rows)
+        return np.where(index >= 0, index * 2 + second, -1)
+
+    return _Layout(columns, rows * 2, columns * rows * 2, cells, bins)
+
+
+def _index(column: np.ndarray, row: np.ndarray, columns: int, rows: int) -> np.ndarray:
+    # index of the cells ordered by column then row, -1 outside the grid
+    inside = (column >= 0) & (column < columns) & (row >= 0) & (row < rows)
+    return np.where(inside, column * rows + row, -1).astype(np.int64)
+
+
+def _mask(mask: Mask):
+    if mask is None:
+        return None
+
+    import shapely
+    from shapely.geometry import shape
+
+    geom = get_geom(mask)
+    if geom["type"] not in ("Polygon", "MultiPolygon"):
+        raise Exception("mask must be a Polygon or MultiPolygon")
+    poly = shape(geom)
+    shapely.prepare(poly)
+    return poly
+
+
+def _masked(coords: np.ndarray, mask) -> np.ndarray:
+    if mask is None or not len(coords):
+        return coords
+
+    import shapely
+
+    if coords.ndim == 2:
+        return coords[shapely.contains_xy(mask, coords[:, 0], coords[:, 1])]
+    # cells with a vertex inside the mask are kept, the exact predicates are only
+    # evaluated for the others, crossing the boundary of the mask or outside it
+    keep = shapely.contains_xy(mask, coords[..., 0], coords[..., 1]).any(axis=1)
+    rest = np.flatnonzero(~keep)
+    cells = shapely.polygons(coords[rest])
+    crossing = shapely.intersects(mask, cells)
+    # cells sharing only their boundary with the mask are not kept
+    crossing[crossing] = ~shapely.touches(mask, cells[crossing])
+    keep[rest[crossing]] = True
+    return coords[keep]
+
+
+def _to_features(coords: np.ndarray, properties: Optional[dict]) -> FeatureCollection:
+    if coords.ndim == 2:
+        return FeatureCollection(
+            [
+                Feature(geometry=Point(c), properties=dict(properties or {}))
+                for c in coords.tolist()
+            ]
+        )
+    return FeatureCollection(
+        [
+            Feature(geometry=Polygon([ring]), properties=dict(properties or {}))
+            for ring in coords.tolist()
+        ]
+    )
@@ -150,3 +150,43 @@ def convert_angle_to_360(alfa: float):
     if beta < 0:
         beta += 360
     return beta
+
+
+# nesting depth of positions in the coordinates of each geometry type
+_DEPTHS = {
+    "Point": 0,
+    "LineString": 1,
+    "MultiPoint": 1,
+    "Polygon": 2,
+    "MultiLineString": 2,
+    "MultiPolygon": 3,
+}
+
+
+def count_vertices(geojson: dict) -> int:
+    """
+    Counts the positions of a GeoJSON object without iterating over them.
+
+    :param geojson: A GeoJSON Feature, FeatureCollection or Geometry.
+    :return: The number of positions.
+    """
+    geom_type = geojson.get("type")
+    if geom_type == "Feature":
+        geometry = geojson.get("geometry")
+        return count_vertices(geometry) if isinstance(geometry, dict) else 0
+    if geom_type == "FeatureCollection":
+        return sum(count_vertices(f) for f in geojson.get("features") or ())
+    if geom_type == "GeometryCollection":
+        return sum(count_vertices(g) for g in geojson.get("geometries") or ())
+    if geom_type not in _DEPTHS:
+        return 0
+
+    coordinates = geojson.get("coordinates") or []
+    depth = _DEPTHS[geom_type]
+    if depth == 0:
+        return 1 if coordinates else 0
+    if depth == 1:
+        return len(coordinates)
+    if depth == 2:
+        return sum(map(len, coordinates))
+    return sum(len(ring) for part in coordinates for ring in part)
@@ -0,0 +1,283 @@
+"""
+This module implements a static R-tree of bounding boxes built with the
+Sort-Tile-Recursive algorithm, depending only on numpy.
+
+The tree is stored in flat arrays: the boxes of every level, from the indexed
+boxes up to the root, and the offsets of the levels. The children of the node
+``i`` of a level are the nodes ``i * node_capacity`` to ``(i + 1) * node_capacity``
+of the level below, so no pointer is stored and queries walk the tree one level
+at a time with vectorized operations. A tree saved with :meth:`STRTree.save` can
+be opened memory-mapped by :func:`open_index` in every process using it.
+"""
+
+import heapq
+import json
+import math
+import os
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+# names of the arrays of a tree
+_ARRAYS = ("boxes", "level_offsets", "items")
+
+
+class STRTree:
+    """
+    Static R-tree of bounding boxes.
+
+    :param bounds: An array of shape (N, 4) of west, south, east, north, like the
+        result of :meth:`turfpy.store.CoordinateStore.bbox`. Rows containing NaN
+        are not indexed.
+    :param node_capacity: Maximum number of children of every node.
+
+    Example:
+
+    >>> import numpy as np
+    >>> from turfpy.index import STRTree
+    >>> tree = STRTree(np.array([[0, 0, 1, 1], [2, 2, 3, 3], [5, 5, 6, 6]]))
+    >>> tree.query([0.5, 0.5, 2.5, 2.5])
+    array([0, 1])
+    >>> tree.nearest([[4, 4]], k=1)
+    (array([0]), array([1]), array([1.41421356]))
+    """
+
+    def __init__(self, bounds, node_capacity: int = 16):
+        if node_capacity < 2:
+            raise Exception("node_capacity should be greater than 1")
+
+        bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        items = np.flatnonzero(~np.isnan(bounds).any(axis=1))
+        boxes = bounds[items]
+        order = _str_order(boxes, node_capacity)
+
+        levels = [boxes[order]]
+        while len(levels[-1]) > 1:
+            levels.append(_parents(levels[-1], node_capacity))
+
+        self.boxes = np.concatenate(levels) if levels[0].size else np.empty((0, 4))
+        self.level_offsets = np.cumsum([0] + [len(level) for level in levels])
+        self.items = items[order]
+        self.node_capacity = node_capacity
+        self.path: Optional[str] = None
+
+    @classmethod
+    def _from_arrays(cls, boxes, level_offsets, items, node_capacity, path=None):
+        tree = cls.__new__(cls)
+        tree.boxes = boxes
+        tree.level_offsets = level_offsets
+        tree.items = items
+        tree.node_capacity = node_capacity
+        tree.path = path
+        return tree
+
+    def __reduce__(self):
+        # a memory-mapped tree is reopened from its files
+        if self.path is not None:
+            return open_index, (self.path,)
+        return STRTree._from_arrays, (
+            self.boxes,
+            self.level_offsets,
+            self.items,
+            self.node_capacity,
+        )
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    @property
+    def total_bounds(self) -> np.ndarray:
+        """Bounding box of all indexed boxes, NaN for an empty tree."""
+        if not len(self):
+            return np.full(4, np.nan)
+        return np.asarray(self.boxes[-1])
+
+    def query(self, bbox) -> np.ndarray:
+        """
+        Finds the boxes intersecting a bounding box, boundaries included.
+
+        :param bbox: Bounding box in west, south, east, north order, or a position.
+        :return: The sorted indices of the intersecting boxes.
+        """
+        return self.query_many([_as_box(bbox)])[1]
+
+    def query_many(self, bounds) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the boxes intersecting every bounding box of an array, all queries
+        are processed together level by level.
+
+        :param bounds: An array of shape (Q, 4) of bounding boxes or (Q, 2) of
+            positions.
+        :return: Two integer arrays ``(query_idx, item_idx)`` of the intersecting
+            pairs, sorted by query then item.
+        """
+        queries = _as_boxes(bounds)
+        query_idx = np.arange(len(queries)) if len(self) else np.empty(0, np.intp)
+        nodes = np.zeros(len(query_idx), dtype=np.intp)
+
+        for level in range(len(self.level_offsets) - 2, -1, -1):
+            boxes = self.boxes[self.level_offsets[level] + nodes]
+            q = queries[query_idx]
+            keep = (
+                (boxes[:, 0] <= q[:, 2])
+                & (boxes[:, 2] >= q[:, 0])
+                & (boxes[:, 1] <= q[:, 3])
+                & (boxes[:, 3] >= q[:, 1])
+            )
+            query_idx, nodes = query_idx[keep], nodes[keep]
+            if level:
+                query_idx, nodes = self._children(level, query_idx, nodes)
+
+        items = self.items[nodes]
+        order = np.lexsort((items, query_idx))
+        return query_idx[order], items[order]
+
+    def nearest(
+        self, bounds, k: int = 1, max_distance: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the ``k`` nearest boxes of every query box, by planar distance between
+        boxes in the units of the coordinates, 0 for intersecting boxes. The tree is
+        searched best first, nodes farther than the ``k`` nearest boxes found are
+        never visited.
+
+        :param bounds: An array of shape (Q, 4) of bounding boxes or (Q, 2) of
+            positions.
+        :param k: Number of nearest boxes of every query.
+        :param max_distance: If provided, farther boxes are ignored.
+        :return: Three arrays ``(query_idx, item_idx, distance)``, sorted by query
+            then distance.
+        """
+        if k < 1:
+            raise Exception("k should be greater than 0")
+
+        queries = _as_boxes(bounds)
+        limit = math.inf if max_distance is None else max_distance
+        top = len(self.level_offsets) - 2
+        results = []
+        for q, query in enumerate(queries):
+            if not len(self) or np.isnan(query).any():
+                continue
+            found = 0
+            heap = [(float(_distances(self.boxes[-1:], query)[0]), top, 0)]
+            while heap and found < k:
+                distance, level, node = heapq.heappop(heap)
+                if distance > limit:
+                    break
+                if level == 0:
+                    results.append((q, self.items[node], distance))
+                    found += 1
+                    continue
+                # children are contiguous in the level below
+                offset = self.level_offsets[level - 1]
+                start = node * self.node_capacity
+                stop = min(start + self.node_capacity, self.level_offsets[level] - offset)
+                distances = _distances(
+                    self.boxes[offset + start : offset + stop], query
+                ).tolist()
+                for child, child_distance in enumerate(distances, start):
+                    heapq.heappush(heap, (child_distance, level - 1, child))
+
+        if not results:
+            return np.empty(0, np.intp), np.empty(0, np.intp), np.empty(0)
+        columns = list(zip(*results))
+        return (
+            np.array(columns[0], dtype=np.intp),
+            np.array(columns[1], dtype=np.intp),
+            np.array(columns[2], dtype=float),
+        )
+
+    def _children(self, level: int, query_idx: np.ndarray, nodes: np.ndarray):
+        # expand every node to its children in the level below
+        size = self.level_offsets[level] - self.level_offsets[level - 1]
+        starts = nodes * self.node_capacity
+        counts = np.minimum(self.node_capacity, size - starts)
+        total = int(counts.sum())
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        children = np.repeat(starts, counts) + np.arange(total) - first
+        return np.repeat(query_idx, counts), children
+
+    def save(self, path: Union[str, os.PathLike]) -> "STRTree":
+        """
+        Writes the arrays of the tree to a directory.
+
+        :param path: Directory of the tree, created if it does not exist.
+        :return: The tree opened memory-mapped with :func:`open_index`.
+        """
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+        for name in _ARRAYS:
+            np.save(os.path.join(path, name + ".npy"), getattr(self, name))
+        with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "node_capacity": self.node_capacity}, f)
+        return open_index(path)
+
+
+def open_index(path: Union[str, os.PathLike]) -> STRTree:
+    """
+    Opens a tree written by :meth:`STRTree.save`, arrays are memory-mapped read only
+    and pickling the tree only pickles its path.
+
+    :param path: Directory of the tree.
+    :return: A :class:`STRTree`.
+
+    Example:
+
+    >>> from turfpy.index import open_index
+    >>> tree = open_index("parcels.index")
+    >>> tree.query([2.2, 48.8, 2.5, 48.9])
+    """
+    path = os.fspath(path)
+    with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    boxes, level_offsets, items = (
+        np.load(os.path.join(path, name + ".npy"), mmap_mode="r") for name in _ARRAYS
+    )
+    return STRTree._from_arrays(boxes, level_offsets, items, meta["node_capacity"], path)
+
+
+def _str_order(boxes: np.ndarray, node_capacity: int) -> np.ndarray:
+    # sort by x into vertical slices of whole nodes, then by y in every slice
+    x = (boxes[:, 0] + boxes[:, 2]) / 2
+    y = (boxes[:, 1] + boxes[:, 3]) / 2
+    nodes = math.ceil(len(boxes) / node_capacity)
+    slice_size = math.ceil(math.sqrt(nodes)) * node_capacity
+    by_x = np.argsort(x, kind="stable")
+    slices = np.arange(len(boxes)) // max(slice_size, 1)
+    return by_x[np.lexsort((y[by_x], slices))]
+
+
+def _parents(boxes: np.ndarray, node_capacity: int) -> np.ndarray:
+    starts = np.arange(0, len(boxes), node_capacity)
+    return np.column_stack(
+        [
+            np.minimum.reduceat(boxes[:, 0], starts),
+            np.minimum.reduceat(boxes[:, 1], starts),
+            np.maximum.reduceat(boxes[:, 2], starts),
+            np.maximum.reduceat(boxes[:, 3], starts),
+        ]
+    )
+
+
+def _distances(boxes: np.ndarray, box: np.ndarray) -> np.ndarray:
+    dx = np.maximum(0, np.maximum(boxes[:, 0] - box[2], box[0] - boxes[:, 2]))
+    dy = np.maximum(0, np.maximum(boxes[:, 1] - box[3], box[1] - boxes[:, 3]))
+    return np.hypot(dx, dy)
+
+
+def _as_box(bbox) -> np.ndarray:
+    bbox = np.asarray(bbox, dtype=float)
+    if bbox.shape == (2,):
+        return np.concatenate([bbox, bbox])
+    if bbox.shape != (4,):
+        raise Exception("bbox should be a bounding box or a position")
+    return bbox
+
+
+def _as_boxes(bounds) -> np.ndarray:
+    bounds = np.asarray(bounds, dtype=float)
+    if bounds.ndim != 2 or bounds.shape[1] not in (2, 4):
+        raise Exception("bounds should be an array of shape (N, 4) or (N, 2)")
+    if bounds.shape[1] == 2:
+        return np.concatenate([bounds, bounds], axis=1)
+    return bounds
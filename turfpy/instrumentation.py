@@ -0,0 +1,264 @@
+"""
+This module implements an opt-in instrumentation of turfpy recording, per function,
+the number of calls, the cumulative time, the number of vertices of the GeoJSON
+arguments and the number of memory blocks allocated.
+
+Instrumentation is enabled by setting the ``TURFPY_INSTRUMENTATION`` environment
+variable before importing turfpy, or with :func:`enable` or :func:`instrumented`.
+Enabling it replaces the public functions of turfpy, the shapely conversions and
+the dispatch of :func:`turfpy.parallel.map_chunks` and of
+:class:`turfpy.pipeline.Pipeline` by recording wrappers, disabling it puts the
+original functions back, so it costs nothing when disabled.
+
+Times are inclusive, the time of :func:`turfpy.measurement.bbox` includes the time
+of the :func:`turfpy.meta.coord_each` it calls. Functions imported with
+``from turfpy.measurement import area`` before enabling instrumentation are not
+recorded, and calls made in the worker processes of a pipeline are not collected.
+"""
+
+import functools
+import importlib
+import inspect
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from turfpy.helper import count_vertices
+
+ENVIRONMENT_VARIABLE = "TURFPY_INSTRUMENTATION"
+
+# modules whose public functions are recorded
+_MODULES = (
+    "turfpy.aggregation",
+    "turfpy.boolean",
+    "turfpy.clusters",
+    "turfpy.feature_conversion",
+    "turfpy.grids",
+    "turfpy.io",
+    "turfpy.measurement",
+    "turfpy.meta",
+    "turfpy.misc",
+    "turfpy.random",
+    "turfpy.transformation",
+)
+
+# internals recorded as well, as module and attribute path
+_INTERNALS = (
+    ("shapely.geometry", "shape"),
+    ("shapely.geometry", "mapping"),
+    ("turfpy.parallel", "map_chunks"),
+    ("turfpy.pipeline", "Pipeline._chunks"),
+)
+
+# calls, seconds, vertices and allocated blocks of every recorded function
+_STATS: Dict[str, List] = {}
+_LOCK = threading.Lock()
+
+# owner, attribute and original value of every patched attribute
+_PATCHED: List[Tuple[object, str, Callable]] = []
+
+
+def enable():
+    """
+    Starts recording, imports every instrumented module. Does nothing if
+    instrumentation is already enabled.
+
+    Example:
+
+    >>> from turfpy import instrumentation
+    >>> instrumentation.enable()
+    """
+    if _PATCHED:
+        return
+
+    targets = []
+    for name in _MODULES:
+        module = importlib.import_module(name)
+        for attribute, value in vars(module).items():
+            if (
+                not attribute.startswith("_")
+                and inspect.isfunction(value)
+                and value.__module__ == name
+            ):
+                targets.append((module, attribute, value))
+    for name, path in _INTERNALS:
+        owner: object = importlib.import_module(name)
+        *parents, attribute = path.split(".")
+        for parent in parents:
+            owner = getattr(owner, parent)
+        targets.append((owner, attribute, getattr(owner, attribute)))
+
+    wrappers = {}
+    for owner, attribute, func in targets:
+        if func not in wrappers:
+            wrappers[func] = _wrap(func, f"{func.__module__}.{func.__qualname__}")
+        setattr(owner, attribute, wrappers[func])
+        _PATCHED.append((owner, attribute, func))
+
+    # functions imported by other turfpy modules are referenced by their namespace
+    for module_name, module in list(sys.modules.items()):
+        if module_name.split(".")[0] != "turfpy" or module_name == __name__:
+            continue
+        for attribute, value in list(vars(module).items()):
+            if inspect.isfunction(value) and value in wrappers:
+                setattr(module, attribute, wrappers[value])
+                _PATCHED.append((module, attribute, value))
+
+
+def disable():
+    """Stops recording and restores the original functions, recorded statistics
+    are kept until :func:`reset`."""
+    while _PATCHED:
+        owner, attribute, func = _PATCHED.pop()
+        setattr(owner, attribute, func)
+
+
+def is_enabled() -> bool:
+    """
+    :return: True if instrumentation is enabled.
+    """
+    return bool(_PATCHED)
+
+
+def reset():
+    """Clears the recorded statistics."""
+    with _LOCK:
+        for stats in _STATS.values():
+            stats[:] = [0, 0.0, 0, 0]
+
+
+@contextmanager
+def instrumented(reset_stats: bool = True) -> Iterator[None]:
+    """
+    Context manager enabling instrumentation in its block, instrumentation is
+    disabled on exit unless it was already enabled.
+
+    :param reset_stats: If True the recorded statistics are cleared on entry.
+
+    Example:
+
+    >>> from turfpy import instrumentation
+    >>> from turfpy import measurement
+    >>> with instrumentation.instrumented():
+    ...     measurement.bbox(polygon)
+    >>> instrumentation.snapshot()["turfpy.meta.coord_each"]
+    """
+    enabled = is_enabled()
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable()
+
+
+def snapshot() -> Dict[str, dict]:
+    """
+    Statistics of the functions called since instrumentation was enabled or last
+    reset. ``allocated_blocks`` is the difference of ``sys.getallocatedblocks()``
+    before and after the calls, the number of memory blocks allocated and not yet
+    freed.
+
+    :return: A dict of ``calls``, ``seconds``, ``vertices`` and
+        ``allocated_blocks`` keyed by qualified function name.
+    """
+    with _LOCK:
+        return {
+            name: {
+                "calls": calls,
+                "seconds": seconds,
+                "vertices": vertices,
+                "allocated_blocks": blocks,
+            }
+            for name, (calls, seconds, vertices, blocks) in sorted(_STATS.items())
+            if calls
+        }
+
+
+def to_prometheus(stats: Optional[Dict[str, dict]] = None) -> str:
+    """
+    Formats statistics in the Prometheus text exposition format.
+
+    :param stats: Statistics returned by :func:`snapshot`, default to the current
+        ones.
+    :return: The metrics as text.
+    """
+    if stats is None:
+        stats = snapshot()
+
+    metrics = (
+        ("calls", "turfpy_calls_total", "counter", "Number of calls."),
+        ("seconds", "turfpy_seconds_total", "counter", "Cumulative time in seconds."),
+        ("vertices", "turfpy_vertices_total", "counter", "Vertices of the arguments."),
+        (
+            "allocated_blocks",
+            "turfpy_allocated_blocks",
+            "gauge",
+            "Memory blocks allocated and not freed.",
+        ),
+    )
+    lines = []
+    for key, metric, kind, help in metrics:
+        lines.append(f"# HELP {metric} {help}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, values in stats.items():
+            lines.append(f'{metric}{{function="{name}"}} {values[key]}')
+    return "\n".join(lines) + "\n"
+
+
+def _wrap(func: Callable, name: str) -> Callable:
+    stats = _STATS.setdefault(name, [0, 0.0, 0, 0])
+
+    def record(vertices, blocks, seconds):
+        with _LOCK:
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] += vertices
+            stats[3] += sys.getallocatedblocks() - blocks
+
+    if inspect.isgeneratorfunction(func):
+        # only the time spent in the generator is recorded, not in its consumer
+        @functools.wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            vertices = _count_vertices(args, kwargs)
+            blocks = sys.getallocatedblocks()
+            seconds = 0.0
+            iterator = func(*args, **kwargs)
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        item = next(iterator)
+                    except StopIteration as e:
+                        return e.value
+                    finally:
+                        seconds += time.perf_counter() - start
+                    yield item
+            finally:
+                record(vertices, blocks, seconds)
+
+        return generator_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        vertices = _count_vertices(args, kwargs)
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(vertices, blocks, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _count_vertices(args: tuple, kwargs: dict) -> int:
+    count = 0
+    for value in args + tuple(kwargs.values()):
+        if isinstance(value, dict):
+            count += count_vertices(value)
+    return count
@@ -0,0 +1,660 @@
+"""
+This module implements readers and writers which allows to process GeoJSON files
+that are too large to be loaded in memory at once, and a compact integer encoding of
+coordinates for large payloads.
+"""
+
+import copy
+import json
+import os
+import socket
+from io import BufferedIOBase, RawIOBase
+from itertools import chain
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from geojson import Feature
+
+from turfpy.helper import _DEPTHS
+
+_WHITESPACE = " \t\n\r"
+_RS = "\x1e"
+
+
+def read_features(
+    source: Union[str, os.PathLike, IO[str]],
+    properties: Optional[List[str]] = None,
+    bbox: Optional[list] = None,
+    buffer_size: int = 1 << 16,
+) -> Iterator[Feature]:
+    """
+    Reads the features of a GeoJSON FeatureCollection file one at a time. The
+    ``features`` array is parsed incrementally from buffered reads, so memory
+    stays constant whatever the size of the file.
+
+    :param source: Path of the file or file object opened in text mode.
+    :param properties: If provided only these properties are kept.
+    :param bbox: If provided, features whose bbox does not intersect this bbox in
+        west, south, east, north order are skipped before being converted to
+        ``geojson.Feature``, the ``bbox`` member of features is used when present.
+    :param buffer_size: Number of characters read at a time.
+    :return: An iterator of GeoJSON Features.
+
+    Example:
+
+    >>> from turfpy.io import read_features
+    >>> for feature in read_features("parcels.geojson", properties=["id"],
+    ...                              bbox=[2.2, 48.8, 2.5, 48.9]):
+    ...     print(feature["properties"])
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            yield from read_features(f, properties, bbox, buffer_size)
+        return
+
+    stream = _JSONStream(source, buffer_size)
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.decode()
+        stream.expect(":")
+
+        if key != "features":
+            stream.decode()
+        else:
+            stream.expect("[")
+            if stream.peek() == "]":
+                return
+            while True:
+                feature = stream.decode()
+                if bbox is None or _bbox_intersects(_feature_bbox(feature), bbox):
+                    yield _to_feature(feature, properties)
+                if stream.next() == "]":
+                    return
+                stream.unexpected(",")
+
+        if stream.next() == "}":
+            return
+        stream.unexpected(",")
+
+
+class _JSONStream:
+    """
+    Buffered reader decoding JSON values one after the other with
+    ``json.JSONDecoder.raw_decode``.
+    """
+
+    def __init__(self, file: IO[str], buffer_size: int):
+        self.file = file
+        self.buffer_size = buffer_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.last = ""
+
+    def read(self):
+        # read at least as much as is pending so that large values are decoded
+        # in a number of retries logarithmic in their size
+        chunk = self.file.read(max(self.buffer_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof:
+                raise Exception("Unexpected end of GeoJSON file")
+            self.read()
+
+    def next(self) -> str:
+        self.last = self.peek()
+        self.pos += 1
+        return self.last
+
+    def expect(self, char: str):
+        self.next()
+        self.unexpected(char)
+
+    def unexpected(self, char: str):
+        if self.last != char:
+            raise Exception(
+                f"Invalid FeatureCollection, expected {char!r} got {self.last!r}"
+            )
+
+    def decode(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.read()
+                continue
+            # a number at the end of the buffer may continue in the next read
+            if end == len(self.buffer) and not self.eof:
+                self.read()
+                continue
+            self.pos = end
+            return value
+
+
+def _feature_bbox(feature: dict) -> Optional[list]:
+    if feature.get("bbox"):
+        bbox = feature["bbox"]
+        half = len(bbox) // 2
+        return [bbox[0], bbox[1], bbox[half], bbox[half + 1]]
+    return _geometry_bbox(feature.get("geometry"))
+
+
+def _geometry_bbox(geometry: Optional[dict]) -> Optional[list]:
+    if not geometry:
+        return None
+
+    if geometry["type"] == "GeometryCollection":
+        boxes = [b for b in map(_geometry_bbox, geometry["geometries"]) if b]
+        if not boxes:
+            return None
+        return [
+            min(b[0] for b in boxes),
+            min(b[1] for b in boxes),
+            max(b[2] for b in boxes),
+            max(b[3] for b in boxes),
+        ]
+
+    positions = [geometry["coordinates"]]
+    for _ in range(_DEPTHS[geometry["type"]]):
+        positions = list(chain.from_iterable(positions))
+    if not positions:
+        return None
+
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+def _bbox_intersects(feature_bbox: Optional[list], bbox: list) -> bool:
+    if feature_bbox is None:
+        return False
+    return (
+        feature_bbox[0] <= bbox[2]
+        and feature_bbox[2] >= bbox[0]
+        and feature_bbox[1] <= bbox[3]
+        and feature_bbox[3] >= bbox[1]
+    )
+
+
+def _to_feature(feature: dict, properties: Optional[List[str]]) -> Feature:
+    props = feature.get("properties") or {}
+    if properties is not None:
+        props = {k: props[k] for k in properties if k in props}
+
+    result = Feature(geometry=feature.get("geometry"), properties=props)
+    if "id" in feature:
+        result.id = feature["id"]
+    if "bbox" in feature:
+        result.bbox = feature["bbox"]
+    return result
+
+
+def read_seq(source: Union[str, os.PathLike, IO[str]]) -> Iterator[Feature]:
+    """
+    Reads a GeoJSON Text Sequence file (RFC 8142) or newline-delimited GeoJSON
+    file one feature at a time. Leading record separators and blank lines are
+    ignored.
+
+    :param source: Path of the file or file object opened in text mode.
+    :return: An iterator of GeoJSON Features.
+
+    Example:
+
+    >>> from turfpy.io import read_seq
+    >>> for feature in read_seq("parcels.geojsons"):
+    ...     print(feature["properties"])
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="utf-8") as f:
+            yield from read_seq(f)
+        return
+
+    for line in source:
+        line = line.strip(_RS + _WHITESPACE)
+        if line:
+            yield _to_feature(json.loads(line), None)
+
+
+def write_seq(
+    features: Iterable[dict],
+    target: Union[str, os.PathLike, IO[str]],
+    record_separator: bool = False,
+    precision: Optional[int] = None,
+) -> int:
+    """
+    Writes features as a GeoJSON Text Sequence, one compact JSON text per line.
+
+    :param features: An iterable of GeoJSON Features.
+    :param target: Path of the file or file object opened in text mode.
+    :param record_separator: If True every text is prefixed with the RFC 8142
+        record separator, otherwise newline-delimited GeoJSON is written.
+    :param precision: If provided the coordinates are rounded to this number of
+        decimals.
+    :return: The number of features written.
+
+    Example:
+
+    >>> from geojson import Feature, Point
+    >>> from turfpy.io import write_seq
+    >>> write_seq([Feature(geometry=Point((1, 2)))], "points.geojsons")
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8") as f:
+            return write_seq(features, f, record_separator, precision)
+
+    prefix = _RS if record_separator else ""
+    count = 0
+    for feature in features:
+        if precision is not None:
+            feature = _round_feature(feature, precision)
+        target.write(prefix + _dumps(feature) + "\n")
+        count += 1
+    return count
+
+
+def write_features(
+    features: Iterable[dict],
+    target: Union[str, os.PathLike, IO, socket.socket],
+    precision: Optional[int] = None,
+    chunk_size: int = 10_000,
+    buffer_size: int = 1 << 20,
+) -> int:
+    """
+    Writes features as a GeoJSON FeatureCollection incrementally, so that the
+    features of a generator, like the results of a
+    :class:`turfpy.pipeline.Pipeline`, are never held in memory at once. Features
+    are serialized by chunks with the C encoder of ``json``, their coordinates are
+    rounded beforehand to control the precision of the floats.
+
+    :param features: An iterable of GeoJSON Features.
+    :param target: Path of the file, file object opened in text or binary mode, or
+        connected socket.
+    :param precision: If provided the coordinates are rounded to this number of
+        decimals.
+    :param chunk_size: Number of features serialized at a time.
+    :param buffer_size: Number of characters buffered between two writes.
+    :return: The number of features written.
+
+    Example:
+
+    >>> from turfpy.io import write_features
+    >>> from turfpy.misc import line_segment
+    >>> from geojson import Feature, LineString
+    >>> line = Feature(geometry=LineString([[i / 7, i / 3] for i in range(1000)]))
+    >>> write_features(line_segment(line)["features"], "segments.geojson", precision=6)
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8") as f:
+            return write_features(features, f, precision, chunk_size, buffer_size)
+
+    def chunks():
+        chunk = []
+        for feature in features:
+            if precision is not None:
+                feature = _round_feature(feature, precision)
+            chunk.append(feature)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    return _write_collection(chunks(), target, buffer_size)
+
+
+def write_columns(
+    coordinates,
+    target: Union[str, os.PathLike, IO, socket.socket],
+    geometry_type: str = "Point",
+    properties: Optional[Dict[str, Any]] = None,
+    precision: Optional[int] = None,
+    chunk_size: int = 10_000,
+    buffer_size: int = 1 << 20,
+) -> int:
+    """
+    Writes columnar arrays as a GeoJSON FeatureCollection incrementally, without
+    creating a Feature for every row, like the arrays returned with ``as_array`` by
+    :mod:`turfpy.grids` and :mod:`turfpy.random`. The coordinates of a chunk of rows
+    are rounded at once with NumPy.
+
+    :param coordinates: An array of shape (N, 2) of the positions of Points, or of
+        shape (N, K, 2) of the positions of LineStrings or of the rings of Polygons.
+    :param target: Path of the file, file object opened in text or binary mode, or
+        connected socket.
+    :param geometry_type: 'Point', 'LineString' or 'Polygon'.
+    :param properties: Arrays of the values of the properties of every row, keyed
+        by property.
+    :param precision: If provided the coordinates are rounded to this number of
+        decimals.
+    :param chunk_size: Number of rows serialized at a time.
+    :param buffer_size: Number of characters buffered between two writes.
+    :return: The number of features written.
+
+    Example:
+
+    >>> from turfpy.grids import hex_grid
+    >>> from turfpy.io import write_columns
+    >>> cells = hex_grid([-125, 24, -66, 50], 10, as_array=True)
+    >>> write_columns(cells, "cells.geojson", "Polygon", precision=5)
+    """
+    import numpy as np
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "w", encoding="utf-8") as f:
+            return write_columns(
+                coordinates,
+                f,
+                geometry_type,
+                properties,
+                precision,
+                chunk_size,
+                buffer_size,
+            )
+
+    coordinates = np.asarray(coordinates, dtype=float)
+    dimensions = 2 if geometry_type == "Point" else 3
+    if geometry_type not in ("Point", "LineString", "Polygon"):
+        raise Exception("geometry type should be one of Point, LineString, Polygon")
+    if coordinates.ndim != dimensions:
+        raise Exception(
+            f"{geometry_type} coordinates should have {dimensions} dimensions"
+        )
+    columns = properties or {}
+    for name, column in columns.items():
+        if len(column) != len(coordinates):
+            raise Exception(f"{name} values should have one value per row")
+
+    def chunks():
+        for start in range(0, len(coordinates), chunk_size):
+            chunk = coordinates[start : start + chunk_size]
+            if precision is not None:
+                chunk = np.round(chunk, precision)
+            positions = chunk.tolist()
+            if geometry_type == "Polygon":
+                positions = [[ring] for ring in positions]
+            values = [
+                np.asarray(column[start : start + chunk_size]).tolist()
+                for column in columns.values()
+            ]
+            rows = zip(*values) if values else [()] * len(positions)
+            yield [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": geometry_type, "coordinates": position},
+                    "properties": dict(zip(columns, row)),
+                }
+                for position, row in zip(positions, rows)
+            ]
+
+    return _write_collection(chunks(), target, buffer_size)
+
+
+def _write_collection(chunks: Iterable[list], target, buffer_size: int) -> int:
+    # writes the features of the chunks between the members of a FeatureCollection
+    if hasattr(target, "sendall"):
+        write = lambda text: target.sendall(text.encode("utf-8"))  # noqa: E731
+    elif isinstance(target, (RawIOBase, BufferedIOBase)):
+        write = lambda text: target.write(text.encode("utf-8"))  # noqa: E731
+    else:
+        write = target.write
+
+    buffer = ['{"type":"FeatureCollection","features":[']
+    buffered = 0
+    count = 0
+    for chunk in chunks:
+        text = _dumps(chunk)[1:-1]
+        buffer.append("," + text if count else text)
+        buffered += len(text)
+        count += len(chunk)
+        if buffered >= buffer_size:
+            write("".join(buffer))
+            buffer = []
+            buffered = 0
+    buffer.append("]}")
+    write("".join(buffer))
+    return count
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), default=_default)
+
+
+def _default(value: Any) -> Any:
+    # NumPy scalars and arrays in properties or coordinates
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _round_feature(feature: dict, precision: int) -> dict:
+    # shallow copy of the feature with its coordinates rounded
+    geometry = feature.get("geometry")
+    if not geometry:
+        return feature
+    result = dict(feature)
+    result["geometry"] = _round_geometry(geometry, precision)
+    return result
+
+
+def _round_geometry(geometry: dict, precision: int) -> dict:
+    result = dict(geometry)
+    if geometry["type"] == "GeometryCollection":
+        result["geometries"] = [
+            _round_geometry(member, precision) for member in geometry["geometries"]
+        ]
+    else:
+        result["coordinates"] = _round_coordinates(geometry["coordinates"], precision)
+    return result
+
+
+def _round_coordinates(coordinates, precision: int):
+    if coordinates and isinstance(coordinates[0], (list, tuple)):
+        return [_round_coordinates(item, precision) for item in coordinates]
+    return [round(value, precision) for value in coordinates]
+
+
+def quantize(geojson: dict, precision: int = 6) -> dict:
+    """
+    Encodes the coordinates of a GeoJSON object as integers, which makes large
+    payloads several times smaller. As in the ``transform`` of TopoJSON, positions
+    are quantized to ``precision`` decimals relatively to a ``translate`` origin,
+    the minimum of the coordinates, and the positions of every LineString, ring and
+    MultiPoint but the first are stored as differences with the previous one.
+
+    The result is not GeoJSON anymore, it is decoded with :func:`dequantize`. Only
+    the first two coordinates of the positions are kept.
+
+    :param geojson: GeoJSON Feature, FeatureCollection or Geometry.
+    :param precision: Number of decimals kept.
+    :return: A copy of the GeoJSON with integer coordinates and a ``transform``
+        member holding the ``scale`` and ``translate`` of the encoding.
+
+    Example:
+
+    >>> from geojson import Feature, LineString
+    >>> from turfpy.io import quantize
+    >>> quantize(Feature(geometry=LineString([[2.3522219, 48.856614], [2.35, 48.86]])))
+    """
+    import numpy as np
+
+    if not geojson:
+        raise Exception("geojson is required")
+    if precision < 0:
+        raise Exception("precision must be a positive number")
+    if "transform" in geojson:
+        raise Exception("geojson is already quantized")
+
+    result = _copy_without_coordinates(geojson)
+    parts = [part for part in _coordinate_parts(result) if len(part[0][part[1]])]
+    positions, sizes = _flatten(parts)
+    factor = 10**precision
+    translate = [0, 0]
+    if positions:
+        try:
+            xy = np.array(positions, dtype=float)[:, :2]
+        except ValueError:
+            # positions with and without elevation
+            xy = np.array([p[:2] for p in positions], dtype=float)
+        q = np.round(xy * factor).astype(np.int64)
+        origin = q.min(axis=0)
+        q -= origin
+        # positions but the first of every part as the difference with the previous
+        deltas = q.copy()
+        deltas[1:] -= q[:-1]
+        starts = np.cumsum(sizes) - sizes
+        deltas[starts] = q[starts]
+        _unflatten(parts, deltas.tolist(), sizes)
+        translate = (origin / factor).tolist()
+    result["transform"] = {"scale": [1 / factor, 1 / factor], "translate": translate}
+    return result
+
+
+def dequantize(quantized: dict) -> dict:
+    """
+    Decodes the coordinates of a GeoJSON object encoded by :func:`quantize`, they
+    are rounded to the precision of the encoding.
+
+    :param quantized: A quantized GeoJSON object.
+    :return: The GeoJSON object.
+
+    Example:
+
+    >>> from geojson import Feature, LineString
+    >>> from turfpy.io import dequantize, quantize
+    >>> f = Feature(geometry=LineString([[2.3522219, 48.856614], [2.35, 48.86]]))
+    >>> dequantize(quantize(f))
+    """
+    import numpy as np
+
+    if "transform" not in quantized:
+        raise Exception("geojson is not quantized")
+
+    result = _copy_without_coordinates(quantized)
+    transform = result.pop("transform")
+    factor = round(1 / transform["scale"][0])
+    origin = np.round(np.array(transform["translate"]) * factor).astype(np.int64)
+    parts = [part for part in _coordinate_parts(result) if len(part[0][part[1]])]
+    positions, sizes = _flatten(parts)
+    if positions:
+        deltas = np.array(positions, dtype=np.int64).reshape(-1, 2)
+        # cumulative sums restarted at the first position of every part
+        sums = np.cumsum(deltas, axis=0)
+        starts = np.cumsum(sizes) - sizes
+        q = sums - np.repeat(sums[starts] - deltas[starts], sizes, axis=0)
+        _unflatten(parts, ((q + origin) / factor).tolist(), sizes)
+    return result
+
+
+def payload_sizes(geojson: dict, precision: int = 6) -> Dict[str, int]:
+    """
+    Measures the size of a GeoJSON object serialized as compact JSON, as it is and
+    with its coordinates truncated or quantized to a precision, to report the
+    savings of each encoding.
+
+    :param geojson: GeoJSON Feature, FeatureCollection or Geometry.
+    :param precision: Number of decimals kept.
+    :return: The number of bytes of the 'original', 'truncated' and 'quantized'
+        encodings.
+
+    Example:
+
+    >>> from turfpy.io import payload_sizes
+    >>> from turfpy.transformation import circle
+    >>> from geojson import Feature, Point
+    >>> payload_sizes(circle(Feature(geometry=Point((2.35, 48.85))), 10), 5)
+    """
+    quantized = quantize(geojson, precision)
+    return {
+        "original": _size(geojson),
+        "truncated": _size(dequantize(quantized)),
+        "quantized": _size(quantized),
+    }
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+
+def _coordinate_parts(geojson: dict) -> Iterator[Tuple[Any, Any, str]]:
+    # container and key of the coordinates of every geometry, and their kind:
+    # 'position' for a Point, 'positions' for a MultiPoint, 'line' or 'ring'
+    geom_type = geojson.get("type")
+    if geom_type == "FeatureCollection":
+        for feature in geojson["features"]:
+            yield from _coordinate_parts(feature)
+    elif geom_type == "Feature":
+        if geojson.get("geometry"):
+            yield from _coordinate_parts(geojson["geometry"])
+    elif geom_type == "GeometryCollection":
+        for member in geojson["geometries"]:
+            yield from _coordinate_parts(member)
+    elif geom_type == "Point":
+        yield geojson, "coordinates", "position"
+    elif geom_type == "MultiPoint":
+        yield geojson, "coordinates", "positions"
+    elif geom_type == "LineString":
+        yield geojson, "coordinates", "line"
+    elif geom_type == "MultiLineString":
+        for i in range(len(geojson["coordinates"])):
+            yield geojson["coordinates"], i, "line"
+    elif geom_type == "Polygon":
+        for i in range(len(geojson["coordinates"])):
+            yield geojson["coordinates"], i, "ring"
+    elif geom_type == "MultiPolygon":
+        for polygon in geojson["coordinates"]:
+            for i in range(len(polygon)):
+                yield polygon, i, "ring"
+
+
+def _copy_without_coordinates(
+    geojson: dict, kinds: Tuple[str, ...] = ("position", "positions", "line", "ring")
+) -> dict:
+    # deep copy sharing the non empty coordinates of the parts of the given kinds,
+    # which callers must replace, the other coordinates are copied
+    memo: Dict[int, Any] = {
+        id(container[key]): container[key]
+        for container, key, kind in _coordinate_parts(geojson)
+        if kind in kinds and len(container[key])
+    }
+    return copy.deepcopy(geojson, memo)
+
+
+def _flatten(parts: list) -> Tuple[list, List[int]]:
+    # positions of all the parts, and number of positions of every part
+    positions: list = []
+    sizes = []
+    for container, key, kind in parts:
+        if kind == "position":
+            positions.append(container[key])
+            sizes.append(1)
+        else:
+            positions.extend(container[key])
+            sizes.append(len(container[key]))
+    return positions, sizes
+
+
+def _unflatten(parts: list, positions: list, sizes: List[int]):
+    # replaces the coordinates of the parts with new positions
+    start = 0
+    for (container, key, kind), size in zip(parts, sizes):
+        if kind == "position":
+            container[key] = positions[start]
+        else:
+            container[key] = positions[start : start + size]
+        start += size
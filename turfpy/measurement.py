@@ -5,12 +5,9 @@ This is mainly inspired by turf.js.
 link: http://turfjs.org/
 """
 
-import concurrent.futures
-from functools import partial
+import warnings
 from math import asin, atan2, cos, degrees, log, pi, pow, radians, sin, sqrt, tan
-from multiprocessing import Manager
-from multiprocessing.managers import ListProxy
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from geojson import (
     Feature,
@@ -23,6 +20,8 @@ from geojson import (
     Polygon,
 )
 
+from turfpy._compact import is_geometry_array
+from turfpy.cache import memoize
 from turfpy.helper import (
     avg_earth_radius_km,
     convert_length,
@@ -43,6 +42,9 @@ from turfpy.meta import (
     segment_reduce,
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 # ---------- Bearing -----------#
 
 
@@ -132,6 +134,7 @@ def distance(point1: Feature, point2: Feature, units: str = "km"):
 # ----------- Area --------------#
 
 
+@memoize
 def area(
     geojson: Union[
         Point,
@@ -147,8 +150,12 @@ def area(
     """
     This function calculates the area of the Geojson object given as input.
 
+    A GeoSeries, GeoDataFrame or array of shapely geometries is also accepted, the
+    area of every geometry is then computed with vectorized operations.
+
     :param geojson: Geojson object for which area is to be found.
-    :return: area for the given Geojson object in square meters.
+    :return: area for the given Geojson object in square meters, or a Series or array
+        of areas.
 
     Example:
 
@@ -162,6 +169,11 @@ def area(
 
     >>> area(feature_collection)
     """
+    if is_geometry_array(geojson):
+        from turfpy._vectorized import array_area
+
+        return array_area(geojson)
+
     return geom_reduce(geojson, 0)
 
 
@@ -170,6 +182,7 @@ def area(
 # ----------- BBox --------------#
 
 
+@memoize
 def bbox(geojson):
     """
     This function is used to generate bounding box coordinates for given geojson.
@@ -262,6 +275,7 @@ def bbox_polygon(bbox: list, properties: dict = {}) -> Feature:
 # ----------- Center --------------#
 
 
+@memoize
 def center(geojson, properties: Optional[dict] = None) -> Feature:
     """
     Takes a Feature or FeatureCollection and returns the absolute center point of all
@@ -342,9 +356,12 @@ def length(geojson, units: str = "km"):
     """
     Takes a geojson and measures its length in the specified units.
 
+    A GeoSeries, GeoDataFrame or array of shapely geometries is also accepted, the
+    length of every geometry is then computed with vectorized operations.
+
     :param geojson: geojson for which the length is to be determined.
     :param units: units in which length is to be returned.
-    :return: length of the geojson in specified units.
+    :return: length of the geojson in specified units, or a Series or array of lengths.
 
     Example:
 
@@ -353,6 +370,10 @@ def length(geojson, units: str = "km"):
     >>> ls = LineString([(115, -32), (131, -22), (143, -25), (150, -34)])
     >>> length(ls)
     """
+    if is_geometry_array(geojson):
+        from turfpy._vectorized import array_length
+
+        return array_length(geojson, units)
 
     def _callback_segment_reduce(previous_value, segment):
         coords = segment["geometry"]["coordinates"]
@@ -426,13 +447,18 @@ def destination(
 # ----------- Centroid --------------#
 
 
+@memoize
 def centroid(geojson, properties: dict = {}) -> Feature:
     """
     Takes one or more features and calculates the centroid using the mean of all vertices.
 
+    A GeoSeries, GeoDataFrame or array of shapely geometries is also accepted, the
+    centroid of every geometry is then computed with vectorized operations.
+
     :param geojson: Input features
     :param properties: Properties to be set to the output Feature point
-    :return: Feature: Point feature which is the centroid of the given features
+    :return: Feature: Point feature which is the centroid of the given features, or a
+        GeoSeries or array of shapely Points.
 
     Example:
 
@@ -442,6 +468,11 @@ def centroid(geojson, properties: dict = {}) -> Feature:
     (-81, 41))])
     >>> centroid(polygon)
     """
+    if is_geometry_array(geojson):
+        from turfpy._vectorized import array_centroid
+
+        return array_centroid(geojson)
+
     x_sum = 0
     y_sum = 0
     length = 0
@@ -820,6 +851,7 @@ def explode(geojson):
                 points.append(Feature(geometry=point, properties=feature["properties"]))
 
             coord_each(feature, _callback_coord_each)
+            return True
 
         feature_each(geojson, _callback_feature_each)
     else:
@@ -844,6 +876,7 @@ def explode(geojson):
 # ------------ polygon tangents -----------#
 
 
+@memoize
 def polygon_tangents(point, polygon):
     """
     Finds the tangents of a (Multi)Polygon from a Point.
@@ -1298,13 +1331,188 @@ def square(bbox: list):
         ]
 
 
+# -------------------------------#
+
+# ------------ great circle -----------#
+
+
+def great_circle(
+    start: Union[Feature, Point, list],
+    end: Union[Feature, Point, list],
+    npoints: int = 100,
+    offset: float = 10,
+    properties: Optional[dict] = None,
+) -> Feature:
+    """
+    Calculates the great circle route between two points, split in two lines where it
+    crosses the antimeridian.
+
+    :param start: Start point.
+    :param end: End point.
+    :param npoints: Number of points of the route, the ends included.
+    :param offset: Two consecutive points of the route more than ``offset`` degrees
+        east and west of the prime meridian, and more than ``180 + offset`` degrees
+        of longitude apart, are on both sides of the antimeridian and the route is
+        split between them, as in arc.js.
+    :param properties: Properties of the route.
+    :return: A Feature of LineString, or of MultiLineString for a route crossing the
+        antimeridian.
+
+    Example:
+
+    >>> from turfpy.measurement import great_circle
+    >>> from geojson import Point, Feature
+    >>> start = Feature(geometry=Point((-122, 48)))
+    >>> end = Feature(geometry=Point((-77, 39)))
+    >>> great_circle(start, end, npoints=10)
+    """
+    return great_circles(
+        [get_coord(start)],
+        [get_coord(end)],
+        npoints,
+        offset,
+        {name: [value] for name, value in (properties or {}).items()},
+    )["features"][0]
+
+
+def great_circles(
+    starts,
+    ends,
+    npoints: int = 100,
+    offset: float = 10,
+    properties: Optional[dict] = None,
+    as_array: bool = False,
+):
+    """
+    Calculates the great circle routes between pairs of points at once, with a
+    spherical linear interpolation of the unit vectors of every pair of points. Routes
+    are split in two lines where they cross the antimeridian, see
+    :func:`great_circle`.
+
+    :param starts: A FeatureCollection of the start points, or an array of shape
+        (N, 2) of their coordinates.
+    :param ends: A FeatureCollection of the end points, or an array of shape (N, 2) of
+        their coordinates.
+    :param npoints: Number of points of every route, the ends included.
+    :param offset: Distance in degrees to the prime meridian beyond which two
+        consecutive points of a route may be split, see :func:`great_circle`.
+    :param properties: Arrays of the values of the properties of every route, keyed
+        by property.
+    :param as_array: If True the lines are returned as arrays instead of a
+        FeatureCollection: the coordinates of the lines, of shape (M, 2), the index of
+        the first position of every line in the coordinates followed by M, and the
+        index of the route of every line.
+    :return: A FeatureCollection of LineStrings and MultiLineStrings, or the arrays.
+
+    Example:
+
+    >>> from turfpy.measurement import great_circles
+    >>> starts = [[-122, 48], [2.35, 48.85], [139.77, 35.68]]
+    >>> ends = [[-77, 39], [-73.78, 40.64], [-118.41, 33.94]]
+    >>> great_circles(starts, ends, npoints=50)
+    """
+    # imported here as numpy is only needed by these functions
+    import numpy as np
+
+    a = _unit_vectors(starts)
+    b = _unit_vectors(ends)
+    if a.shape != b.shape:
+        raise Exception("starts and ends should have the same number of points")
+    columns = properties or {}
+    for name, column in columns.items():
+        if len(column) != len(a):
+            raise Exception(f"{name} values should have one value per route")
+
+    dot = np.clip((a * b).sum(axis=1), -1, 1)
+    if (dot < -1 + 1e-12).any():
+        raise Exception("start and end are antipodal, the great circle is undefined")
+    npoints = max(int(npoints), 2)
+
+    # spherical linear interpolation, routes between identical points stay on them
+    omega = np.arccos(dot)[:, None, None]
+    t = np.linspace(0, 1, npoints)[None, :, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weights_a = np.where(omega > 0, np.sin((1 - t) * omega) / np.sin(omega), 1 - t)
+        weights_b = np.where(omega > 0, np.sin(t * omega) / np.sin(omega), t)
+    xyz = weights_a * a[:, None, :] + weights_b * b[:, None, :]
+    lon = np.degrees(np.arctan2(xyz[..., 1], xyz[..., 0]))
+    lat = np.degrees(np.arctan2(xyz[..., 2], np.hypot(xyz[..., 0], xyz[..., 1])))
+
+    # longitude changing sign by more than 180 degrees, far from the prime meridian
+    west, east = lon[:, :-1], lon[:, 1:]
+    crossings = (np.abs(east - west) > 180 + offset) & (
+        ((west > offset) & (east < -offset)) | ((west < -offset) & (east > offset))
+    )
+    route, segment = np.nonzero(crossings)
+    # latitude of the antimeridian on the great circle of the route
+    normal = np.cross(a[route], b[route])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        crossing_lat = np.degrees(np.arctan(normal[:, 0] / normal[:, 2]))
+    side = np.where(west[route, segment] > 0, 180.0, -180.0)
+
+    # positions sorted by key, every crossing ends a line and starts the next one
+    index = route * npoints + segment
+    keys = np.concatenate([3 * np.arange(lon.size) + 1, 3 * index + 2, 3 * (index + 1)])
+    coordinates = np.concatenate(
+        [
+            np.column_stack([lon.ravel(), lat.ravel()]),
+            np.column_stack([side, crossing_lat]),
+            np.column_stack([-side, crossing_lat]),
+        ]
+    )
+    starts_line = np.concatenate(
+        [
+            np.arange(lon.size) % npoints == 0,
+            np.zeros(len(index), bool),
+            np.ones(len(index), bool),
+        ]
+    )
+    order = np.argsort(keys, kind="stable")
+    coordinates, starts_line = coordinates[order], starts_line[order]
+    offsets = np.append(np.flatnonzero(starts_line), len(coordinates))
+    routes = np.repeat(np.arange(len(a)), np.bincount(route, minlength=len(a)) + 1)
+    if as_array:
+        return coordinates, offsets, routes
+
+    positions = coordinates.tolist()
+    lines = [positions[i:j] for i, j in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+    parts = np.bincount(routes, minlength=len(a))
+    first = np.cumsum(parts) - parts
+    values = [np.asarray(column).tolist() for column in columns.values()]
+    rows = list(zip(*values)) if values else [()] * len(a)
+    features = []
+    for i, (count, row) in enumerate(zip(parts.tolist(), rows)):
+        start = int(first[i])
+        if count == 1:
+            geometry = LineString(lines[start])
+        else:
+            geometry = MultiLineString(lines[start : start + count])
+        features.append(Feature(geometry=geometry, properties=dict(zip(columns, row))))
+    return FeatureCollection(features)
+
+
+def _unit_vectors(points):
+    import numpy as np
+
+    if isinstance(points, dict) and "features" in points:
+        points = [get_coord(f) for f in points["features"]]
+    coords = np.asarray(points, dtype=float).reshape(-1, 2)
+    lon, lat = np.radians(coords[:, 0]), np.radians(coords[:, 1])
+    return np.column_stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+
+
 # -------------------------------#
 
 
 def points_within_polygon(
     points: Union[Feature, FeatureCollection],
     polygons: Union[Feature, FeatureCollection],
-    chunk_size: int = 1,
+    chunk_size: Optional[int] = None,
+    n_jobs: Optional[int] = None,
+    executor: Optional["Executor"] = None,
+    points_per_chunk: Optional[int] = None,
 ) -> FeatureCollection:
     """Find Point(s) that fall within (Multi)Polygon(s).
 
@@ -1315,12 +1523,24 @@ def points_within_polygon(
     :class:`geojson.MultiPolygon`. and returns all points with in in those
     Polygon(s) or (Multi)Polygon(s).
 
+    Points are checked in parallel with the shared executor of
+    :mod:`turfpy.parallel`, their coordinates are sent to the workers through
+    shared memory.
+
     :param points: A single GeoJSON ``Point`` feature or FeatureCollection of Points.
     :param polygons: A Single GeoJSON Polygon/MultiPolygon or FeatureCollection of
         Polygons/MultiPolygons.
-    :param chunk_size: Number of chunks each process to handle. The default value is
-            1, for a large number of features please use `chunk_size` greater than 1
-            to get better results in terms of performance.
+    :param chunk_size: Deprecated, it was the ``chunksize`` of the ``map`` of the
+        executor, which batched the tasks of single points. Points are now always
+        sent to the workers in chunks, it has no effect and only warns, see
+        ``points_per_chunk``.
+    :param n_jobs: Number of chunks the points are split in when
+        ``points_per_chunk`` is not provided, with 1 the points are checked in the
+        current process.
+    :param executor: A :class:`concurrent.futures.Executor` used instead of the
+        shared executor.
+    :param points_per_chunk: Number of points each process handles at a time,
+        default value splits the points evenly between the workers.
     :return: A :class:`geojson.FeatureCollection` of Points.
     """
     if not points:
@@ -1332,20 +1552,53 @@ def points_within_polygon(
     if points["type"] == "Feature":
         points = FeatureCollection([points])
 
-    manager = Manager()
-    results: ListProxy[dict] = manager.list()
+    # imported here as numpy is only needed by this function
+    import numpy as np
 
-    part_func = partial(
-        check_each_point,
-        polygons=polygons,
-        results=results,
+    from turfpy.parallel import map_chunks
+
+    features = points["features"]
+    coords = np.array([get_coord(f) for f in features], dtype=float).reshape(-1, 2)
+    if chunk_size is not None:
+        warnings.warn(
+            "chunk_size has no effect, use points_per_chunk or n_jobs",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+    if points_per_chunk:
+        n_jobs = max(1, -(-len(features) // points_per_chunk))
+
+    within = map_chunks(
+        _points_within,
+        len(features),
+        [coords],
+        (polygons,),
+        n_jobs=n_jobs,
+        executor=executor,
     )
 
-    with concurrent.futures.ProcessPoolExecutor() as executor:
-        for _ in executor.map(part_func, points["features"], chunksize=chunk_size):
-            pass
+    within = np.concatenate(within)
+    return FeatureCollection([f for f, w in zip(features, within) if w])
+
+
+def _points_within(start, stop, coords, polygons):
+    """
+    Check whether every point of ``coords[start:stop]`` is within any polygon.
+    """
+    points = coords[start:stop].tolist()
+    within = [False] * len(points)
+
+    def __callback_geom_each(
+        current_geometry, feature_index, feature_properties, feature_bbox, feature_id
+    ):
+        for i, point in enumerate(points):
+            if not within[i] and boolean_point_in_polygon(point, current_geometry):
+                within[i] = True
+        # geom_each stops at the first callback not returning True
+        return True
 
-    return FeatureCollection(list(results))
+    geom_each(polygons, __callback_geom_each)
+    return within
 
 
 def check_each_point(point, polygons, results):
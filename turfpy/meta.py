@@ -120,7 +120,7 @@ def geom_each(geojson, callback):
                 break
             else:
                 raise Exception("Unknown Geometry Type")
-        feature_index += feature_index + 1
+        feature_index += 1
 
 
 def calculate_area(geom) -> float:
@@ -248,8 +248,8 @@ def coord_each(geojson, callback, excludeWrapCoord=None):
                         multi_feature_index,
                         geometry_index,
                     )
-                    coord_index += coord_index + 1
-                    multi_feature_index += multi_feature_index + 1
+                    coord_index += 1
+                    multi_feature_index += 1
                 elif geom_type == "LineString" or geom_type == "MultiPoint":
                     for j in range(0, len(coords)):
                         # if not callback(coords[j]):
@@ -261,11 +261,11 @@ def coord_each(geojson, callback, excludeWrapCoord=None):
                             multi_feature_index,
                             geometry_index,
                         )
-                        coord_index += coord_index + 1
+                        coord_index += 1
                         if geom_type == "MultiPoint":
-                            multi_feature_index += multi_feature_index + 1
+                            multi_feature_index += 1
                     if geom_type == "LineString":
-                        multi_feature_index += multi_feature_index + 1
+                        multi_feature_index += 1
                 elif geom_type == "Polygon" or geom_type == "MultiLineString":
                     for j in range(0, len(coords)):
                         for k in range(0, len(coords[j]) - wrap_shrink):
@@ -278,13 +278,13 @@ def coord_each(geojson, callback, excludeWrapCoord=None):
                                 multi_feature_index,
                                 geometry_index,
                             )
-                            coord_index += coord_index + 1
+                            coord_index += 1
                         if geom_type == "MultiLineString":
-                            multi_feature_index += multi_feature_index + 1
+                            multi_feature_index += 1
                         if geom_type == "Polygon":
-                            geometry_index += geometry_index + 1
+                            geometry_index += 1
                     if geom_type == "Polygon":
-                        multi_feature_index += multi_feature_index + 1
+                        multi_feature_index += 1
                 elif geom_type == "MultiPolygon":
                     for j in range(0, len(coords)):
                         geometry_index = 0
@@ -299,9 +299,9 @@ def coord_each(geojson, callback, excludeWrapCoord=None):
                                     multi_feature_index,
                                     geometry_index,
                                 )
-                                coord_index += coord_index + 1
-                            geometry_index += geometry_index + 1
-                        multi_feature_index += multi_feature_index + 1
+                                coord_index += 1
+                            geometry_index += 1
+                        multi_feature_index += 1
                 elif geom_type == "GeometryCollection":
                     for j in range(0, len(geometry["geometries"])):
                         if not coord_each(
@@ -5,9 +5,10 @@ link: http://turfjs.org/
 """
 
 from functools import reduce
-from typing import List, Union
+from typing import List, Tuple, Union
 
-import geopandas
+import numpy as np
+import shapely
 from geojson import (
     Feature,
     FeatureCollection,
@@ -17,7 +18,8 @@ from geojson import (
     Point,
     Polygon,
 )
-from shapely.geometry import mapping, shape
+from shapely import GeometryType
+from shapely.geometry import mapping
 
 from turfpy.helper import convert_angle_to_360, get_coord, get_coords, get_type
 from turfpy.measurement import bearing, destination, distance
@@ -32,10 +34,8 @@ def line_intersect(
     """
     Takes any LineString or Polygon GeoJSON and returns the intersecting point(s).
     If one of the Features is polygon pass the polygon feature as the first
-    parameter to improve performance. To use this functionality Rtree or pygeos
-    is needed to be installed.
-
-    See installation instructions at https://geopandas.org/install.html
+    parameter to improve performance. Segments are intersected with
+    :func:`segment_intersections`.
 
     :param feature1: Any LineString or Polygon, if one of the two features is
         polygon to improve performance please pass polygon as this parameter.
@@ -73,28 +73,114 @@ def line_intersect(
             results.append(inters)
         return FeatureCollection(results)
 
-    segments = line_segment(f1)
-    gdf = geopandas.GeoDataFrame.from_features(segments)
-    spatial_index = gdf.sindex
-    segments = line_segment(f2)["features"]
-
-    for segment in segments:
-        s = shape(segment["geometry"])
-        possible_matches_index = list(spatial_index.intersection(s.bounds))
-        possible_matches = gdf.iloc[possible_matches_index]
-        precise_matches = possible_matches[possible_matches.intersects(s)]
-        if not precise_matches.empty:
-            for index, row in precise_matches.iterrows():
-                # intersect = intersects(mapping(row["geometry"]), segment)
-                intersection = Feature(geometry=mapping(row["geometry"].intersection(s)))
-                key = ",".join(map(str, get_coords(intersection)))
-                if key not in unique:
-                    unique.add(key)
-                    results.append(intersection)
+    segments_1 = segment_array(f1)
+    segments_2 = segment_array(f2)
+    points, pairs, point_index = segment_intersections(segments_1, segments_2)
+
+    for (i, j), k in zip(pairs, point_index):
+        if k >= 0:
+            intersection = Feature(geometry=Point(points[k].tolist()))
+        else:
+            overlap = shapely.intersection(
+                shapely.linestrings(segments_1[i]), shapely.linestrings(segments_2[j])
+            )
+            intersection = Feature(geometry=mapping(overlap))
+        key = ",".join(map(str, get_coords(intersection)))
+        if key not in unique:
+            unique.add(key)
+            results.append(intersection)
 
     return FeatureCollection(results)
 
 
+def segment_array(
+    geojson: Union[LineString, Polygon, MultiLineString, MultiPolygon, Feature]
+) -> np.ndarray:
+    """
+    Creates an array of 2-vertex segments from a (Multi)LineString or (Multi)Polygon,
+    with the same order and orientation as :func:`line_segment` but without
+    building Features.
+
+    :param geojson: GeoJSON Polygon or LineString
+    :return: Array of shape (N, 2, 2) holding start and end coordinates of segments
+
+    Example:
+    >>> from geojson import LineString
+    >>> from turfpy.misc import segment_array
+    >>> segment_array(LineString([[126, -11], [129, -21], [131, -14]]))
+    """
+    if not geojson:
+        raise Exception("geojson is required!!!")
+
+    parts = []
+
+    def callback_flatten_each(feature, feature_index, multi_feature_index):
+        geometry = feature["geometry"]
+        if geometry:
+            if geometry["type"] == "Polygon":
+                parts.extend(geometry["coordinates"])
+            elif geometry["type"] == "LineString":
+                parts.append(geometry["coordinates"])
+        return True
+
+    flatten_each(geojson, callback_flatten_each)
+
+    segments = [np.empty((0, 2, 2))]
+    for part in parts:
+        coords = np.asarray(part, dtype=float)[:, :2]
+        segments.append(np.stack([coords[1:], coords[:-1]], axis=1))
+
+    return np.concatenate(segments)
+
+
+def segment_intersections(
+    segments_1: np.ndarray, segments_2: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds the intersections between two arrays of segments. Candidate pairs are
+    found with a bulk ``shapely.STRtree`` query and intersected with shapely
+    vectorized functions.
+
+    :param segments_1: Array of shape (N, 2, 2) of segments, see :func:`segment_array`.
+    :param segments_2: Array of shape (M, 2, 2) of segments.
+    :return: A tuple of ``points``, array of shape (P, 2) of unique intersection
+        points, ``pairs``, array of shape (K, 2) of intersecting segment indices
+        into ``segments_1`` and ``segments_2`` sorted by the second index, and
+        ``point_index``, array of shape (K,) giving for each pair its row in
+        ``points`` or -1 when the segments are collinear and overlap.
+
+    Example:
+    >>> from geojson import LineString
+    >>> from turfpy.misc import segment_array, segment_intersections
+    >>> s1 = segment_array(LineString([[126, -11], [129, -21], [131, -14]]))
+    >>> s2 = segment_array(LineString([[123, -18], [131, -14], [135, -20]]))
+    >>> points, pairs, point_index = segment_intersections(s1, s2)
+    """
+    lines_1 = shapely.linestrings(np.asarray(segments_1, dtype=float).reshape(-1, 2, 2))
+    lines_2 = shapely.linestrings(np.asarray(segments_2, dtype=float).reshape(-1, 2, 2))
+
+    index_2, index_1 = shapely.STRtree(lines_1).query(lines_2, predicate="intersects")
+    order = np.lexsort((index_1, index_2))
+    pairs = np.column_stack([index_1[order], index_2[order]]).astype(np.intp)
+
+    intersections = shapely.intersection(lines_1[pairs[:, 0]], lines_2[pairs[:, 1]])
+    is_point = shapely.get_type_id(intersections) == GeometryType.POINT
+
+    point_index = np.full(len(pairs), -1, dtype=np.intp)
+    points = np.empty((0, 2))
+    if is_point.any():
+        coords = shapely.get_coordinates(intersections[is_point])
+        points, first, inverse = np.unique(
+            coords, axis=0, return_index=True, return_inverse=True
+        )
+        # keep the points in the order they are first met
+        rank = np.argsort(np.argsort(first))
+        points[rank] = points.copy()
+        point_index[is_point] = rank[inverse.ravel()]
+
+    return points, pairs, point_index
+
+
 def line_segment(
     geojson: Union[LineString, Polygon, MultiLineString, MultiPolygon, Feature]
 ) -> FeatureCollection:
@@ -0,0 +1,224 @@
+"""
+This module implements the executor shared by the parallel functions of turfpy,
+like :func:`turfpy.measurement.points_within_polygon` or
+:func:`turfpy.transformation.overlay`.
+
+The executor is created on first use with the settings given to :func:`configure`
+and reused by every call until :func:`shutdown`, which is also called at exit.
+Arrays are sent to process workers through :mod:`multiprocessing.shared_memory`,
+each worker maps the same memory instead of unpickling a copy of the data.
+"""
+
+import atexit
+import math
+import multiprocessing
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+_KINDS = ("process", "thread")
+
+# settings of the shared executor, see configure
+_CONFIG: Dict[str, Any] = {"n_jobs": None, "start_method": None, "kind": "process"}
+_EXECUTOR: Optional[Executor] = None
+
+
+def configure(
+    n_jobs: Optional[int] = None,
+    start_method: Optional[str] = None,
+    kind: str = "process",
+):
+    """
+    Configures the shared executor, the current one is shut down and a new one is
+    created on next use.
+
+    :param n_jobs: Number of workers, default to the number of CPUs.
+    :param start_method: Start method of process workers, 'fork', 'spawn' or
+        'forkserver', default to the default start method of the platform.
+    :param kind: 'process' for a pool of processes or 'thread' for a pool of
+        threads, useful for functions spending their time in shapely which
+        releases the GIL.
+
+    Example:
+
+    >>> from turfpy import parallel
+    >>> parallel.configure(n_jobs=4, start_method="spawn")
+    """
+    if kind not in _KINDS:
+        raise Exception(f"kind should be one of {', '.join(_KINDS)}")
+    if n_jobs is not None and n_jobs < 1:
+        raise Exception("n_jobs should be greater than 0")
+    if start_method is not None:
+        # raises ValueError for an unknown start method
+        multiprocessing.get_context(start_method)
+
+    shutdown()
+    _CONFIG.update(n_jobs=n_jobs, start_method=start_method, kind=kind)
+
+
+def get_executor() -> Executor:
+    """
+    :return: The shared executor, created if needed.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        n_jobs = _CONFIG["n_jobs"] or os.cpu_count() or 1
+        if _CONFIG["kind"] == "thread":
+            _EXECUTOR = ThreadPoolExecutor(max_workers=n_jobs)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            context = multiprocessing.get_context(_CONFIG["start_method"])
+            _EXECUTOR = ProcessPoolExecutor(max_workers=n_jobs, mp_context=context)
+    return _EXECUTOR
+
+
+def shutdown():
+    """Shuts down the shared executor, waiting for pending tasks."""
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown()
+        _EXECUTOR = None
+
+
+atexit.register(shutdown)
+
+
+def map_chunks(
+    func: Callable,
+    length: int,
+    arrays: Sequence[np.ndarray] = (),
+    args: tuple = (),
+    n_jobs: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> List[Any]:
+    """
+    Splits ``range(length)`` in chunks and calls ``func(start, stop, *arrays,
+    *args)`` for every chunk, in the workers of an executor. ``func`` must be
+    picklable and must not return views of ``arrays``, which are only mapped
+    while it runs.
+
+    :param func: Function called for every chunk.
+    :param length: Number of items to split.
+    :param arrays: Arrays passed whole to every call, through shared memory for
+        process workers.
+    :param args: Other arguments passed to every call.
+    :param n_jobs: Number of chunks, with 1 ``func`` is called once in the current
+        process, default to the number of workers of the shared executor.
+    :param executor: Executor used instead of the shared executor, it is not shut
+        down.
+    :return: The results of the calls in the order of the chunks.
+
+    Example:
+
+    >>> import numpy as np
+    >>> from turfpy.parallel import map_chunks
+    >>> def total(start, stop, values):
+    ...     return float(values[start:stop].sum())
+    >>> sum(map_chunks(total, 1000, [np.arange(1000.0)], n_jobs=4))
+    """
+    if n_jobs is not None and n_jobs < 1:
+        raise Exception("n_jobs should be greater than 0")
+
+    if length <= 1 or (n_jobs == 1 and executor is None):
+        return [func(0, length, *arrays, *args)]
+    if executor is None:
+        executor = get_executor()
+    if n_jobs is None:
+        n_jobs = getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+
+    step = max(1, math.ceil(length / n_jobs))
+    bounds = [(start, min(start + step, length)) for start in range(0, length, step)]
+
+    if isinstance(executor, ThreadPoolExecutor):
+        futures = [
+            executor.submit(func, start, stop, *arrays, *args) for start, stop in bounds
+        ]
+        return [future.result() for future in futures]
+
+    blocks = [_share(array) for array in arrays]
+    try:
+        handles = tuple(handle for handle, _ in blocks)
+        futures = [
+            executor.submit(_call_shared, func, start, stop, handles, args)
+            for start, stop in bounds
+        ]
+        return [future.result() for future in futures]
+    finally:
+        for _, block in blocks:
+            block.close()
+            block.unlink()
+
+
+# name, shape and dtype of an array in shared memory
+_Handle = Tuple[str, Tuple[int, ...], str]
+
+
+def _share(array: np.ndarray) -> Tuple[_Handle, SharedMemory]:
+    array = np.ascontiguousarray(array)
+    # shared memory blocks cannot be empty
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return (block.name, array.shape, array.dtype.str), block
+
+
+def _call_shared(func: Callable, start: int, stop: int, handles: tuple, args: tuple):
+    blocks = [SharedMemory(name=name) for name, _, _ in handles]
+    try:
+        return func(
+            start,
+            stop,
+            *[
+                np.ndarray(shape, dtype=dtype, buffer=block.buf)
+                for (_, shape, dtype), block in zip(handles, blocks)
+            ],
+            *args,
+        )
+    finally:
+        for block in blocks:
+            block.close()
+
+
+def pack_geometries(geoms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs shapely geometries in two arrays which can be passed to
+    :func:`map_chunks`.
+
+    :param geoms: An array of shapely geometries or None.
+    :return: The concatenated WKB of the geometries as an uint8 array and the
+        offsets of every geometry in it, an empty WKB is a missing geometry.
+    """
+    import shapely
+
+    wkbs = shapely.to_wkb(geoms)
+    lengths = [len(wkb) if wkb is not None else 0 for wkb in wkbs]
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    buffer = np.frombuffer(b"".join(wkb for wkb in wkbs if wkb is not None), np.uint8)
+    return buffer, offsets
+
+
+def unpack_geometries(
+    buffer: np.ndarray, offsets: np.ndarray, start: int = 0, stop: Optional[int] = None
+) -> np.ndarray:
+    """
+    Unpacks geometries packed by :func:`pack_geometries`.
+
+    :param buffer: Concatenated WKB.
+    :param offsets: Offsets of the geometries.
+    :param start: Index of the first geometry.
+    :param stop: Index after the last geometry, default to the number of geometries.
+    :return: An array of shapely geometries.
+    """
+    import shapely
+
+    if stop is None:
+        stop = len(offsets) - 1
+    wkbs = np.empty(stop - start, dtype=object)
+    wkbs[:] = [
+        bytes(buffer[offsets[i] : offsets[i + 1]]) or None for i in range(start, stop)
+    ]
+    return shapely.from_wkb(wkbs)
@@ -0,0 +1,248 @@
+"""
+This module implements a pipeline applying a chain of turfpy operations to the
+features of a GeoJSON Text Sequence file in a persistent pool of processes.
+"""
+
+import copy
+import json
+import os
+import time
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import IO, Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from turfpy.io import _RS, _WHITESPACE, _dumps, _to_feature
+
+# operations of the pipeline run by the current worker process of a pool
+_OPERATIONS: Tuple[Callable, ...] = ()
+
+
+def as_property(func: Callable, name: str) -> Callable:
+    """
+    Wraps an operation returning a value, like :func:`turfpy.measurement.area`, in
+    an operation storing this value in the properties of the feature.
+
+    :param func: Operation taking a GeoJSON Feature.
+    :param name: Name of the property.
+    :return: An operation returning the Feature.
+
+    Example:
+
+    >>> from turfpy.measurement import area
+    >>> from turfpy.pipeline import as_property
+    >>> operation = as_property(area, "area")
+    """
+    return partial(_set_property, func=func, name=name)
+
+
+def _set_property(feature, func, name):
+    properties = dict(feature.get("properties") or {})
+    properties[name] = func(feature)
+    result = copy.copy(feature)
+    result["properties"] = properties
+    return result
+
+
+class Pipeline:
+    """
+    Applies a chain of operations to features, each operation receiving the result
+    of the previous one. A feature for which an operation returns ``None``, like
+    :func:`turfpy.transformation.bbox_clip` outside of the bbox, is dropped.
+
+    Features are processed by chunks in a pool of processes which is created once
+    and reused by every call until :meth:`close`, operations must therefore be
+    picklable, use :func:`functools.partial` to bind their arguments. At most
+    ``max_pending`` chunks are in flight, so the input is read only as fast as the
+    pool consumes it, and results are always returned in the order of the input.
+
+    :param operations: Functions taking a GeoJSON Feature.
+    :param n_jobs: Number of processes, default to the number of CPUs, with 1 the
+        features are processed in the current process.
+    :param chunk_size: Number of features sent to a process at a time.
+    :param max_pending: Maximum number of chunks submitted and not yet returned,
+        default to twice the number of processes.
+
+    Example:
+
+    >>> from functools import partial
+    >>> from turfpy.measurement import area
+    >>> from turfpy.transformation import transform_rotate
+    >>> from turfpy.pipeline import Pipeline, as_property
+    >>> with Pipeline(partial(transform_rotate, angle=10), as_property(area, "area"),
+    ...               n_jobs=4, chunk_size=1000) as pipeline:
+    ...     pipeline.run("parcels.geojsons", "rotated.geojsons")
+    ...     print(pipeline.stats)
+    """
+
+    def __init__(
+        self,
+        *operations: Callable,
+        n_jobs: Optional[int] = None,
+        chunk_size: int = 1000,
+        max_pending: Optional[int] = None,
+    ):
+        if not operations:
+            raise Exception("At least one operation is required")
+        if chunk_size < 1:
+            raise Exception("chunk_size should be greater than 0")
+
+        self.operations = operations
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending or 2 * self.n_jobs
+        self.executor: Any = None
+        self.reset_stats()
+
+    def __enter__(self) -> "Pipeline":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Shuts down the pool of processes."""
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def reset_stats(self):
+        """Resets the throughput counters."""
+        self.features_in = 0
+        self.features_out = 0
+        self.chunks = 0
+        self.seconds = 0.0
+
+    @property
+    def stats(self) -> dict:
+        """
+        Throughput counters accumulated since the creation of the pipeline or the
+        last call to :meth:`reset_stats`.
+        """
+        return {
+            "features_in": self.features_in,
+            "features_out": self.features_out,
+            "chunks": self.chunks,
+            "seconds": self.seconds,
+            "features_per_second": (
+                self.features_in / self.seconds if self.seconds else 0.0
+            ),
+        }
+
+    def map(self, features: Iterable[dict]) -> Iterator[Any]:
+        """
+        Applies the operations to every feature.
+
+        :param features: An iterable of GeoJSON Features, consumed lazily.
+        :return: An iterator of the results in the order of the features.
+        """
+        return self._run(features, _apply_features)
+
+    def run(
+        self,
+        source: Union[str, os.PathLike, IO[str]],
+        target: Union[str, os.PathLike, IO[str]],
+        record_separator: bool = False,
+    ) -> dict:
+        """
+        Applies the operations to every feature of a GeoJSON Text Sequence file and
+        writes the results to another one. Lines are parsed and results serialized
+        in the processes of the pool.
+
+        :param source: Path of the file or file object opened in text mode.
+        :param target: Path of the file or file object opened in text mode.
+        :param record_separator: If True every written text is prefixed with the
+            RFC 8142 record separator.
+        :return: The throughput counters, see :attr:`stats`.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, encoding="utf-8") as f:
+                return self.run(f, target, record_separator)
+        if isinstance(target, (str, os.PathLike)):
+            with open(target, "w", encoding="utf-8") as f:
+                return self.run(source, f, record_separator)
+
+        lines = (line for line in source if line.strip(_RS + _WHITESPACE))
+        prefix = _RS if record_separator else ""
+        for text in self._run(lines, _apply_lines):
+            target.write(prefix + text + "\n")
+        return self.stats
+
+    def _run(self, items: Iterable, func: Callable) -> Iterator[Any]:
+        start = time.perf_counter()
+        try:
+            for results in self._chunks(iter(items), func):
+                self.features_out += len(results)
+                yield from results
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    def _chunks(self, items: Iterator, func: Callable) -> Iterator[List[Any]]:
+        if self.n_jobs == 1:
+            # operations are passed explicitly, the global of the workers would be
+            # shared by every pipeline of the current process
+            func = partial(func, operations=self.operations)
+            for chunk in self._read(items):
+                yield func(chunk)
+            return
+
+        if self.executor is None:
+            import concurrent.futures
+
+            self.executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.n_jobs,
+                initializer=_init_worker,
+                initargs=(self.operations,),
+            )
+
+        pending: deque = deque()
+        try:
+            for chunk in self._read(items):
+                if len(pending) >= self.max_pending:
+                    yield pending.popleft().result()
+                pending.append(self.executor.submit(func, chunk))
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _read(self, items: Iterator) -> Iterator[list]:
+        while True:
+            chunk = list(islice(items, self.chunk_size))
+            if not chunk:
+                return
+            self.features_in += len(chunk)
+            self.chunks += 1
+            yield chunk
+
+
+def _init_worker(operations):
+    global _OPERATIONS
+    _OPERATIONS = operations
+
+
+def _apply(feature, operations):
+    for operation in operations:
+        feature = operation(feature)
+        if feature is None:
+            break
+    return feature
+
+
+def _apply_features(features, operations=None):
+    if operations is None:
+        operations = _OPERATIONS
+    results = (_apply(feature, operations) for feature in features)
+    return [result for result in results if result is not None]
+
+
+def _apply_lines(lines, operations=None):
+    if operations is None:
+        operations = _OPERATIONS
+    results = (
+        _apply(_to_feature(json.loads(line.lstrip(_RS)), None), operations)
+        for line in lines
+    )
+    # serialized like write_seq, NumPy values included
+    return [_dumps(result) for result in results if result is not None]
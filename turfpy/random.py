@@ -5,10 +5,16 @@ This is mainly inspired by turf.js.
 link: http://turfjs.org/
 """
 
+import math
 import random
-from typing import Any, Optional
+from typing import Any, Iterator, Optional, Union
 
-from geojson import Feature, FeatureCollection, Point
+import numpy as np
+from geojson import Feature, FeatureCollection, LineString, MultiPolygon, Point, Polygon
+
+from turfpy.helper import get_geom
+
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
 
 
 def random_position(bbox: Optional[list[Any]] = None):
@@ -53,23 +59,329 @@ def coord_in_bbox(bbox: list):
     ]
 
 
-def random_points(count: int = 1, bbox: Optional[list[Any]] = None) -> FeatureCollection:
+def random_points(
+    count: int = 1,
+    bbox: Optional[list[Any]] = None,
+    seed: Seed = None,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
     """
     Generates geojson random points, if bbox provided then the
     generated points will be in the bbox.
 
     :param count: Number of points to be generated, default value is one.
     :param bbox: Bounding box extent in west, south, east, north order
+    :param seed: Seed of the NumPy random generator, an int, a SeedSequence
+        (see :func:`spawn_seeds`) or a ``numpy.random.Generator``.
+    :param as_array: If True an array of shape (count, 2) of coordinates is
+        returned instead of a FeatureCollection.
     :return: A FeatureCollection of generated points.
 
     Exmample:
 
     >>> from turfpy.random import random_points
     >>> random_points(count=3, bbox=[11.953125,
-    >>> 18.979025953255267, 52.03125, 46.558860303117164])
+    >>> 18.979025953255267, 52.03125, 46.558860303117164], seed=42)
+    """
+    coords = _random_coords(np.random.default_rng(seed), count, bbox)
+
+    if as_array:
+        return coords
+
+    return _to_points(coords)
+
+
+def iter_random_points(
+    count: int,
+    bbox: Optional[list[Any]] = None,
+    seed: Seed = None,
+    chunk_size: int = 100_000,
+    as_array: bool = False,
+) -> Iterator[Union[FeatureCollection, np.ndarray]]:
+    """
+    Generates geojson random points in chunks, so that large numbers of points
+    never have to be held in memory at once. For a given seed the points are the
+    same as the ones of :func:`random_points` whatever the chunk size.
+
+    :param count: Number of points to be generated.
+    :param bbox: Bounding box extent in west, south, east, north order
+    :param seed: Seed of the NumPy random generator, see :func:`random_points`.
+    :param chunk_size: Number of points in each chunk.
+    :param as_array: If True arrays of shape (chunk_size, 2) of coordinates are
+        yielded instead of FeatureCollections.
+    :return: An iterator of FeatureCollections of generated points.
+
+    Exmample:
+
+    >>> from turfpy.random import iter_random_points
+    >>> for chunk in iter_random_points(count=10, chunk_size=4, seed=42):
+    ...     print(len(chunk["features"]))
+    """
+    if chunk_size < 1:
+        raise Exception("chunk_size must be a positive number")
+
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, chunk_size):
+        coords = _random_coords(rng, min(chunk_size, count - start), bbox)
+        yield coords if as_array else _to_points(coords)
+
+
+def random_points_in_polygon(
+    polygon: Union[Feature, Polygon, MultiPolygon],
+    count: int = 1,
+    seed: Seed = None,
+    method: str = "auto",
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
+    """
+    Generates geojson random points within a (Multi)Polygon.
+
+    With the 'rejection' method points are sampled in batches in the bbox of the
+    polygon and the points outside the polygon are rejected, the batch size is
+    adapted to the ratio of the polygon area to its bbox area. With the
+    'triangulation' method the polygon is tesselated and points are sampled in
+    triangles picked with a probability proportional to their area, which is
+    better suited to very thin polygons. The default 'auto' method picks the
+    triangulation when the polygon fills less than 5% of its bbox.
+
+    :param polygon: Polygon or MultiPolygon Feature or Geometry.
+    :param count: Number of points to be generated, default value is one.
+    :param seed: Seed of the NumPy random generator, see :func:`random_points`.
+    :param method: 'auto', 'rejection' or 'triangulation'.
+    :param as_array: If True an array of shape (count, 2) of coordinates is
+        returned instead of a FeatureCollection.
+    :return: A FeatureCollection of generated points.
+
+    Exmample:
+
+    >>> from turfpy.random import random_points_in_polygon
+    >>> from geojson import Feature, Polygon
+    >>> polygon = Feature(geometry=Polygon([[(0, 0), (10, 0), (0, 10), (0, 0)]]))
+    >>> random_points_in_polygon(polygon, count=3, seed=42)
+    """
+    from shapely.geometry import shape
+
+    geom = get_geom(polygon)
+    if geom["type"] not in ("Polygon", "MultiPolygon"):
+        raise Exception("Geometry must be Polygon or MultiPolygon")
+    if method not in ("auto", "rejection", "triangulation"):
+        raise Exception(f"{method} method is invalid")
+
+    rng = np.random.default_rng(seed)
+    poly = shape(geom)
+    west, south, east, north = poly.bounds
+    ratio = poly.area / ((east - west) * (north - south) or 1)
+
+    if method == "triangulation" or (method == "auto" and ratio < 0.05):
+        coords = _sample_triangles(rng, Feature(geometry=geom), count)
+    else:
+        coords = _sample_rejection(rng, poly, count, ratio)
+
+    if as_array:
+        return coords
+
+    return _to_points(coords)
+
+
+def _sample_rejection(rng: np.random.Generator, poly, count: int, ratio: float):
+    import shapely
+
+    if ratio == 0:
+        raise Exception("polygon has no area")
+
+    shapely.prepare(poly)
+    bbox = list(poly.bounds)
+    chunks = []
+    found = 0
+    while found < count:
+        # oversample by the inverse of the expected acceptance rate
+        size = min(int((count - found) / ratio * 1.1) + 16, 1_000_000)
+        candidates = _random_coords(rng, size, bbox)
+        inside = candidates[shapely.contains_xy(poly, candidates[:, 0], candidates[:, 1])]
+        chunks.append(inside[: count - found])
+        found += len(chunks[-1])
+
+    return np.concatenate(chunks) if chunks else np.empty((0, 2))
+
+
+def _sample_triangles(rng: np.random.Generator, polygon: Feature, count: int):
+    from turfpy.transformation import tesselate
+
+    triangles = np.array(
+        [f["geometry"]["coordinates"][0][:3] for f in tesselate(polygon)["features"]],
+        dtype=float,
+    ).reshape(-1, 3, 2)
+    a = triangles[:, 0]
+    ab = triangles[:, 1] - a
+    ac = triangles[:, 2] - a
+    areas = np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+    if not areas.sum():
+        raise Exception("polygon has no area")
+
+    picked = rng.choice(len(triangles), size=count, p=areas / areas.sum())
+    r = rng.random((count, 2))
+    # reflect the samples falling in the other half of the parallelogram
+    flip = r.sum(axis=1) > 1
+    r[flip] = 1 - r[flip]
+    return a[picked] + r[:, :1] * ab[picked] + r[:, 1:] * ac[picked]
+
+
+def random_line_strings(
+    count: int = 1,
+    num_vertices: int = 10,
+    max_length: float = 0.0001,
+    max_rotation: float = math.pi / 8,
+    bbox: Optional[list[Any]] = None,
+    seed: Seed = None,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
     """
-    features = []
-    for i in range(count):
-        features.append(Feature(geometry=Point(random_position(bbox))))
+    Generates geojson random LineStrings, if bbox provided then the
+    LineStrings will start in the bbox. All the vertices are generated at once.
+
+    :param count: Number of LineStrings to be generated, default value is one.
+    :param num_vertices: Number of vertices of each LineString.
+    :param max_length: Maximum number of decimal degrees that a vertex can be
+        from its predecessor.
+    :param max_rotation: Maximum number of radians that a segment can turn
+        from the previous segment.
+    :param bbox: Bounding box extent in west, south, east, north order
+    :param seed: Seed of the NumPy random generator, see :func:`random_points`.
+    :param as_array: If True an array of shape (count, num_vertices, 2) of
+        coordinates is returned instead of a FeatureCollection.
+    :return: A FeatureCollection of generated LineStrings.
+
+    Exmample:
+
+    >>> from turfpy.random import random_line_strings
+    >>> random_line_strings(count=3, num_vertices=5, max_length=1, seed=42)
+    """
+    if num_vertices < 2:
+        raise Exception("num_vertices must be at least 2")
+
+    rng = np.random.default_rng(seed)
+    start = _random_coords(rng, count, bbox)
+    angles = np.empty((count, num_vertices - 1))
+    angles[:, 0] = rng.random(count) * 2 * math.pi
+    angles[:, 1:] = (rng.random((count, num_vertices - 2)) - 0.5) * 2 * max_rotation
+    angles = np.cumsum(angles, axis=1)
+    distances = rng.random((count, num_vertices - 1)) * max_length
+
+    coords = np.empty((count, num_vertices, 2))
+    coords[:, 0] = start
+    coords[:, 1:, 0] = distances * np.cos(angles)
+    coords[:, 1:, 1] = distances * np.sin(angles)
+    coords = np.cumsum(coords, axis=1)
+
+    if as_array:
+        return coords
+
+    return FeatureCollection(
+        [Feature(geometry=LineString(line)) for line in coords.tolist()]
+    )
+
+
+def random_polygons(
+    count: int = 1,
+    num_vertices: int = 10,
+    max_radial_length: float = 10,
+    bbox: Optional[list[Any]] = None,
+    seed: Seed = None,
+    as_array: bool = False,
+) -> Union[FeatureCollection, np.ndarray]:
+    """
+    Generates geojson random Polygons, if bbox provided then the Polygons will
+    be in the bbox. Polygons are star shaped around a random hub and all their
+    vertices are generated at once.
+
+    :param count: Number of Polygons to be generated, default value is one.
+    :param num_vertices: Number of vertices of each Polygon, without the
+        closing vertex.
+    :param max_radial_length: Maximum number of decimal degrees latitude or
+        longitude that a vertex can reach out of the center of the Polygon.
+    :param bbox: Bounding box extent in west, south, east, north order, at least
+        twice ``max_radial_length`` wide and high.
+    :param seed: Seed of the NumPy random generator, see :func:`random_points`.
+    :param as_array: If True an array of shape (count, num_vertices + 1, 2) of
+        closed rings is returned instead of a FeatureCollection.
+    :return: A FeatureCollection of generated Polygons.
+
+    Exmample:
+
+    >>> from turfpy.random import random_polygons
+    >>> random_polygons(count=3, num_vertices=5, max_radial_length=1, seed=42)
+    """
+    if num_vertices < 3:
+        raise Exception("num_vertices must be at least 3")
+
+    if bbox:
+        if len(bbox) != 4:
+            raise Exception("bbox with 4 positions are only supported")
+        if (
+            bbox[2] - bbox[0] < 2 * max_radial_length
+            or bbox[3] - bbox[1] < 2 * max_radial_length
+        ):
+            raise Exception("bbox should be at least twice max_radial_length wide")
+        # pad the bbox so that polygons are entirely within it
+        bbox = [
+            bbox[0] + max_radial_length,
+            bbox[1] + max_radial_length,
+            bbox[2] - max_radial_length,
+            bbox[3] - max_radial_length,
+        ]
+
+    rng = np.random.default_rng(seed)
+    hubs = _random_coords(rng, count, bbox)
+    # angular steps in [1, 2) keep every gap under half a turn, so that rings
+    # are star shaped around their hub and never self intersect
+    offsets = np.cumsum(1 + rng.random((count, num_vertices)), axis=1)
+    angles = offsets * 2 * math.pi / offsets[:, -1:]
+    radii = rng.random((count, num_vertices)) * max_radial_length
+
+    coords = np.empty((count, num_vertices + 1, 2))
+    coords[:, :-1, 0] = hubs[:, :1] + radii * np.cos(angles)
+    coords[:, :-1, 1] = hubs[:, 1:] + radii * np.sin(angles)
+    coords[:, -1] = coords[:, 0]
+
+    if as_array:
+        return coords
+
+    return FeatureCollection(
+        [Feature(geometry=Polygon([ring])) for ring in coords.tolist()]
+    )
+
+
+def spawn_seeds(seed: Optional[int], n: int) -> list[np.random.SeedSequence]:
+    """
+    Creates independent seeds for parallel workers, each worker passing its seed
+    to :func:`random_points` or :func:`iter_random_points` gets a reproducible
+    stream which does not overlap with the streams of other workers.
+
+    :param seed: Root seed, if None fresh entropy is used.
+    :param n: Number of seeds to be generated.
+    :return: A list of ``numpy.random.SeedSequence``.
+
+    Exmample:
+
+    >>> from turfpy.random import random_points, spawn_seeds
+    >>> seeds = spawn_seeds(42, 4)
+    >>> random_points(count=3, seed=seeds[0], as_array=True)
+    """
+    return np.random.SeedSequence(seed).spawn(n)
+
+
+def _random_coords(
+    rng: np.random.Generator, count: int, bbox: Optional[list[Any]] = None
+) -> np.ndarray:
+    if not bbox:
+        bbox = [-180, -90, 180, 90]
+
+    if len(bbox) != 4:
+        raise Exception("bbox with 4 positions are only supported")
+
+    west, south, east, north = (float(b) for b in bbox)
+    return rng.random((count, 2)) * [east - west, north - south] + [west, south]
+
 
-    return FeatureCollection(features)
+def _to_points(coords: np.ndarray) -> FeatureCollection:
+    return FeatureCollection([Feature(geometry=Point(c)) for c in coords.tolist()])
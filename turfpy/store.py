@@ -0,0 +1,396 @@
+"""
+This module implements a compact on-disk format for large collections of features.
+
+Coordinates are stored as a raw float64 buffer together with offset arrays, in the
+same layout as :func:`shapely.to_ragged_array`, and properties in a sidecar
+newline-delimited JSON file. Buffers are opened with :class:`numpy.memmap`, so every
+process reading the same store shares the same pages, and measurements are
+computed directly on them with the kernels of :mod:`turfpy._vectorized`.
+"""
+
+import json
+import os
+from typing import Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+from geojson import Feature
+
+from turfpy import _vectorized
+from turfpy.helper import radians_to_length
+from turfpy.index import STRTree, open_index
+
+# geometry type codes, the same as shapely.GeometryType
+_TYPES = {
+    None: -1,
+    "Point": 0,
+    "LineString": 1,
+    "Polygon": 3,
+    "MultiPoint": 4,
+    "MultiLineString": 5,
+    "MultiPolygon": 6,
+}
+_NAMES = {code: name for name, code in _TYPES.items()}
+
+# dtype and number of columns of the buffers of a store
+_BUFFERS = {
+    "coords": ("<f8", 2),
+    "ring_offsets": ("<i8", 1),
+    "part_offsets": ("<i8", 1),
+    "geom_offsets": ("<i8", 1),
+    "types": ("<i1", 1),
+    "properties_offsets": ("<i8", 1),
+}
+
+
+class CoordinateStore:
+    """
+    A collection of features stored on disk, created with :func:`write_store` and
+    opened with :func:`open_store`.
+
+    Every geometry is made of parts, each part made of rings, a ring being a list
+    of coordinates: a Polygon has one part, a MultiLineString has one ring per part
+    and a Point or a MultiPoint has a single ring holding all its positions.
+    ``coords[ring_offsets[i]:ring_offsets[i + 1]]`` are the coordinates of the
+    ring ``i``, ``part_offsets`` gives the rings of each part and
+    ``geom_offsets`` the parts of each feature.
+
+    Pickling a store only pickles its path, so it can be sent to a pool of
+    processes without copying its buffers.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+
+        self.coords = self._open("coords")
+        self.ring_offsets = self._open("ring_offsets")
+        self.part_offsets = self._open("part_offsets")
+        self.geom_offsets = self._open("geom_offsets")
+        self.types = self._open("types")
+        self.properties_offsets = self._open("properties_offsets")
+        self._index: Optional[STRTree] = None
+
+    def _open(self, name: str) -> np.ndarray:
+        dtype, columns = _BUFFERS[name]
+        length = self.meta[name]
+        shape = (length, columns) if columns > 1 else (length,)
+        # np.memmap cannot map an empty file
+        if not length:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(
+            os.path.join(self.path, name + ".bin"), dtype=dtype, mode="r", shape=shape
+        )
+
+    def __reduce__(self):
+        return open_store, (self.path,)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[Feature]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, index: int) -> Feature:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CoordinateStore index out of range")
+
+        record = self.record(index)
+        result = Feature(geometry=self.geometry(index), properties=record["properties"])
+        if "id" in record:
+            result.id = record["id"]
+        return result
+
+    def record(self, index: int) -> dict:
+        """
+        :param index: Index of the feature.
+        :return: The properties and id of the feature, as read from the sidecar file.
+        """
+        start, end = self.properties_offsets[index], self.properties_offsets[index + 1]
+        with open(os.path.join(self.path, "properties.jsonl"), "rb") as f:
+            f.seek(start)
+            return json.loads(f.read(end - start))
+
+    def geometry(self, index: int) -> Optional[dict]:
+        """
+        :param index: Index of the feature.
+        :return: The geometry of the feature as a GeoJSON dict.
+        """
+        geom_type = _NAMES[int(self.types[index])]
+        if geom_type is None:
+            return None
+
+        parts = []
+        for part in range(self.geom_offsets[index], self.geom_offsets[index + 1]):
+            rings = []
+            for ring in range(self.part_offsets[part], self.part_offsets[part + 1]):
+                start, end = self.ring_offsets[ring], self.ring_offsets[ring + 1]
+                rings.append(self.coords[start:end].tolist())
+            parts.append(rings)
+
+        if geom_type == "Point":
+            coordinates = parts[0][0][0]
+        elif geom_type in ("LineString", "MultiPoint"):
+            coordinates = parts[0][0]
+        elif geom_type == "Polygon":
+            coordinates = parts[0]
+        elif geom_type == "MultiLineString":
+            coordinates = [rings[0] for rings in parts]
+        else:
+            coordinates = parts
+        return {"type": geom_type, "coordinates": coordinates}
+
+    def bbox(self, chunk_size: int = 1 << 16) -> np.ndarray:
+        """
+        Bounding box of every feature, NaN for features without coordinates.
+
+        :param chunk_size: Number of features processed at a time.
+        :return: An array of shape (N, 4) of west, south, east, north.
+        """
+        return self._reduce(_vectorized.bbox, chunk_size, (0, 4))
+
+    def area(self, chunk_size: int = 1 << 16) -> np.ndarray:
+        """
+        Area of every feature in square meters, computed in the same way as
+        :func:`turfpy.measurement.area`.
+
+        :param chunk_size: Number of features processed at a time.
+        :return: An array of shape (N,).
+        """
+        return self._reduce(_vectorized.area, chunk_size)
+
+    def length(self, units: str = "km", chunk_size: int = 1 << 16) -> np.ndarray:
+        """
+        Length of every feature, computed in the same way as
+        :func:`turfpy.measurement.length`.
+
+        :param units: Units of the returned lengths.
+        :param chunk_size: Number of features processed at a time.
+        :return: An array of shape (N,).
+        """
+        return radians_to_length(self._reduce(_vectorized.length, chunk_size), units)
+
+    def centroid(self, chunk_size: int = 1 << 16) -> np.ndarray:
+        """
+        Mean of the vertices of every feature, as :func:`turfpy.measurement.centroid`,
+        NaN for features without coordinates.
+
+        :param chunk_size: Number of features processed at a time.
+        :return: An array of shape (N, 2).
+        """
+        return self._reduce(_vectorized.centroid, chunk_size, (0, 2))
+
+    @property
+    def index(self) -> STRTree:
+        """
+        Spatial index of the bounding boxes of the features, opened memory-mapped
+        if written by :meth:`write_index`, otherwise built on first use.
+        """
+        if self._index is None:
+            path = os.path.join(self.path, "index")
+            if os.path.exists(os.path.join(path, "meta.json")):
+                self._index = open_index(path)
+            else:
+                self._index = STRTree(self.bbox())
+        return self._index
+
+    def write_index(self, node_capacity: int = 16) -> STRTree:
+        """
+        Builds the spatial index of the features and writes it in the store, so
+        every process opening the store maps the same index.
+
+        :param node_capacity: Maximum number of children of every node.
+        :return: The written index.
+        """
+        self._index = STRTree(self.bbox(), node_capacity).save(
+            os.path.join(self.path, "index")
+        )
+        return self._index
+
+    def query(self, bbox: list) -> np.ndarray:
+        """
+        Finds the features whose bounding box intersects a bounding box.
+
+        :param bbox: Bounding box in west, south, east, north order.
+        :return: The sorted indices of the features.
+
+        Example:
+
+        >>> from turfpy.store import open_store
+        >>> store = open_store("parcels.store")
+        >>> features = [store[i] for i in store.query([2.2, 48.8, 2.5, 48.9])]
+        """
+        return self.index.query(bbox)
+
+    def _reduce(self, func, chunk_size: int, empty=(0,)) -> np.ndarray:
+        return np.concatenate(
+            [func(*block) for block in self._blocks(chunk_size)] or [np.empty(empty)]
+        )
+
+    def _blocks(self, chunk_size: int) -> Iterator[_vectorized.Block]:
+        # chunk_size features at a time with the matching slice of coordinates
+        for g0 in range(0, len(self), chunk_size):
+            g1 = min(g0 + chunk_size, len(self))
+            p0, p1 = self.geom_offsets[g0], self.geom_offsets[g1]
+            c0, c1 = (
+                self.ring_offsets[self.part_offsets[p0]],
+                self.ring_offsets[self.part_offsets[p1]],
+            )
+            yield _vectorized.layout(
+                self.coords[c0:c1],
+                self.ring_offsets,
+                self.part_offsets,
+                self.geom_offsets[g0 : g1 + 1],
+                self.types[g0:g1],
+            )
+
+
+def open_store(path: Union[str, os.PathLike]) -> CoordinateStore:
+    """
+    Opens a store written by :func:`write_store`, buffers are memory-mapped read only.
+
+    :param path: Directory of the store.
+    :return: A :class:`CoordinateStore`.
+
+    Example:
+
+    >>> from turfpy.store import open_store
+    >>> store = open_store("parcels.store")
+    >>> store.area()
+    """
+    return CoordinateStore(path)
+
+
+def write_store(
+    features: Iterable[dict],
+    path: Union[str, os.PathLike],
+    chunk_size: int = 10000,
+) -> CoordinateStore:
+    """
+    Writes features to a store, features are consumed and appended to the buffers
+    ``chunk_size`` at a time so any iterable, like :func:`turfpy.io.read_features`
+    or :func:`turfpy.io.read_seq`, is written with constant memory. Only the first
+    two dimensions of coordinates are kept.
+
+    :param features: An iterable of GeoJSON Features or a FeatureCollection.
+    :param path: Directory of the store, created if it does not exist.
+    :param chunk_size: Number of features buffered before being written.
+    :return: The written :class:`CoordinateStore`.
+
+    Example:
+
+    >>> from turfpy.io import read_features
+    >>> from turfpy.store import write_store
+    >>> store = write_store(read_features("parcels.geojson"), "parcels.store")
+    """
+    if isinstance(features, dict) and "features" in features:
+        features = features["features"]
+
+    writer = _StoreWriter(path)
+    try:
+        for feature in features:
+            writer.append(feature)
+            if len(writer.types) >= chunk_size:
+                writer.flush()
+    finally:
+        writer.close()
+
+    return CoordinateStore(path)
+
+
+class _StoreWriter:
+    """
+    Appends features to the buffers of a store, features are kept in lists until
+    :meth:`flush` and the metadata file is only written by :meth:`close`.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.files = {
+            name: open(os.path.join(path, name + ".bin"), "wb") for name in _BUFFERS
+        }
+        self.properties_file = open(os.path.join(path, "properties.jsonl"), "wb")
+        self.sizes = {name: 0 for name in _BUFFERS}
+        # last value written to every offset buffer
+        self.ends = {name: 0 for name in self.sizes if name.endswith("_offsets")}
+        for name in self.ends:
+            self.write(name, np.zeros(1, dtype="<i8"))
+        self.clear()
+
+    def clear(self):
+        # x and y of every position, flat to avoid allocating a list per position
+        self.coords: List[float] = []
+        self.ring_lengths: List[int] = []
+        self.part_lengths: List[int] = []
+        self.geom_lengths: List[int] = []
+        self.types: List[int] = []
+        self.records: List[bytes] = []
+
+    def write(self, name: str, array: np.ndarray):
+        array.tofile(self.files[name])
+        self.sizes[name] += len(array)
+
+    def append(self, feature: dict):
+        geometry = feature.get("geometry") if feature["type"] == "Feature" else feature
+        geom_type = geometry["type"] if geometry else None
+        if geom_type not in _TYPES:
+            raise Exception(f"{geom_type} is not supported")
+
+        parts: list = []
+        if geom_type == "Point":
+            parts = [[[geometry["coordinates"]]]]  # type: ignore[index]
+        elif geom_type in ("LineString", "MultiPoint"):
+            parts = [[geometry["coordinates"]]]  # type: ignore[index]
+        elif geom_type == "Polygon":
+            parts = [geometry["coordinates"]]  # type: ignore[index]
+        elif geom_type == "MultiLineString":
+            parts = [[line] for line in geometry["coordinates"]]  # type: ignore[index]
+        elif geom_type == "MultiPolygon":
+            parts = geometry["coordinates"]  # type: ignore[index]
+
+        for rings in parts:
+            for ring in rings:
+                for position in ring:
+                    self.coords.append(position[0])
+                    self.coords.append(position[1])
+                self.ring_lengths.append(len(ring))
+            self.part_lengths.append(len(rings))
+        self.geom_lengths.append(len(parts))
+        self.types.append(_TYPES[geom_type])
+
+        record = {"properties": feature.get("properties") or {}}
+        if "id" in feature:
+            record["id"] = feature["id"]
+        self.records.append((json.dumps(record) + "\n").encode("utf-8"))
+
+    def flush(self):
+        self.write("coords", np.array(self.coords, dtype="<f8").reshape(-1, 2))
+        self.write("types", np.array(self.types, dtype="<i1"))
+
+        lengths = {
+            "ring_offsets": self.ring_lengths,
+            "part_offsets": self.part_lengths,
+            "geom_offsets": self.geom_lengths,
+            "properties_offsets": [len(record) for record in self.records],
+        }
+        for name, values in lengths.items():
+            if values:
+                offsets = self.ends[name] + np.cumsum(values, dtype="<i8")
+                self.write(name, offsets)
+                self.ends[name] = int(offsets[-1])
+
+        self.properties_file.writelines(self.records)
+        self.clear()
+
+    def close(self):
+        self.flush()
+        for f in self.files.values():
+            f.close()
+        self.properties_file.close()
+
+        with open(os.path.join(self.path, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"version": 1, **self.sizes}, f)
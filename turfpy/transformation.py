@@ -6,25 +6,31 @@ link: http://turfjs.org/
 """
 
 import copy
+import heapq
 import itertools
 import math
+from concurrent.futures import Executor
 from math import floor, sqrt
 from typing import List, Optional, Union
 
 import numpy as np
+import shapely
 from geojson import Feature, FeatureCollection, LineString, MultiLineString
 from geojson import Point as GeoPoint
 from geojson import Polygon
-from scipy.spatial import Delaunay, Voronoi
+from shapely import GeometryType
 from shapely import geometry as geometry
 from shapely.geometry import LineString as ShapelyLineString
 from shapely.geometry import MultiPoint, MultiPolygon, Point, mapping, shape
 from shapely.ops import clip_by_rect, polygonize, unary_union
 
+from turfpy._compact import is_geometry_array
+from turfpy._vectorized import array_rotate, ranks
+from turfpy.cache import invalidate, memoize
 from turfpy.helper import get_coord, get_coords, get_geom, get_type, length_to_degrees
+from turfpy.io import _coordinate_parts, _copy_without_coordinates, _flatten, _unflatten
 from turfpy.measurement import (
     bbox,
-    bbox_polygon,
     center,
     centroid,
     destination,
@@ -33,6 +39,7 @@ from turfpy.measurement import (
     rhumb_distance,
 )
 from turfpy.meta import coord_each, feature_each, flatten_each
+from turfpy.parallel import map_chunks, pack_geometries, unpack_geometries
 
 from .dev_lib.earcut import earcut
 from .dev_lib.spline import Spline
@@ -88,17 +95,70 @@ def bbox_clip(geojson: Feature, bbox: list) -> Feature:
     >>> bbox = [0, 0, 10, 10]
     >>> clip = bbox_clip(f, bbox)
     """
-    bb_polygon = bbox_polygon(bbox)
+    clipped = _clip_by_rect([shape(get_geom(geojson))], bbox)[0]
 
-    bb_clip = intersect([geojson, bb_polygon])
+    if clipped.is_empty:
+        return None
+
+    properties = geojson["properties"] if "properties" in geojson else {}
+
+    return Feature(geometry=mapping(clipped), properties=properties)
+
+
+def bbox_clip_many(
+    features: Union[List[Feature], FeatureCollection], bbox: list
+) -> FeatureCollection:
+    """
+    Clips every feature of a FeatureCollection (or list of features) to a bbox
+    in a single vectorized call, features falling outside the bbox are dropped.
+    :param features: List of features or FeatureCollection
+    :param bbox: Bounding Box which is used to clip the features
+    :return: FeatureCollection of clipped features
+
+    Example:
+
+    >>> from turfpy.transformation import bbox_clip_many
+    >>> from geojson import Feature, FeatureCollection, LineString, Polygon
+    >>> f1 = Feature(geometry=Polygon([[[2, 2], [8, 4], [12, 8], [3, 7], [2, 2]]]))
+    >>> f2 = Feature(geometry=LineString([[-5, 5], [15, 5]]))
+    >>> bbox_clip_many(FeatureCollection([f1, f2]), [0, 0, 10, 10])
+    """
+    if isinstance(features, list):
+        features = FeatureCollection(features)
 
-    if not bb_clip:
-        return bb_clip
+    if "features" not in features.keys():
+        raise Exception("Invalid FeatureCollection")
 
-    if "properties" in geojson:
-        bb_clip.properties = geojson["properties"]
+    source = [f for f in features["features"] if get_geom(f)]
+    clipped = _clip_by_rect([shape(get_geom(f)) for f in source], bbox)
+    keep = np.flatnonzero(~shapely.is_empty(clipped))
 
-    return bb_clip
+    results = []
+    for i in keep:
+        feature = Feature(
+            geometry=mapping(clipped[i]), properties=source[i].get("properties", {})
+        )
+        if "id" in source[i]:
+            feature.id = source[i]["id"]
+        results.append(feature)
+
+    return FeatureCollection(results)
+
+
+def _clip_by_rect(geoms: list, bbox: list) -> np.ndarray:
+    """
+    Clip shapely geometries to a bbox with GEOS rectangle clipping and orient
+    the resulting polygons following the right-hand rule.
+    """
+    if len(bbox) != 4:
+        raise Exception("bbox with 4 positions are only supported")
+
+    west, south, east, north = (float(b) for b in bbox)
+    clipped = shapely.clip_by_rect(
+        np.asarray(geoms, dtype=object), west, south, east, north
+    )
+
+    return _orient_polygons(clipped)
 
 
 def _enforce_right_hand_rule(geojson_feature: Feature) -> Feature:
@@ -121,6 +181,44 @@ def _enforce_right_hand_rule(geojson_feature: Feature) -> Feature:
     return feature
 
 
+def _orient_polygons(geoms: np.ndarray) -> np.ndarray:
+    """
+    Orient (Multi)Polygons of an array of shapely geometries following the
+    right-hand rule, other geometries are left untouched.
+    """
+    geoms = geoms.copy()
+    polygonal = np.flatnonzero(
+        np.isin(
+            shapely.get_type_id(geoms),
+            [GeometryType.POLYGON, GeometryType.MULTIPOLYGON],
+        )
+        & ~shapely.is_empty(geoms)
+    )
+    if len(polygonal):
+        parts, index = shapely.get_parts(geoms[polygonal], return_index=True)
+        # exterior rings counter-clockwise and holes clockwise, each ring on its own
+        rings, ring_part = shapely.get_rings(parts, return_index=True)
+        exterior = np.r_[True, ring_part[1:] != ring_part[:-1]]
+        wrong = shapely.is_ccw(rings) != exterior
+        if wrong.any():
+            rings[wrong] = shapely.reverse(rings[wrong])
+            fixed = np.unique(ring_part[wrong])
+            in_fixed = np.isin(ring_part, fixed)
+            parts[fixed] = shapely.polygons(
+                rings[in_fixed], indices=np.searchsorted(fixed, ring_part[in_fixed])
+            )
+        single = shapely.get_type_id(geoms[polygonal]) == GeometryType.POLYGON
+        geoms[polygonal[single]] = parts[np.isin(index, np.flatnonzero(single))]
+        if not single.all():
+            multi = np.flatnonzero(~single)
+            in_multi = np.isin(index, multi)
+            geoms[polygonal[multi]] = shapely.multipolygons(
+                parts[in_multi], indices=np.searchsorted(multi, index[in_multi])
+            )
+
+    return geoms
+
+
 def intersect(features: Union[List[Feature], FeatureCollection]) -> Feature:
     """
     Takes polygons and finds their intersection
@@ -330,6 +428,8 @@ def _alpha_shape(points, alpha):
         # shape.
         return geometry.MultiPoint(list(points)).convex_hull
 
+    from scipy.spatial import Delaunay
+
     def add_edge(edges, edge_points, coords, i, j):
         """Add a line between the i-th and j-th points, if not in the list already"""
         if (i, j) in edges or (j, i) in edges:
@@ -584,6 +684,143 @@ def difference(feature_1: Feature, feature_2: Feature) -> Feature:
     return difference_feature
 
 
+def overlay(
+    features_1: Union[List[Feature], FeatureCollection],
+    features_2: Union[List[Feature], FeatureCollection],
+    how: str = "intersection",
+    n_jobs: Optional[int] = 1,
+    executor: Optional[Executor] = None,
+) -> FeatureCollection:
+    """
+    Overlay two FeatureCollections. An STRtree is built on the second collection
+    and only candidate pairs with intersecting geometries are processed, using
+    shapely vectorized operations.
+
+    With ``how="intersection"`` one feature is returned for every intersecting
+    pair, with ``how="difference"`` every feature of the first collection is
+    returned minus all the features of the second collection it intersects.
+    Properties are merged in the same way as :func:`intersect` and
+    :func:`difference`.
+
+    :param features_1: A list of GeoJSON features or FeatureCollection.
+    :param features_2: A list of GeoJSON features or FeatureCollection.
+    :param how: Overlay operation, 'intersection' or 'difference'.
+    :param n_jobs: Number of chunks the first collection is split in, processed
+        by the shared executor of :mod:`turfpy.parallel`. Default value is 1 which
+        runs in the current process, None uses one chunk per worker.
+    :param executor: A :class:`concurrent.futures.Executor` used instead of the
+        shared executor.
+    :return: A FeatureCollection of overlay results.
+
+    Example:
+
+    >>> from geojson import Polygon, Feature, FeatureCollection
+    >>> from turfpy.transformation import overlay
+    >>> zones = FeatureCollection([Feature(geometry=Polygon([[
+    ...     [0, 0], [0, 2], [2, 2], [2, 0], [0, 0]]]), properties={"zone": "A"})])
+    >>> parcels = FeatureCollection([
+    ...     Feature(geometry=Polygon([[[1, 1], [1, 3], [3, 3], [3, 1], [1, 1]]]),
+    ...             properties={"parcel": 1}),
+    ...     Feature(geometry=Polygon([[[5, 5], [5, 6], [6, 6], [6, 5], [5, 5]]]),
+    ...             properties={"parcel": 2})])
+    >>> overlay(zones, parcels, how="intersection")
+    """
+    if how not in ("intersection", "difference"):
+        raise Exception("how should be either 'intersection' or 'difference'")
+
+    features_1 = [f for f in _overlay_features(features_1) if get_geom(f)]
+    features_2 = [f for f in _overlay_features(features_2) if get_geom(f)]
+
+    geoms_1 = np.array([shape(get_geom(f)) for f in features_1], dtype=object)
+    geoms_2 = np.array([shape(get_geom(f)) for f in features_2], dtype=object)
+
+    if n_jobs == 1 and executor is None:
+        index_1, index_2, results = _overlay_chunk(geoms_1, geoms_2, how)
+    else:
+        parts = map_chunks(
+            _overlay_shared,
+            len(geoms_1),
+            [*pack_geometries(geoms_1), *pack_geometries(geoms_2)],
+            (how,),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        index_1 = np.concatenate([p[0] for p in parts])
+        index_2 = np.concatenate([p[1] for p in parts])
+        results = np.concatenate([p[2] for p in parts])
+
+    output = []
+    for i, j, result in zip(index_1, index_2, results):
+        properties_list = [copy.deepcopy(features_1[i].get("properties") or {})]
+        if how == "intersection":
+            properties_list.append(features_2[j].get("properties") or {})
+        else:
+            for k in j:
+                properties_list.append(features_2[k].get("properties") or {})
+        output.append(
+            Feature(geometry=mapping(result), properties=merge_dict(properties_list))
+        )
+
+    return FeatureCollection(output)
+
+
+def _overlay_features(features):
+    if isinstance(features, list):
+        return features
+
+    if "features" not in features.keys():
+        raise Exception("Invalid FeatureCollection")
+
+    return features["features"]
+
+
+def _overlay_shared(start, stop, buffer_1, offsets_1, buffer_2, offsets_2, how):
+    """
+    Compute the overlay of the geometries ``start:stop`` of the first packed
+    collection with the second one, indices are relative to the whole collection.
+    """
+    geoms_1 = unpack_geometries(buffer_1, offsets_1, start, stop)
+    geoms_2 = unpack_geometries(buffer_2, offsets_2)
+    index_1, index_2, results = _overlay_chunk(geoms_1, geoms_2, how)
+    return index_1 + start, index_2, results
+
+
+def _overlay_chunk(geoms_1: np.ndarray, geoms_2: np.ndarray, how: str):
+    """
+    Compute the overlay of two arrays of shapely geometries.
+
+    For intersection the index arrays of the intersecting pairs are returned with
+    the intersection geometries, for difference the second index array holds for
+    every geometry of ``geoms_1`` the indices of ``geoms_2`` subtracted from it.
+    Empty results are dropped.
+    """
+    tree = shapely.STRtree(geoms_2)
+    index_1, index_2 = tree.query(geoms_1, predicate="intersects")
+    order = np.lexsort((index_2, index_1))
+    index_1, index_2 = index_1[order], index_2[order]
+
+    if how == "intersection":
+        results = shapely.intersection(geoms_1[index_1], geoms_2[index_2])
+        keep = ~shapely.is_empty(results)
+        return index_1[keep], index_2[keep], _orient_polygons(results[keep])
+
+    # subtract the k-th candidate of every geometry at once
+    starts = np.searchsorted(index_1, index_1)
+    rank = np.arange(len(index_1)) - starts
+    results = geoms_1.copy()
+    for k in range(rank.max() + 1 if len(rank) else 0):
+        selected = rank == k
+        results[index_1[selected]] = shapely.difference(
+            results[index_1[selected]], geoms_2[index_2[selected]]
+        )
+
+    groups = np.split(index_2, np.searchsorted(index_1, np.arange(1, len(geoms_1))))
+    keep = np.flatnonzero(~shapely.is_empty(results))
+    subtracted = np.empty(len(keep), dtype=object)
+    subtracted[:] = [groups[i] for i in keep]
+    return keep, subtracted, _orient_polygons(results[keep])
+
+
 def transform_rotate(
     feature: Union[List[Feature], FeatureCollection],
     angle: float,
@@ -603,6 +840,10 @@ def transform_rotate(
         (significant performance increase if True)
     :return: the rotated GeoJSON
 
+    A GeoSeries, GeoDataFrame or array of shapely geometries is also accepted, every
+    geometry is then rotated around its own centroid, or the given pivot, with
+    vectorized operations and returned in the same container.
+
     Example :-
 
     >>> from turfpy.transformation import transform_rotate
@@ -611,6 +852,11 @@ def transform_rotate(
     >>> pivot = [0, 25]
     >>> transform_rotate(f, 10, pivot)
     """
+    if is_geometry_array(feature):
+        if angle == 0:
+            return feature
+        return array_rotate(feature, angle, pivot, mutate)
+
     if not feature:
         raise Exception("geojson is required")
 
@@ -636,6 +882,8 @@ def transform_rotate(
 
     coord_each(feature, _callback_coord_each)
 
+    if mutate:
+        invalidate(feature)
     return feature
 
 
@@ -703,6 +951,8 @@ def transform_translate(
 
     coord_each(feature, _callback_coord_each)
 
+    if mutate:
+        invalidate(feature)
     return feature
 
 
@@ -748,11 +998,15 @@ def transform_scale(
         def _callback_feature_each(feature, feature_index):
             nonlocal factor, origin, features
             features["features"][feature_index] = scale(feature, factor, origin)
+            return True
 
         feature_each(features, _callback_feature_each)
-        return features
+    else:
+        features = scale(features, factor, origin)
 
-    return scale(features, factor, origin)
+    if mutate:
+        invalidate(features)
+    return features
 
 
 def scale(feature, factor, origin):
@@ -780,6 +1034,7 @@ def scale(feature, factor, origin):
     return feature
 
 
+@memoize
 def define_origin(geojson, origin):
     if not origin:
         origin = "centroid"
@@ -1060,6 +1315,8 @@ def voronoi(
     >>> bbox = [-70, 40, -60, 60]
     >>> voronoi(points, bbox)
     """
+    from scipy.spatial import Voronoi
+
     if isinstance(points, FeatureCollection):
         coords = []
         for feature in points["features"]:
@@ -1089,3 +1346,295 @@ def voronoi(
         cliped_result = clip_by_rect(result, w, s, e, n)
         return Feature(geometry=cliped_result)
     return Feature(geometry=result)
+
+
+_SIMPLIFY_METHODS = ("douglas-peucker", "visvalingam")
+
+
+def simplify(
+    geojson,
+    tolerance: float = 1,
+    high_quality: bool = False,
+    method: str = "douglas-peucker",
+    mutate: bool = False,
+):
+    """
+    Simplifies the LineStrings and the rings of the Polygons of any GeoJSON, points
+    are left unchanged. The vertices of all the lines of a FeatureCollection are
+    simplified together in NumPy arrays.
+
+    With the 'douglas-peucker' method the vertices farther than ``tolerance`` from
+    the simplified line are kept, with the 'visvalingam' method vertices are
+    removed by increasing area of the triangle they form with their neighbours
+    while this area is smaller than ``tolerance`` squared. Unless ``high_quality``
+    is True, the vertices closer than ``tolerance`` to the previous kept vertex are
+    removed first, which is faster but less accurate.
+
+    Lines keep their first and last vertices, rings stay closed and keep at least 3
+    distinct vertices.
+
+    :param geojson: GeoJSON Feature, FeatureCollection or Geometry to simplify.
+    :param tolerance: Simplification tolerance in the units of the coordinates.
+    :param high_quality: If True the vertices close to each other are not removed
+        before the simplification.
+    :param method: 'douglas-peucker' or 'visvalingam'.
+    :param mutate: allows GeoJSON input to be mutated
+        (significant performance increase if true)
+    :return: The simplified GeoJSON.
+
+    Example :-
+
+    >>> from turfpy.transformation import simplify
+    >>> from geojson import LineString, Feature
+    >>> f = Feature(geometry=LineString([[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6]]))
+    >>> simplify(f, tolerance=0.5)
+    """
+    if not geojson:
+        raise Exception("geojson is required")
+
+    if tolerance < 0:
+        raise Exception("invalid tolerance")
+
+    if method not in _SIMPLIFY_METHODS:
+        raise Exception(f"method should be one of {', '.join(_SIMPLIFY_METHODS)}")
+
+    if not mutate:
+        # the lines are replaced below, only the kept positions are copied
+        geojson = _copy_without_coordinates(geojson, ("line", "ring"))
+
+    parts = [
+        (container, key, kind == "ring")
+        for container, key, kind in _coordinate_parts(geojson)
+        if kind in ("line", "ring") and len(container[key])
+    ]
+    if not parts:
+        return geojson
+
+    positions = [container[key] for container, key, _ in parts]
+    for (_, _, ring), part in zip(parts, positions):
+        if ring and len(part) < 4:
+            raise Exception("invalid polygon")
+    xy = np.concatenate([_xy(part) for part in positions])
+    stops = np.cumsum([len(part) for part in positions])
+    starts = stops - [len(part) for part in positions]
+    rings = np.array([ring for _, _, ring in parts])
+    sq_tolerance = tolerance * tolerance
+
+    # index of the candidate vertices, and their first and last of every part
+    if high_quality:
+        candidates = np.arange(len(xy))
+    else:
+        candidates = _radial_distance(xy, starts, stops, sq_tolerance)
+    first = np.searchsorted(candidates, starts)
+    last = np.searchsorted(candidates, stops) - 1
+
+    if method == "douglas-peucker":
+        kept = _douglas_peucker(xy[candidates], first, last, sq_tolerance)
+    else:
+        kept = _visvalingam(xy[candidates], first, last, rings, sq_tolerance)
+    keep = np.zeros(len(xy), dtype=bool)
+    keep[candidates[kept]] = True
+
+    for i in np.flatnonzero(rings):
+        if keep[starts[i] : stops[i]].sum() < 4:
+            keep[starts[i] + _ring_triangle(xy[starts[i] : stops[i]])] = True
+
+    for (container, key, _), part, start, stop in zip(parts, positions, starts, stops):
+        kept_positions = [part[i] for i in np.flatnonzero(keep[start:stop])]
+        container[key] = (
+            kept_positions if mutate else [copy.copy(p) for p in kept_positions]
+        )
+
+    if mutate:
+        invalidate(geojson)
+    return geojson
+
+
+def truncate(geojson, precision: int = 6, coordinates: int = 2, mutate: bool = False):
+    """
+    Takes a GeoJSON and truncates the precision of its coordinates, and drops the
+    coordinates beyond the Z value or the Z value itself. The positions of all the
+    geometries are rounded together in NumPy arrays.
+
+    :param geojson: GeoJSON Feature, FeatureCollection or Geometry to truncate.
+    :param precision: Number of decimals kept.
+    :param coordinates: Maximum number of coordinates of the positions, 2 drops the
+        Z values.
+    :param mutate: allows GeoJSON input to be mutated
+        (significant performance increase if true)
+    :return: The truncated GeoJSON.
+
+    Example :-
+
+    >>> from turfpy.transformation import truncate
+    >>> from geojson import Point, Feature
+    >>> f = Feature(geometry=Point([70.46923055566859, 58.11088890802906, 1508]))
+    >>> truncate(f, precision=3)
+    """
+    if not geojson:
+        raise Exception("geojson is required")
+
+    if precision < 0:
+        raise Exception("precision must be a positive number")
+
+    if coordinates < 2:
+        raise Exception("coordinates must be at least 2")
+
+    if not mutate:
+        geojson = _copy_without_coordinates(geojson)
+
+    parts = [part for part in _coordinate_parts(geojson) if len(part[0][part[1]])]
+    positions, sizes = _flatten(parts)
+    widths = np.fromiter(map(len, positions), dtype=np.intp, count=len(positions))
+    if len(widths) and (widths == widths[0]).all():
+        values = np.array(positions, dtype=float)[:, :coordinates]
+        truncated = np.round(values, precision).tolist()
+    else:
+        truncated = [None] * len(positions)
+        # positions with and without elevation are rounded separately
+        for width in np.unique(widths).tolist():
+            index = np.flatnonzero(widths == width).tolist()
+            values = np.array([positions[i] for i in index], dtype=float)[:, :coordinates]
+            for i, position in zip(index, np.round(values, precision).tolist()):
+                truncated[i] = position
+    _unflatten(parts, truncated, sizes)
+
+    if mutate:
+        invalidate(geojson)
+    return geojson
+
+
+def _xy(positions) -> np.ndarray:
+    try:
+        return np.asarray(positions, dtype=float).reshape(len(positions), -1)[:, :2]
+    except ValueError:
+        # positions with and without elevation
+        return np.array([p[:2] for p in positions], dtype=float).reshape(-1, 2)
+
+
+def _radial_distance(xy, starts, stops, sq_tolerance) -> np.ndarray:
+    # sequential by nature, each vertex is compared with the previous kept one
+    x, y = xy[:, 0].tolist(), xy[:, 1].tolist()
+    kept = []
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        if start == stop:
+            continue
+        kept.append(start)
+        px, py = x[start], y[start]
+        for i in range(start + 1, stop):
+            dx, dy = x[i] - px, y[i] - py
+            if dx * dx + dy * dy > sq_tolerance:
+                kept.append(i)
+                px, py = x[i], y[i]
+        if kept[-1] != stop - 1:
+            kept.append(stop - 1)
+    return np.array(kept, dtype=np.intp)
+
+
+def _sq_segment_distances(px, py, ax, ay, bx, by) -> np.ndarray:
+    # squared distances of points to segments, components in separate arrays
+    dx, dy = bx - ax, by - ay
+    px, py = px - ax, py - ay
+    sq_length = dx * dx + dy * dy
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = (px * dx + py * dy) / sq_length
+    t = np.clip(np.nan_to_num(t), 0, 1)
+    px -= t * dx
+    py -= t * dy
+    return px * px + py * py
+
+
+def _douglas_peucker(xy, first, last, sq_tolerance) -> np.ndarray:
+    # the stack of spans is processed all at once, every iteration splits each
+    # span at its farthest vertex from the segment joining its ends
+    keep = np.zeros(len(xy), dtype=bool)
+    keep[first] = True
+    keep[last] = True
+    x, y = xy[:, 0].copy(), xy[:, 1].copy()
+    while True:
+        spans = last - first > 1
+        first, last = first[spans], last[spans]
+        if not len(first):
+            return keep
+        counts = last - first - 1
+        span = np.repeat(np.arange(len(first)), counts)
+        points = first[span] + 1 + ranks(counts)
+        a, b = first[span], last[span]
+        distances = _sq_segment_distances(x[points], y[points], x[a], y[a], x[b], y[b])
+        farthest = np.maximum.reduceat(distances, np.cumsum(counts) - counts)
+        # first vertex at the maximum distance of every span
+        at_max = np.flatnonzero(distances == farthest[span])
+        at_max = at_max[np.r_[True, span[at_max][1:] != span[at_max][:-1]]]
+        split = farthest > sq_tolerance
+        index = points[at_max][split]
+        keep[index] = True
+        first, last = np.concatenate([first[split], index]), np.concatenate(
+            [index, last[split]]
+        )
+
+
+def _visvalingam(xy, first, last, rings, sq_tolerance) -> np.ndarray:
+    n = len(xy)
+    previous = np.arange(-1, n - 1)
+    following = np.arange(1, n + 1)
+    part = np.repeat(np.arange(len(first)), last - first + 1)
+    counts = (last - first + 1).tolist()
+    # rings keep 3 distinct vertices and their closing vertex
+    minimum = np.where(rings, 4, 2).tolist()
+
+    interior = np.ones(n, dtype=bool)
+    interior[first] = False
+    interior[last] = False
+    areas = np.full(n, np.inf)
+    inner = np.flatnonzero(interior)
+    areas[inner] = _triangle_areas(xy[inner - 1], xy[inner], xy[inner + 1])
+
+    candidates = inner[areas[inner] < sq_tolerance]
+    heap = list(zip(areas[candidates].tolist(), candidates.tolist()))
+    heapq.heapify(heap)
+    # current area of every vertex, None for removed vertices
+    current: List[Optional[float]] = areas.tolist()
+    x, y = xy[:, 0].tolist(), xy[:, 1].tolist()
+    previous, following = previous.tolist(), following.tolist()
+    part = part.tolist()
+    interior = interior.tolist()
+    pop, push = heapq.heappop, heapq.heappush
+    while heap:
+        area, i = pop(heap)
+        if area != current[i]:
+            continue
+        p = part[i]
+        if counts[p] <= minimum[p]:
+            continue
+        current[i] = None
+        counts[p] -= 1
+        before, after = previous[i], following[i]
+        following[before] = after
+        previous[after] = before
+        for j in (before, after):
+            if not interior[j]:
+                continue
+            a, c = previous[j], following[j]
+            cross = (x[j] - x[a]) * (y[c] - y[a]) - (y[j] - y[a]) * (x[c] - x[a])
+            # the area of a vertex never decreases below the area removed
+            new_area = max(area, abs(cross) / 2)
+            current[j] = new_area
+            if new_area < sq_tolerance:
+                push(heap, (new_area, j))
+    return np.array([area is not None for area in current], dtype=bool)
+
+
+def _triangle_areas(a, b, c) -> np.ndarray:
+    ab = b - a
+    ac = c - a
+    return np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]) / 2
+
+
+def _ring_triangle(ring) -> np.ndarray:
+    # first vertex, the vertex farthest from it, the vertex farthest from the
+    # segment joining them and the closing vertex
+    x, y = ring[:, 0], ring[:, 1]
+    far = int(np.argmax((x - x[0]) ** 2 + (y - y[0]) ** 2))
+    distances = _sq_segment_distances(x, y, x[0], y[0], x[far], y[far])
+    third = int(np.argmax(distances))
+    return np.array([0, far, third, len(ring) - 1])